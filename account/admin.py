@@ -1,6 +1,7 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
-from account.models import User
+from account.models import AuthEvent, User
+from authAPI.paginators import EstimatedCountPaginator
 
 
 class UserModelAdmin(BaseUserAdmin):
@@ -26,10 +27,44 @@ class UserModelAdmin(BaseUserAdmin):
             },
         ),
     ]
-    search_fields = ["email"]
+    # Exact match served by the UPPER(email) index instead of a full-table icontains scan
+    search_fields = ["=email"]
     ordering = ["email","id"]
     filter_horizontal = []
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    actions = ["activate_users", "deactivate_users"]
+
+    @admin.action(description="Activate selected users")
+    def activate_users(self, request, queryset):
+        updated = queryset.update(is_active=True)
+        self.message_user(request, f"Activated {updated} users.")
+
+    @admin.action(description="Deactivate selected users")
+    def deactivate_users(self, request, queryset):
+        updated = queryset.update(is_active=False)
+        self.message_user(request, f"Deactivated {updated} users.")
 
 
 # Now register the new UserAdmin...
 admin.site.register(User, UserModelAdmin)
+
+
+class AuthEventAdmin(admin.ModelAdmin):
+    list_display = ["created_at", "kind", "email", "user_id", "ip_address"]
+    list_filter = ["kind"]
+    # Exact matches served by the (email, created_at) index
+    search_fields = ["=email"]
+    ordering = ["-created_at"]
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    # The audit trail is append-only
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+admin.site.register(AuthEvent, AuthEventAdmin)
@@ -0,0 +1,180 @@
+"""
+Per-process buffer for the authentication audit trail (`AuthEvent`).
+
+Auth views only append an unsaved event to an in-memory buffer, so a login or logout does
+not pay for an extra INSERT. The buffer is written with one `bulk_create`:
+- by a background thread, every `AUTH_AUDIT_FLUSH_SECONDS` or as soon as
+  `AUTH_AUDIT_BATCH_SIZE` events are pending;
+- when the process exits.
+
+When `AUTH_AUDIT_MAX_PENDING` events are pending (the database is slow or down), the
+recording request writes the buffer itself. This backpressure slows auth calls to the pace
+of the database instead of letting the buffer grow without bound. Events that still cannot
+be written are kept up to that limit, and the oldest beyond it are dropped and counted. A
+batch the database rejects for other reasons is written row by row, so only the offending
+events are dropped.
+
+With `AUTH_AUDIT_BACKGROUND_FLUSH = False` no thread is started, and events are only
+written at the batch size, on `flush()` or at exit.
+"""
+import atexit
+import ipaddress
+import logging
+import threading
+
+from django.conf import settings
+from django.db import DatabaseError, InterfaceError, OperationalError, close_old_connections, transaction
+
+from authAPI.metrics import AUDIT_EVENTS_DROPPED, AUDIT_EVENTS_WRITTEN
+
+from .models import AuthEvent
+
+logger = logging.getLogger(__name__)
+
+
+def parse_ip(value):
+    try:
+        return ipaddress.ip_address((value or '').strip())
+    except ValueError:
+        return None
+
+
+def client_ip(request):
+    """
+    Returns the client's IP address, or None when it is not a valid address.
+
+    `X-Forwarded-For` is only honoured for requests from `TRUSTED_PROXIES`: the client is
+    its last entry that is not a trusted proxy, since clients can prepend anything.
+    """
+    proxies = [ipaddress.ip_network(proxy, strict=False) for proxy in settings.TRUSTED_PROXIES]
+    forwarded = [entry for entry in request.META.get('HTTP_X_FORWARDED_FOR', '').split(',') if entry.strip()]
+    address = parse_ip(request.META.get('REMOTE_ADDR'))
+    while address is not None and forwarded and any(address in proxy for proxy in proxies):
+        address = parse_ip(forwarded.pop())
+    return str(address) if address is not None else None
+
+
+class AuditLog:
+    """
+    Buffers `AuthEvent` rows and writes them in batches.
+    """
+
+    def __init__(self):
+        self._pending = []
+        self._lock = threading.Lock()
+        # Held while writing, so batches are written one at a time and in order
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._flusher = None
+        atexit.register(self.flush)
+
+    def record(self, kind, request, user=None, email=''):
+        """
+        Buffers one event; returns without touching the database unless the buffer is full.
+
+        Args:
+        - kind: One of the `AuthEvent` kinds.
+        - request: The HTTP request, for the client address and user agent.
+        - user: The user the event is about, if known.
+        - email: The address given, for events without a known user.
+        """
+        event = AuthEvent(
+            user=user, email=email or getattr(user, 'email', ''), kind=kind, ip_address=client_ip(request),
+            user_agent=request.META.get('HTTP_USER_AGENT', '')[:255],
+        )
+        with self._lock:
+            self._pending.append(event)
+            pending = len(self._pending)
+        if pending >= settings.AUTH_AUDIT_MAX_PENDING:
+            self.flush()
+        elif settings.AUTH_AUDIT_BACKGROUND_FLUSH:
+            self.start()
+            if pending >= settings.AUTH_AUDIT_BATCH_SIZE:
+                self._wakeup.set()
+        elif pending >= settings.AUTH_AUDIT_BATCH_SIZE:
+            self.flush()
+
+    def pending(self):
+        with self._lock:
+            return list(self._pending)
+
+    def clear(self):
+        with self._lock:
+            self._pending.clear()
+
+    def flush(self):
+        """
+        Writes every pending event.
+
+        Returns:
+        - The number of events written.
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+            if not batch:
+                return 0
+            try:
+                AuthEvent.objects.bulk_create(batch, batch_size=settings.AUTH_AUDIT_BATCH_SIZE)
+            except (InterfaceError, OperationalError):
+                logger.exception('Writing %d audit events failed', len(batch))
+                self.requeue(batch)
+                return 0
+            except DatabaseError:
+                # The database rejected some row; requeuing it would block every later batch
+                logger.exception('Writing %d audit events failed, writing them one at a time', len(batch))
+                return self.write_each(batch)
+            AUDIT_EVENTS_WRITTEN.inc(len(batch))
+            return len(batch)
+
+    def write_each(self, batch):
+        """
+        Writes the events one by one, dropping those the database rejects.
+
+        Returns:
+        - The number of events written.
+        """
+        written = 0
+        for position, event in enumerate(batch):
+            try:
+                with transaction.atomic():
+                    event.save(force_insert=True)
+            except (InterfaceError, OperationalError):
+                logger.exception('Writing %d audit events failed', len(batch) - position)
+                self.requeue(batch[position:])
+                break
+            except DatabaseError:
+                logger.exception('Dropped invalid %s audit event', event.kind)
+                AUDIT_EVENTS_DROPPED.inc()
+            else:
+                written += 1
+        AUDIT_EVENTS_WRITTEN.inc(written)
+        return written
+
+    def requeue(self, batch):
+        with self._lock:
+            self._pending[:0] = batch
+            dropped = len(self._pending) - settings.AUTH_AUDIT_MAX_PENDING
+            if dropped > 0:
+                del self._pending[:dropped]
+        if dropped > 0:
+            AUDIT_EVENTS_DROPPED.inc(dropped)
+            logger.error('Dropped %d audit events', dropped)
+
+    def start(self):
+        # A forked worker inherits the thread object but not the running thread
+        if self._flusher is None or not self._flusher.is_alive():
+            with self._lock:
+                if self._flusher is None or not self._flusher.is_alive():
+                    self._flusher = threading.Thread(target=self.run, name='auth-audit-flusher', daemon=True)
+                    self._flusher.start()
+
+    def run(self):
+        while True:
+            self._wakeup.wait(settings.AUTH_AUDIT_FLUSH_SECONDS)
+            self._wakeup.clear()
+            self.flush()
+            close_old_connections()
+
+
+audit_log = AuditLog()
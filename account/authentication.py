@@ -0,0 +1,20 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt import authentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+
+from account.tokens import SESSION_CLAIM, revocations
+
+
+class JWTAuthentication(authentication.JWTAuthentication):
+    """
+    simplejwt's Bearer token authentication, also rejecting the tokens of revoked sessions.
+
+    The revocation check is answered by the in-memory `revocations` list, without a query.
+    """
+
+    def get_validated_token(self, raw_token):
+        token = super().get_validated_token(raw_token)
+        session_id = token.get(SESSION_CLAIM)
+        if session_id is not None and session_id in revocations:
+            raise InvalidToken(_('Session has been revoked'))
+        return token
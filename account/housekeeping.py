@@ -0,0 +1,72 @@
+import time
+from collections import namedtuple
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.utils import timezone
+
+PurgeResult = namedtuple('PurgeResult', ['label', 'deleted', 'seconds'])
+
+
+def delete_in_batches(queryset, batch_size=1000, pause=0):
+    """
+    Deletes the rows matched by `queryset` in primary-key batches.
+
+    Each batch is its own short DELETE, so locks are held briefly and the write-ahead
+    log grows in small steps instead of one large spike.
+
+    Args:
+    - queryset: The rows to delete.
+    - batch_size: Maximum number of rows removed per DELETE statement.
+    - pause: Seconds to sleep between batches, throttling the delete rate.
+
+    Returns:
+    - The number of rows deleted from the queryset's model.
+    """
+    model = queryset.model
+    deleted = 0
+    while True:
+        pks = list(queryset.order_by().values_list('pk', flat=True)[:batch_size])
+        if not pks:
+            return deleted
+        model._base_manager.filter(pk__in=pks).delete()
+        deleted += len(pks)
+        if len(pks) < batch_size:
+            return deleted
+        if pause:
+            time.sleep(pause)
+
+
+def expired_querysets(now=None):
+    """
+    Yields (label, queryset) pairs for every table holding expired auth state, including
+    audit events older than `AUTH_AUDIT_RETENTION_DAYS`.
+
+    Token tables are only included when `rest_framework_simplejwt.token_blacklist`
+    is installed; blacklist rows go with their outstanding token through the cascade.
+    """
+    now = now or timezone.now()
+    if apps.is_installed('django.contrib.sessions'):
+        from django.contrib.sessions.models import Session
+        yield 'sessions', Session.objects.filter(expire_date__lt=now)
+    from account.models import AuthEvent
+    yield 'auth events', AuthEvent.objects.filter(created_at__lt=now - timedelta(days=settings.AUTH_AUDIT_RETENTION_DAYS))
+    if apps.is_installed('rest_framework_simplejwt.token_blacklist'):
+        from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+        yield 'tokens', OutstandingToken.objects.filter(expires_at__lt=now)
+
+
+def purge_expired(batch_size=1000, pause=0, now=None):
+    """
+    Removes expired sessions and tokens in bounded batches.
+
+    Returns:
+    - A list of PurgeResult tuples, one per purged table.
+    """
+    results = []
+    for label, queryset in expired_querysets(now):
+        start = time.monotonic()
+        deleted = delete_in_batches(queryset, batch_size=batch_size, pause=pause)
+        results.append(PurgeResult(label, deleted, time.monotonic() - start))
+    return results
@@ -0,0 +1,139 @@
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from django.contrib.auth.hashers import identify_hasher, make_password
+from django.core.management.base import BaseCommand, CommandError
+
+from account.models import User
+
+TRUE_VALUES = {'1', 'true', 'yes', 'y', 't'}
+
+
+def _init_worker():
+    """
+    Makes sure Django is configured in pool processes started with `spawn`.
+    """
+    import django
+    django.setup()
+
+
+def read_records(path, fmt):
+    """
+    Streams user records from a CSV or JSON Lines file as dictionaries.
+    """
+    with open(path, newline='', encoding='utf-8') as handle:
+        if fmt == 'csv':
+            yield from csv.DictReader(handle)
+        else:
+            for line in handle:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def batched(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+class Command(BaseCommand):
+    help = (
+        'Bulk-imports users from a CSV or JSON Lines file with columns email, name, tc and either '
+        'password (hashed in a process pool) or password_hash (stored as is).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV or JSON Lines file to import.')
+        parser.add_argument('--format', choices=['csv', 'jsonl'],
+                            help='Input format; guessed from the file extension by default.')
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='Users de-duplicated, hashed and inserted per round.')
+        parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                            help='Hashing processes; 0 hashes in the current process.')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        fmt = options['format'] or ('csv' if path.endswith('.csv') else 'jsonl')
+        if not os.path.exists(path):
+            raise CommandError(f'File not found: {path}')
+
+        pool = None
+        if options['workers']:
+            pool = ProcessPoolExecutor(max_workers=options['workers'], initializer=_init_worker)
+
+        created = skipped = 0
+        seen = set()
+        start = time.monotonic()
+        try:
+            for batch in batched(read_records(path, fmt), options['batch_size']):
+                users, duplicates = self.build_users(batch, seen, pool)
+                # Users registered since the batch was checked conflict and are not inserted
+                emails = User.objects.filter(email__in=[user.email for user in users])
+                before = emails.count()
+                User.objects.bulk_create(users, ignore_conflicts=True)
+                inserted = emails.count() - before
+                created += inserted
+                skipped += duplicates + len(users) - inserted
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        elapsed = time.monotonic() - start
+        rate = created / elapsed if elapsed else 0
+        self.stdout.write(self.style.SUCCESS(
+            f'Imported {created} users ({skipped} skipped) in {elapsed:.2f}s ({rate:.0f} users/sec)'
+        ))
+
+    def build_users(self, batch, seen, pool):
+        """
+        Normalizes, de-duplicates and hashes one batch of records.
+
+        Args:
+        - batch: The raw records.
+        - seen: Emails already imported from this file, updated in place.
+        - pool: Executor used for password hashing, or None to hash inline.
+
+        Returns:
+        - A tuple of (unsaved User instances, number of skipped records).
+        """
+        records = []
+        for record in batch:
+            email = User.objects.normalize_email((record.get('email') or '').strip())
+            if not email or email in seen:
+                continue
+            seen.add(email)
+            records.append((email, record))
+
+        existing = set(
+            User.objects.filter(email__in=[email for email, _ in records]).values_list('email', flat=True)
+        )
+        records = [(email, record) for email, record in records if email not in existing]
+
+        to_hash = [record.get('password') or None for _, record in records if not record.get('password_hash')]
+        if pool is not None:
+            hashed = iter(pool.map(make_password, to_hash, chunksize=max(1, len(to_hash) // 64)))
+        else:
+            hashed = iter([make_password(password) for password in to_hash])
+
+        users = []
+        for email, record in records:
+            password = record.get('password_hash')
+            if password:
+                try:
+                    identify_hasher(password)
+                except ValueError:
+                    raise CommandError(f'Unrecognized password hash for {email}')
+            else:
+                password = next(hashed)
+            tc = record.get('tc')
+            users.append(User(
+                email=email,
+                name=record.get('name') or '',
+                tc=tc if isinstance(tc, bool) else str(tc).strip().lower() in TRUE_VALUES,
+                password=password,
+            ))
+        return users, len(batch) - len(users)
@@ -0,0 +1,29 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from account.housekeeping import purge_expired
+
+
+class Command(BaseCommand):
+    help = 'Deletes expired sessions, JWT tokens and audit events in bounded batches.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='Maximum rows removed per DELETE statement.')
+        parser.add_argument('--pause', type=float, default=0.0,
+                            help='Seconds to sleep between batches to throttle the delete rate.')
+        parser.add_argument('--loop', action='store_true',
+                            help='Keep running, purging every --interval seconds.')
+        parser.add_argument('--interval', type=float, default=3600.0,
+                            help='Seconds between purges when running with --loop.')
+
+    def handle(self, *args, **options):
+        while True:
+            for result in purge_expired(batch_size=options['batch_size'], pause=options['pause']):
+                self.stdout.write(
+                    f'Purged {result.deleted} expired {result.label} in {result.seconds:.2f}s'
+                )
+            if not options['loop']:
+                return
+            time.sleep(options['interval'])
@@ -0,0 +1,18 @@
+# Generated by Django 4.2 on 2026-10-19 18:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0003_authevent'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='authevent',
+            name='kind',
+            field=models.CharField(choices=[('login', 'Login'), ('login_failed', 'Failed login'), ('logout', 'Logout'), ('password_changed', 'Password changed'), ('password_reset_requested', 'Password reset requested'), ('password_reset', 'Password reset'), ('token_reused', 'Rotated refresh token reused')], max_length=32),
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 from django.contrib.auth.models import BaseUserManager,AbstractBaseUser
 
 #  Custom User Manager
@@ -74,3 +75,50 @@ class User(AbstractBaseUser):
 
 
 
+
+
+class AuthEvent(models.Model):
+  """
+  Audit trail of authentication events, written in batches by `account.audit`.
+
+  `user` carries no foreign key constraint and is kept when the user is deleted, so the
+  trail outlives the account; `email` holds the address given in failed logins and resets.
+  """
+  LOGIN = 'login'
+  LOGIN_FAILED = 'login_failed'
+  LOGOUT = 'logout'
+  PASSWORD_CHANGED = 'password_changed'
+  PASSWORD_RESET_REQUESTED = 'password_reset_requested'
+  PASSWORD_RESET = 'password_reset'
+  TOKEN_REUSED = 'token_reused'
+  KIND_CHOICES = [
+      (LOGIN, 'Login'),
+      (LOGIN_FAILED, 'Failed login'),
+      (LOGOUT, 'Logout'),
+      (PASSWORD_CHANGED, 'Password changed'),
+      (PASSWORD_RESET_REQUESTED, 'Password reset requested'),
+      (PASSWORD_RESET, 'Password reset'),
+      (TOKEN_REUSED, 'Rotated refresh token reused'),
+  ]
+
+  # Not indexed on its own: lookups by user go through the (user, created_at) index
+  user = models.ForeignKey(
+      User, null=True, blank=True, on_delete=models.DO_NOTHING, db_constraint=False, db_index=False,
+      related_name='auth_events',
+  )
+  email = models.CharField(max_length=255, blank=True)
+  kind = models.CharField(max_length=32, choices=KIND_CHOICES)
+  ip_address = models.GenericIPAddressField(null=True, blank=True)
+  user_agent = models.CharField(max_length=255, blank=True)
+  # Set when the event happens, not when its batch is written
+  created_at = models.DateTimeField(default=timezone.now)
+
+  class Meta:
+      indexes = [
+          models.Index(fields=['user', '-created_at'], name='authevent_user_created_idx'),
+          models.Index(fields=['email', '-created_at'], name='authevent_email_created_idx'),
+          models.Index(fields=['created_at'], name='authevent_created_idx'),
+      ]
+
+  def __str__(self):
+      return f'{self.kind} {self.email or self.user_id}'
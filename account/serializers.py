@@ -4,6 +4,7 @@ from django.utils.encoding import smart_str, force_bytes, DjangoUnicodeDecodeErr
 from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
 from django.contrib.auth.tokens import PasswordResetTokenGenerator
 from account.utils import Util
+from authAPI.metrics import PASSWORD_RESET_EMAILS
 
 class UserRegistrationSerializer(serializers.ModelSerializer):
   # We are writing this becoz we need confirm password field in our Registratin Request
@@ -76,6 +77,7 @@ class SendPasswordResetEmailSerializer(serializers.Serializer):
         'to_email':user.email
       }
       Util.send_email(data)
+      PASSWORD_RESET_EMAILS.inc()
       return attrs
     else:
       raise serializers.ValidationError('You are not a Registered User')
@@ -100,6 +102,7 @@ class UserPasswordResetSerializer(serializers.Serializer):
         raise serializers.ValidationError('Token is not Valid or Expired')
       user.set_password(password)
       user.save()
+      attrs['user'] = user
       return attrs
     except DjangoUnicodeDecodeError as identifier:
       PasswordResetTokenGenerator().check_token(user, token)
@@ -1,11 +1,30 @@
+import os
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.contrib.sessions.models import Session
+from django.core.management import call_command
+from django.db import DataError, OperationalError
+from django.test import RequestFactory, TestCase, override_settings
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase
-from account.models import User
+from account.audit import audit_log, client_ip
+from account.management.commands.import_users import Command as ImportUsersCommand
+from account.models import AuthEvent, User
+from account.tokens import revocations, revoke_session
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
 
 
+@override_settings(AUTH_AUDIT_BACKGROUND_FLUSH=False)
 class AccountTests(APITestCase):
     def setUp(self):
+        self.addCleanup(audit_log.clear)
         self.user_data = {
             'email': 'testuser@example.com',
             'password': 'testpass123',
@@ -35,4 +54,270 @@ class AccountTests(APITestCase):
         url = reverse('send-reset-password-email')
         data = {'email': 'testuser@example.com'}
         response = self.client.post(url, data)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
\ No newline at end of file
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+@override_settings(AUTH_AUDIT_BACKGROUND_FLUSH=False, AUTH_AUDIT_BATCH_SIZE=100, AUTH_AUDIT_MAX_PENDING=1000)
+class AuthAuditTests(APITestCase):
+    def setUp(self):
+        audit_log.clear()
+        self.addCleanup(audit_log.clear)
+        self.user = User.objects.create_user(email='testuser@example.com', password='testpass123', name='Test User', tc=True)
+
+    def test_events_are_buffered_then_written_in_one_batch(self):
+        self.client.post(reverse('login'), {'email': 'testuser@example.com', 'password': 'wrong'})
+        with self.settings(TRUSTED_PROXIES=['127.0.0.1', '10.0.0.1']):
+            self.client.post(reverse('login'), {'email': 'testuser@example.com', 'password': 'testpass123'},
+                             HTTP_USER_AGENT='tests', HTTP_X_FORWARDED_FOR='203.0.113.7, 10.0.0.1')
+        self.client.post(reverse('logout'))
+        self.assertFalse(AuthEvent.objects.exists())
+        self.assertEqual([event.kind for event in audit_log.pending()],
+                         [AuthEvent.LOGIN_FAILED, AuthEvent.LOGIN, AuthEvent.LOGOUT])
+
+        with self.assertNumQueries(1):
+            self.assertEqual(audit_log.flush(), 3)
+        login = AuthEvent.objects.get(kind=AuthEvent.LOGIN)
+        self.assertEqual((login.user, login.ip_address, login.user_agent), (self.user, '203.0.113.7', 'tests'))
+        self.assertEqual(AuthEvent.objects.get(kind=AuthEvent.LOGIN_FAILED).email, 'testuser@example.com')
+
+    def test_forwarded_address_is_only_trusted_from_proxies(self):
+        request = RequestFactory().get('/', REMOTE_ADDR='198.51.100.1', HTTP_X_FORWARDED_FOR='203.0.113.7')
+        self.assertEqual(client_ip(request), '198.51.100.1')
+        with self.settings(TRUSTED_PROXIES=['10.0.0.0/8']):
+            request = RequestFactory().get('/', REMOTE_ADDR='10.0.0.2', HTTP_X_FORWARDED_FOR='1.2.3.4, 203.0.113.7, 10.0.0.1')
+            self.assertEqual(client_ip(request), '203.0.113.7')
+            request = RequestFactory().get('/', REMOTE_ADDR='10.0.0.2', HTTP_X_FORWARDED_FOR='junk')
+            self.assertIsNone(client_ip(request))
+
+    def test_rejected_rows_are_dropped_without_blocking_the_batch(self):
+        self.client.post(reverse('login'), {'email': 'first@example.com', 'password': 'wrong'})
+        self.client.post(reverse('login'), {'email': 'bad@example.com', 'password': 'wrong'})
+        self.client.post(reverse('login'), {'email': 'last@example.com', 'password': 'wrong'})
+        save = AuthEvent.save
+
+        def reject_bad_row(event, *args, **kwargs):
+            if event.email == 'bad@example.com':
+                raise DataError('invalid input syntax for type inet')
+            return save(event, *args, **kwargs)
+
+        with mock.patch.object(AuthEvent.objects, 'bulk_create', side_effect=DataError), \
+                mock.patch.object(AuthEvent, 'save', reject_bad_row), self.assertLogs('account.audit', 'ERROR'):
+            self.assertEqual(audit_log.flush(), 2)
+        self.assertEqual(sorted(AuthEvent.objects.values_list('email', flat=True)), ['first@example.com', 'last@example.com'])
+        self.assertEqual(audit_log.pending(), [])
+
+    @override_settings(AUTH_AUDIT_BATCH_SIZE=2)
+    def test_batch_size_triggers_a_flush(self):
+        self.client.post(reverse('send-reset-password-email'), {'email': 'testuser@example.com'})
+        self.assertEqual(AuthEvent.objects.count(), 0)
+        self.client.post(reverse('send-reset-password-email'), {'email': 'testuser@example.com'})
+        self.assertEqual(AuthEvent.objects.filter(kind=AuthEvent.PASSWORD_RESET_REQUESTED).count(), 2)
+        self.assertEqual(audit_log.pending(), [])
+
+    @override_settings(AUTH_AUDIT_MAX_PENDING=3)
+    def test_full_buffer_is_written_by_the_request_and_bounded_when_that_fails(self):
+        with mock.patch.object(AuthEvent.objects, 'bulk_create', side_effect=OperationalError), \
+                self.assertLogs('account.audit', 'ERROR'):
+            for _ in range(5):
+                self.client.post(reverse('login'), {'email': 'nobody@example.com', 'password': 'wrong'})
+        self.assertEqual(len(audit_log.pending()), 3)
+
+        self.client.post(reverse('login'), {'email': 'nobody@example.com', 'password': 'wrong'})
+        self.assertEqual(AuthEvent.objects.filter(email='nobody@example.com').count(), 4)
+        self.assertEqual(audit_log.pending(), [])
+
+    @override_settings(AUTH_AUDIT_BACKGROUND_FLUSH=True, AUTH_AUDIT_BATCH_SIZE=2)
+    def test_background_flusher_is_woken_at_batch_size(self):
+        with mock.patch.object(audit_log, 'start') as start, mock.patch.object(audit_log, '_wakeup') as wakeup:
+            self.client.post(reverse('login'), {'email': 'nobody@example.com', 'password': 'wrong'})
+            wakeup.set.assert_not_called()
+            self.client.post(reverse('login'), {'email': 'nobody@example.com', 'password': 'wrong'})
+        self.assertEqual(start.call_count, 2)
+        wakeup.set.assert_called_once()
+        self.assertFalse(AuthEvent.objects.exists())
+
+    def test_query_recent_events(self):
+        admin = User.objects.create_superuser(email='admin@example.com', password='testpass123', name='Admin', tc=True)
+        self.client.login(email='testuser@example.com', password='testpass123')
+        for password in ['wrong', 'testpass123', 'testpass123']:
+            self.client.post(reverse('login'), {'email': 'testuser@example.com', 'password': password})
+        self.client.post(reverse('login'), {'email': 'admin@example.com', 'password': 'testpass123'})
+        audit_log.flush()
+
+        self.client.force_authenticate(self.user)
+        response = self.client.get(reverse('auth-events'), {'limit': 1})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([event['kind'] for event in response.data['events']], [AuthEvent.LOGIN])
+        response = self.client.get(reverse('auth-events'), {'before': response.data['before'].isoformat()})
+        self.assertEqual([event['kind'] for event in response.data['events']], [AuthEvent.LOGIN])
+        self.assertEqual(self.client.get(reverse('auth-events'), {'email': 'x'}).status_code, status.HTTP_403_FORBIDDEN)
+
+        self.client.force_authenticate(admin)
+        response = self.client.get(reverse('auth-events'), {'email': 'testuser@example.com', 'kind': AuthEvent.LOGIN_FAILED})
+        self.assertEqual(len(response.data['events']), 1)
+        self.assertEqual(self.client.get(reverse('auth-events'), {'user': 'x'}).status_code, status.HTTP_400_BAD_REQUEST)
+
+
+@override_settings(AUTH_AUDIT_BACKGROUND_FLUSH=False, TOKEN_REVOCATION_BACKGROUND_SYNC=False)
+class TokenSessionTests(APITestCase):
+    def setUp(self):
+        revocations.reset()
+        self.addCleanup(revocations.reset)
+        self.addCleanup(audit_log.clear)
+        self.user = User.objects.create_user(email='testuser@example.com', password='testpass123', name='Test User', tc=True)
+
+    def login(self):
+        response = self.client.post(reverse('token-login'), {'email': 'testuser@example.com', 'password': 'testpass123'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def get_with(self, access):
+        response = self.client.get(reverse('product-selected'), HTTP_AUTHORIZATION=f'Bearer {access}')
+        # Rejected tokens are 403 because session authentication comes first
+        return status.HTTP_200_OK if response.status_code == status.HTTP_200_OK else status.HTTP_401_UNAUTHORIZED
+
+    def test_login_returns_tokens_of_a_new_session(self):
+        tokens = self.login()
+        self.assertEqual(self.get_with(tokens['access']), status.HTTP_200_OK)
+        self.assertEqual(OutstandingToken.objects.get(user=self.user).token, tokens['refresh'])
+
+        response = self.client.post(reverse('token-login'), {'email': 'testuser@example.com', 'password': 'wrong'})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual([event.kind for event in audit_log.pending()], [AuthEvent.LOGIN, AuthEvent.LOGIN_FAILED])
+
+    def test_refresh_rotates_and_reuse_revokes_the_session(self):
+        tokens = self.login()
+        response = self.client.post(reverse('token-refresh'), {'refresh': tokens['refresh']})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        rotated = response.data
+        self.assertNotEqual(rotated['refresh'], tokens['refresh'])
+        self.assertEqual(self.get_with(rotated['access']), status.HTTP_200_OK)
+
+        # The first refresh token was copied and is replayed
+        response = self.client.post(reverse('token-refresh'), {'refresh': tokens['refresh']})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(audit_log.pending()[-1].kind, AuthEvent.TOKEN_REUSED)
+        self.assertEqual(self.get_with(rotated['access']), status.HTTP_401_UNAUTHORIZED)
+        response = self.client.post(reverse('token-refresh'), {'refresh': rotated['refresh']})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_logout_revokes_access_tokens_without_queries(self):
+        tokens = self.login()
+        revocations.sync(full=True)  # Loaded by the first token check of the process
+        response = self.client.post(reverse('token-logout'), {'refresh': tokens['refresh']})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(audit_log.pending()[-1].kind, AuthEvent.LOGOUT)
+
+        with override_settings(TOKEN_REVOCATION_SYNC_SECONDS=60), self.assertNumQueries(0):
+            self.assertEqual(self.get_with(tokens['access']), status.HTTP_401_UNAUTHORIZED)
+        response = self.client.post(reverse('token-refresh'), {'refresh': tokens['refresh']})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(self.client.post(reverse('token-logout'), {}).status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_sessions_revoked_by_other_processes_are_synced(self):
+        now = timezone.now()
+        expired = OutstandingToken.objects.create(jti='expired-session', token='', expires_at=now - timedelta(minutes=1))
+        BlacklistedToken.objects.create(token=expired)
+        revoke_session('loaded-session')
+        revocations.reset()
+
+        with override_settings(TOKEN_REVOCATION_SYNC_SECONDS=60):
+            self.assertIn('loaded-session', revocations)
+            self.assertNotIn('expired-session', revocations)
+            # Written by another process after this one loaded the list
+            marker = OutstandingToken.objects.create(jti='new-session', token='', expires_at=now + timedelta(days=1))
+            BlacklistedToken.objects.create(token=marker)
+            self.assertNotIn('new-session', revocations)
+        with override_settings(TOKEN_REVOCATION_SYNC_SECONDS=0):
+            self.assertIn('new-session', revocations)
+            self.assertNotIn('expired-session', revocations)
+
+
+class HousekeepingTests(TestCase):
+    def test_purge_expired_sessions_in_batches(self):
+        now = timezone.now()
+        for i in range(5):
+            Session.objects.create(session_key=f'expired{i}', session_data='', expire_date=now - timedelta(days=1))
+        Session.objects.create(session_key='fresh', session_data='', expire_date=now + timedelta(days=1))
+
+        out = StringIO()
+        call_command('purge_expired', batch_size=2, stdout=out)
+
+        self.assertEqual(list(Session.objects.values_list('session_key', flat=True)), ['fresh'])
+        self.assertIn('Purged 5 expired sessions', out.getvalue())
+
+
+class ImportUsersTests(TestCase):
+    def write_file(self, suffix, content):
+        handle, path = tempfile.mkstemp(suffix=suffix)
+        with os.fdopen(handle, 'w') as f:
+            f.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_import_csv_skips_existing_and_duplicate_emails(self):
+        User.objects.create_user(email='existing@example.com', password='testpass123', name='Existing', tc=True)
+        path = self.write_file('.csv', (
+            'email,name,tc,password\n'
+            'new@EXAMPLE.com,New User,true,secret123\n'
+            'existing@example.com,Existing,true,secret123\n'
+            'new@example.com,Duplicate,true,secret123\n'
+        ))
+        out = StringIO()
+        call_command('import_users', path, workers=0, stdout=out)
+
+        user = User.objects.get(email='new@example.com')
+        self.assertTrue(user.check_password('secret123'))
+        self.assertTrue(user.tc)
+        self.assertEqual(User.objects.count(), 2)
+        self.assertIn('Imported 1 users (2 skipped)', out.getvalue())
+
+    def test_users_registered_during_the_import_are_skipped(self):
+        path = self.write_file('.csv', (
+            'email,name,tc,password\n'
+            'new@example.com,New User,true,secret123\n'
+            'racing@example.com,Racing,true,secret123\n'
+        ))
+        build_users = ImportUsersCommand.build_users
+
+        def register_meanwhile(command, *args):
+            users = build_users(command, *args)
+            User.objects.create_user(email='racing@example.com', password='testpass123', name='Racing', tc=True)
+            return users
+
+        out = StringIO()
+        with mock.patch.object(ImportUsersCommand, 'build_users', register_meanwhile):
+            call_command('import_users', path, workers=0, stdout=out)
+        self.assertIn('Imported 1 users (1 skipped)', out.getvalue())
+        self.assertTrue(User.objects.get(email='racing@example.com').check_password('testpass123'))
+
+    def test_import_jsonl_with_prehashed_passwords(self):
+        path = self.write_file('.jsonl', (
+            '{"email": "hashed@example.com", "name": "Hashed", "tc": true, "password_hash": "%s"}\n'
+            % make_password('secret123')
+        ))
+        call_command('import_users', path, workers=0, stdout=StringIO())
+        self.assertTrue(User.objects.get(email='hashed@example.com').check_password('secret123'))
+
+
+# Admin pages link static files, which are not collected for tests
+@override_settings(STORAGES={**settings.STORAGES, 'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'}})
+class UserAdminTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_superuser(email='admin@example.com', password='testpass123', name='Admin', tc=True)
+        self.user = User.objects.create_user(email='testuser@example.com', password='testpass123', name='Test User', tc=True)
+        self.client.login(email='admin@example.com', password='testpass123')
+
+    def test_search_by_exact_email(self):
+        response = self.client.get(reverse('admin:account_user_changelist'), {'q': 'TestUser@example.com'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertContains(response, 'testuser@example.com')
+        self.assertNotContains(response, 'admin@example.com</a>')
+
+    def test_deactivate_users_action(self):
+        self.client.post(reverse('admin:account_user_changelist'), {
+            'action': 'deactivate_users',
+            '_selected_action': [self.user.pk],
+        })
+        self.user.refresh_from_db()
+        self.assertFalse(self.user.is_active)
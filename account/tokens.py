@@ -0,0 +1,239 @@
+"""
+Token sessions for API clients: refresh rotation and revocation checked in memory.
+
+A token login starts a session. Its refresh token, every rotated successor and every
+access token derived from them carry the same `sid` claim. A refresh blacklists the
+presented refresh token and returns a new pair. If a rotated token is presented again,
+it was copied; the whole session is revoked, like on logout.
+
+A session is revoked by blacklisting a marker in simplejwt's blacklist tables: an
+`OutstandingToken` whose `jti` is the session id and whose `token` is empty. Each process
+keeps the revoked session ids as 64-bit fingerprints in a sorted `array`, so the access
+token check in `account.authentication` never queries the database. The fingerprints are:
+- pulled by a background thread every `TOKEN_REVOCATION_SYNC_SECONDS`, from the blacklist
+  rows added since the last sync (a primary key range);
+- reloaded every `TOKEN_REVOCATION_REBUILD_SECONDS`, leaving out expired markers;
+- added at once for revocations made by the process itself.
+Other processes therefore reject a revoked session within `TOKEN_REVOCATION_SYNC_SECONDS`.
+Two session ids share a fingerprint with a probability of about 2**-64 per pair, which
+could only reject a valid session, never accept a revoked one.
+
+With `TOKEN_REVOCATION_BACKGROUND_SYNC = False` no thread is started, and the request that
+finds the list due pulls the changes itself.
+"""
+import hashlib
+import logging
+import threading
+import time
+import uuid
+from array import array
+from bisect import bisect_left
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+from authAPI.signing import RefreshToken
+
+SESSION_CLAIM = 'sid'
+# Blacklist rows are re-read this many ids behind the last one seen, covering rows whose
+# transactions committed out of id order
+ID_OVERLAP = 1000
+
+logger = logging.getLogger(__name__)
+
+
+class TokenReused(TokenError):
+    """
+    An already rotated refresh token was presented again; its session has been revoked.
+    """
+
+    def __init__(self, user_id):
+        super().__init__(_('Token has already been used'))
+        self.user_id = user_id
+
+
+def fingerprint(session_id):
+    return int.from_bytes(hashlib.blake2b(session_id.encode(), digest_size=8).digest(), 'big')
+
+
+class SessionRefreshToken(RefreshToken):
+    """
+    Refresh token carrying the id of the session it belongs to.
+    """
+
+    def __init__(self, token=None, verify=True):
+        super().__init__(token, verify)
+        if token is None:
+            self[SESSION_CLAIM] = uuid.uuid4().hex
+
+    def check_blacklist(self):
+        # `rotate` and `end_session` blacklist the token instead, which tells in the same
+        # statement whether it had been used before
+        pass
+
+
+class RevocationList:
+    """
+    In-memory set of revoked session ids, synced from the blacklist tables.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Held while syncing, so only one thread queries the blacklist at a time
+        self._sync_lock = threading.Lock()
+        self._syncer = None
+        self.reset()
+
+    def reset(self):
+        # Sorted fingerprints from the last reload, and those added since
+        self._loaded = array('Q')
+        self._recent = set()
+        # Id of the last blacklist row seen; None until the first reload
+        self._watermark = None
+        self._synced_at = self._built_at = 0
+
+    def __contains__(self, session_id):
+        self.current()
+        key = fingerprint(session_id)
+        # `sync` replaces `_loaded` before `_recent`, so reading them in this order never misses a key
+        if key in self._recent:
+            return True
+        loaded = self._loaded
+        pos = bisect_left(loaded, key)
+        return pos < len(loaded) and loaded[pos] == key
+
+    def add(self, session_id):
+        with self._lock:
+            self._recent.add(fingerprint(session_id))
+
+    def current(self):
+        if settings.TOKEN_REVOCATION_BACKGROUND_SYNC:
+            self.start()
+            if self._watermark is None:
+                self.sync()
+        elif self._watermark is None or time.monotonic() - self._synced_at >= settings.TOKEN_REVOCATION_SYNC_SECONDS:
+            self.sync()
+
+    def sync(self, full=False):
+        """
+        Pulls the sessions revoked since the last sync, or reloads them all when it is due.
+        """
+        with self._sync_lock:
+            now = time.monotonic()
+            if not full and self._watermark is not None and now - self._synced_at < settings.TOKEN_REVOCATION_SYNC_SECONDS:
+                return
+            last = BlacklistedToken.objects.order_by('-id').values_list('id', flat=True).first() or 0
+            markers = BlacklistedToken.objects.filter(token__token='', token__expires_at__gt=timezone.now(), id__lte=last)
+            if full or self._watermark is None or now - self._built_at >= settings.TOKEN_REVOCATION_REBUILD_SECONDS:
+                keys = {fingerprint(jti) for jti in markers.values_list('token__jti', flat=True).iterator()}
+                loaded = array('Q', sorted(keys))
+                with self._lock:
+                    self._loaded = loaded
+                    self._recent = self._recent - keys
+                self._built_at = now
+            else:
+                since = self._watermark - ID_OVERLAP
+                keys = [fingerprint(jti) for jti in markers.filter(id__gt=since).values_list('token__jti', flat=True)]
+                with self._lock:
+                    self._recent.update(keys)
+            self._watermark = last
+            self._synced_at = now
+
+    def start(self):
+        # A forked worker inherits the thread object but not the running thread
+        if self._syncer is None or not self._syncer.is_alive():
+            with self._lock:
+                if self._syncer is None or not self._syncer.is_alive():
+                    self._syncer = threading.Thread(target=self.run, name='token-revocation-sync', daemon=True)
+                    self._syncer.start()
+
+    def run(self):
+        while True:
+            time.sleep(settings.TOKEN_REVOCATION_SYNC_SECONDS)
+            try:
+                self.sync()
+            except Exception:
+                # Keeps the last known list; the next sync retries
+                logger.exception('Syncing revoked token sessions failed')
+            finally:
+                close_old_connections()
+
+
+revocations = RevocationList()
+
+
+def issue_tokens(user):
+    """
+    Starts a session for `user`.
+
+    Returns:
+    - The session's first `SessionRefreshToken`; its `access_token` is the first access token.
+    """
+    return SessionRefreshToken.for_user(user)
+
+
+def revoke_session(session_id, user_id=None):
+    """
+    Revokes every token of a session, in this process at once and in the others on their next sync.
+    """
+    now = timezone.now()
+    # No token of the session can outlive a refresh token issued now
+    marker = OutstandingToken.objects.get_or_create(jti=session_id, defaults={
+        'user_id': user_id, 'token': '', 'created_at': now, 'expires_at': now + api_settings.REFRESH_TOKEN_LIFETIME,
+    })[0]
+    BlacklistedToken.objects.get_or_create(token=marker)
+    revocations.add(session_id)
+
+
+def session_revoked(session_id):
+    # Checked against the database, which the refresh and logout endpoints write anyway
+    return BlacklistedToken.objects.filter(token__jti=session_id).exists()
+
+
+def rotate(raw_token):
+    """
+    Exchanges a refresh token for a new one and returns it; its `access_token` is the new access token.
+
+    Raises:
+    - TokenReused: The token had been rotated before; its session is now revoked.
+    - TokenError: The token is invalid or expired, or its session was revoked.
+    """
+    refresh = SessionRefreshToken(raw_token)
+    session_id = refresh.get(SESSION_CLAIM)
+    if session_id is not None and session_revoked(session_id):
+        raise TokenError(_('Session has been revoked'))
+    if not refresh.blacklist()[1]:
+        user_id = refresh[api_settings.USER_ID_CLAIM]
+        if session_id is not None:
+            revoke_session(session_id, user_id)
+        raise TokenReused(user_id)
+    if session_id is None:
+        # Tokens issued before sessions existed join one on their first refresh
+        refresh[SESSION_CLAIM] = uuid.uuid4().hex
+    refresh.set_jti()
+    refresh.set_exp()
+    refresh.set_iat()
+    return refresh
+
+
+def end_session(raw_token):
+    """
+    Logs out the session of a refresh token, revoking its refresh and access tokens.
+
+    Returns:
+    - The refresh token, for the user id it names.
+
+    Raises:
+    - TokenError: The token is invalid or expired.
+    """
+    refresh = SessionRefreshToken(raw_token)
+    refresh.blacklist()
+    session_id = refresh.get(SESSION_CLAIM)
+    if session_id is not None:
+        revoke_session(session_id, refresh[api_settings.USER_ID_CLAIM])
+    return refresh
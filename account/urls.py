@@ -1,6 +1,7 @@
 from django.urls import path,include
 from account.views import UserRegistrationView, UserLoginView, UserProfileView, UserChangePasswordView, \
-    SendPasswordResetEmailView, UserPasswordResetView, LogoutView, HomePageView
+    SendPasswordResetEmailView, UserPasswordResetView, LogoutView, HomePageView, AuthEventListView, \
+    TokenLoginView, TokenRefreshView, TokenLogoutView
 from products.views import DashboardView
 
 urlpatterns = [
@@ -8,11 +9,15 @@ urlpatterns = [
     path('register/',UserRegistrationView.as_view(),name="register"),
     path('login/',UserLoginView.as_view(),name="login"),
     path('logout/', LogoutView.as_view(), name='logout'),
+    path('token/', TokenLoginView.as_view(), name='token-login'),
+    path('token/refresh/', TokenRefreshView.as_view(), name='token-refresh'),
+    path('token/logout/', TokenLogoutView.as_view(), name='token-logout'),
 
     path('profile/', UserProfileView.as_view(), name='profile'),
     path('changepassword/', UserChangePasswordView.as_view(), name='changepassword'),
     path('send-reset-password-email/', SendPasswordResetEmailView.as_view(), name='send-reset-password-email'),
     path('reset-password/<uid>/<token>/', UserPasswordResetView.as_view(), name='reset-password'),
     path('dashboard/', DashboardView.as_view(), name='dashboard'),
+    path('audit/', AuthEventListView.as_view(), name='auth-events'),
 
 ]
@@ -1,12 +1,19 @@
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.shortcuts import render, redirect
+from django.utils.dateparse import parse_datetime
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.views import APIView
 from account.serializers import UserRegistrationSerializer,UserLoginSerializer,UserProfileSerializer,UserChangePasswordSerializer,SendPasswordResetEmailSerializer,UserPasswordResetSerializer
 from account.renderers import UserRenderer
 from django.contrib.auth import authenticate, logout, login
-from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
+from authAPI.metrics import LOGIN_DURATION, LOGIN_FAILED, LOGIN_SUCCEEDED
+from account.audit import audit_log
+from account.models import AuthEvent, User
+from account.tokens import TokenReused, end_session, issue_tokens, rotate
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
 
 class HomePageView(APIView):
     """
@@ -29,7 +36,7 @@ class HomePageView(APIView):
 
 def get_tokens_for_user(user):
     """
-    Generates JWT tokens for the authenticated user.
+    Generates JWT tokens for the authenticated user, starting a new token session.
 
     Args:
     - user: The authenticated user instance.
@@ -37,7 +44,7 @@ def get_tokens_for_user(user):
     Returns:
     - A dictionary with 'refresh' and 'access' tokens.
     """
-    refresh = RefreshToken.for_user(user)
+    refresh = issue_tokens(user)
     return {
         'refresh': str(refresh),
         'access': str(refresh.access_token),
@@ -78,18 +85,114 @@ class UserLoginView(APIView):
         if serializer.is_valid():
             email = serializer.data.get('email')
             password = serializer.data.get('password')
-            user = authenticate(email=email, password=password)
+            with LOGIN_DURATION.time():
+                user = authenticate(email=email, password=password)
 
             if user is not None:
+                LOGIN_SUCCEEDED.inc()
                 login(request, user)  # Log the user in
+                audit_log.record(AuthEvent.LOGIN, request, user=user)
                 return redirect('dashboard')
             else:
+                LOGIN_FAILED.inc()
+                audit_log.record(AuthEvent.LOGIN_FAILED, request, email=email)
                 return render(request, 'login.html', {'form_errors': {'non_field_errors': ['Email or Password is not valid']}})
         else:
             return render(request, 'login.html', {'form_errors': serializer.errors})
 
 
 
+class TokenLoginView(APIView):
+    """
+    Logs API clients in with email and password, returning JWT tokens instead of a session.
+    """
+    permission_classes = []
+    authentication_classes = []
+
+    def post(self, request, format=None):
+        """
+        Handles token login for POST requests.
+
+        Args:
+        - request: The HTTP request object with `email` and `password`.
+
+        Returns:
+        - JSON response with 'refresh' and 'access' tokens, 400 for missing fields or 401 for
+          invalid credentials.
+        """
+        serializer = UserLoginSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        email = serializer.data.get('email')
+        with LOGIN_DURATION.time():
+            user = authenticate(email=email, password=serializer.data.get('password'))
+        if user is None:
+            LOGIN_FAILED.inc()
+            audit_log.record(AuthEvent.LOGIN_FAILED, request, email=email)
+            return Response({'error': 'Email or Password is not valid'}, status=status.HTTP_401_UNAUTHORIZED)
+        LOGIN_SUCCEEDED.inc()
+        audit_log.record(AuthEvent.LOGIN, request, user=user)
+        return Response(get_tokens_for_user(user), status=status.HTTP_200_OK)
+
+
+class TokenRefreshView(APIView):
+    """
+    Rotates a refresh token: the presented one is blacklisted and a new pair is returned.
+    """
+    permission_classes = []
+    authentication_classes = []
+
+    def post(self, request, format=None):
+        """
+        Exchanges a refresh token for new tokens.
+
+        Args:
+        - request: The HTTP request object with `refresh`.
+
+        Returns:
+        - JSON response with new 'refresh' and 'access' tokens, 400 without a token, or 401 for
+          an invalid, expired or revoked token. Reusing a rotated token revokes its session.
+        """
+        if not request.data.get('refresh'):
+            return Response({'error': 'refresh is required.'}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            refresh = rotate(request.data['refresh'])
+        except TokenReused as ex:
+            audit_log.record(AuthEvent.TOKEN_REUSED, request, user=User.objects.filter(id=ex.user_id).first())
+            return Response({'error': str(ex)}, status=status.HTTP_401_UNAUTHORIZED)
+        except TokenError as ex:
+            return Response({'error': str(ex)}, status=status.HTTP_401_UNAUTHORIZED)
+        return Response({'refresh': str(refresh), 'access': str(refresh.access_token)}, status=status.HTTP_200_OK)
+
+
+class TokenLogoutView(APIView):
+    """
+    Ends a token session, revoking its refresh and access tokens.
+    """
+    permission_classes = []
+    authentication_classes = []
+
+    def post(self, request, format=None):
+        """
+        Handles token logout for POST requests.
+
+        Args:
+        - request: The HTTP request object with the session's `refresh` token.
+
+        Returns:
+        - JSON response confirming the logout, 400 without a token or 401 for an invalid token.
+        """
+        if not request.data.get('refresh'):
+            return Response({'error': 'refresh is required.'}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            refresh = end_session(request.data['refresh'])
+        except TokenError as ex:
+            return Response({'error': str(ex)}, status=status.HTTP_401_UNAUTHORIZED)
+        user = User.objects.filter(id=refresh[api_settings.USER_ID_CLAIM]).first()
+        audit_log.record(AuthEvent.LOGOUT, request, user=user)
+        return Response({'msg': 'Logged out successfully'}, status=status.HTTP_200_OK)
+
+
 class UserRegistrationView(APIView):
     """
     Manages the user registration process.
@@ -180,6 +283,7 @@ class UserChangePasswordView(APIView):
         serializer = UserChangePasswordSerializer(data=request.data, context={'user': request.user})
         if serializer.is_valid():
             serializer.save()
+            audit_log.record(AuthEvent.PASSWORD_CHANGED, request, user=request.user)
             return Response({'msg': 'Password changed successfully'}, status=status.HTTP_200_OK)
         else:
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -216,6 +320,7 @@ class SendPasswordResetEmailView(APIView):
         """
         serializer = SendPasswordResetEmailSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
+        audit_log.record(AuthEvent.PASSWORD_RESET_REQUESTED, request, email=serializer.validated_data['email'])
         return Response({'msg': 'Password reset link sent. Please check your email.'}, status=status.HTTP_200_OK)
 
 
@@ -254,6 +359,7 @@ class UserPasswordResetView(APIView):
         """
         serializer = UserPasswordResetSerializer(data=request.data, context={'uid': uid, 'token': token})
         serializer.is_valid(raise_exception=True)
+        audit_log.record(AuthEvent.PASSWORD_RESET, request, user=serializer.validated_data['user'])
         return Response({'msg': 'Password reset successfully'}, status=status.HTTP_200_OK)
 
 
@@ -272,6 +378,58 @@ class LogoutView(APIView):
         Returns:
         - Redirects to the login page after logout.
         """
+        if request.user.is_authenticated:
+            audit_log.record(AuthEvent.LOGOUT, request, user=request.user)
         logout(request)
         request.session.flush()  # Clear session data
-        return redirect('login')
\ No newline at end of file
+        return redirect('login')
+
+
+class AuthEventListView(APIView):
+    """
+    Lists recent authentication audit events, newest first.
+
+    Users see their own events. Admins may pass `user` (an id) or `email` to see another
+    account's events, including failed logins for addresses without an account.
+    """
+    permission_classes = [IsAuthenticated]
+    MAX_LIMIT = 200
+
+    def get(self, request, format=None):
+        """
+        Returns the most recent audit events of one user.
+
+        Args:
+        - request: The HTTP request object, optionally with `user` or `email` (admins only),
+          `kind`, `before` (an ISO timestamp, for the next page) and `limit` (1-200, default 50).
+
+        Returns:
+        - JSON response with the events, 400 for invalid parameters or 403 when a non-admin
+          asks for another user's events.
+        """
+        if ('user' in request.GET or 'email' in request.GET) and not request.user.is_staff:
+            return Response({'error': "Only admins can view other users' events."}, status=status.HTTP_403_FORBIDDEN)
+        try:
+            if 'user' in request.GET:
+                events = AuthEvent.objects.filter(user_id=int(request.GET['user']))
+            elif 'email' in request.GET:
+                events = AuthEvent.objects.filter(email=request.GET['email'])
+            else:
+                events = AuthEvent.objects.filter(user=request.user)
+            if request.GET.get('kind'):
+                events = events.filter(kind=request.GET['kind'])
+            if request.GET.get('before'):
+                events = events.filter(created_at__lt=parse_datetime(request.GET['before']))
+            limit = min(max(int(request.GET.get('limit', 50)), 1), self.MAX_LIMIT)
+        except (TypeError, ValueError, DjangoValidationError):
+            return Response({'error': 'user and limit must be numbers and before an ISO timestamp.'},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        # Served by the (user, created_at) and (email, created_at) indexes
+        rows = list(events.order_by('-created_at').values(
+            'id', 'kind', 'user_id', 'email', 'ip_address', 'user_agent', 'created_at',
+        )[:limit])
+        return Response({
+            'events': rows,
+            'before': rows[-1]['created_at'] if len(rows) == limit else None,
+        }, status=status.HTTP_200_OK)
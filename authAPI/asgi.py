@@ -2,6 +2,11 @@
 ASGI config for authAPI project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Long-lived streams such as the product event stream (``/api/products/events/``)
+need this entry point, e.g. ``uvicorn authAPI.asgi:application``.
+
+The worker warms up (see ``authAPI/warmup.py``) before the server receives the
+application, so its first requests do not pay for imports, templates and caches.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/4.2/howto/deployment/asgi/
@@ -14,3 +19,10 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'authAPI.settings')
 
 application = get_asgi_application()
+
+from django.conf import settings  # noqa: E402
+
+if settings.WORKER_WARMUP:
+    from authAPI.warmup import warm_up_worker
+
+    warm_up_worker()
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from authAPI.schema import write_schema
+
+
+class Command(BaseCommand):
+    help = 'Generates the OpenAPI schema once and stores it as a static artifact.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output', help='Destination file; defaults to OPENAPI_SCHEMA_PATH.')
+
+    def handle(self, *args, **options):
+        path, digest = write_schema(options['output'])
+        self.stdout.write(self.style.SUCCESS(f'Wrote OpenAPI schema {digest} to {path}'))
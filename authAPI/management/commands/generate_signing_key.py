@@ -0,0 +1,35 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from authAPI.signing import SigningKey
+
+
+class Command(BaseCommand):
+    help = (
+        'Generates a private key for signing JWTs. To rotate, put the new file first in '
+        'JWT_PRIVATE_KEYS and keep the previous key after it until its tokens have expired.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('output', help='Path of the PEM file to create.')
+        parser.add_argument('--algorithm', choices=['RS256', 'EdDSA'], default='EdDSA')
+        parser.add_argument('--rsa-bits', type=int, default=2048)
+
+    def handle(self, *args, **options):
+        from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+        from cryptography.hazmat.primitives.serialization import Encoding, NoEncryption, PrivateFormat
+
+        if options['algorithm'] == 'RS256':
+            private_key = rsa.generate_private_key(public_exponent=65537, key_size=options['rsa_bits'])
+        else:
+            private_key = ed25519.Ed25519PrivateKey.generate()
+        pem = private_key.private_bytes(Encoding.PEM, PrivateFormat.PKCS8, NoEncryption())
+        try:
+            fd = os.open(options['output'], os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            raise CommandError(f"{options['output']} already exists")
+        with os.fdopen(fd, 'wb') as f:
+            f.write(pem)
+        key = SigningKey(private_key)
+        self.stdout.write(self.style.SUCCESS(f"Wrote {key.algorithm} key {key.kid} to {options['output']}"))
@@ -0,0 +1,67 @@
+import time
+from contextlib import contextmanager
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+
+from authAPI.startup import (
+    migration_lock, pending_migrations, static_files_current, static_sources_hash, wait_for_database,
+    write_static_stamp,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Prepares a container to serve requests: waits for the database, applies unapplied migrations '
+        'once across all replicas and collects static files only when their sources changed. '
+        'Each step and the total start-up time are reported.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--db-timeout', type=float, default=60,
+                            help='Seconds to wait for the database before giving up.')
+        parser.add_argument('--skip-migrate', action='store_true')
+        parser.add_argument('--skip-static', action='store_true')
+
+    @contextmanager
+    def step(self, name):
+        start = time.monotonic()
+        outcome = {}
+        yield outcome
+        self.stdout.write(f"[startup] {name}: {outcome.get('result', 'done')} ({time.monotonic() - start:.2f}s)")
+
+    def handle(self, *args, **options):
+        start = time.monotonic()
+
+        with self.step('database') as outcome:
+            attempts = wait_for_database(timeout=options['db_timeout'])
+            outcome['result'] = f'ready after {attempts} attempt{"s" if attempts > 1 else ""}'
+
+        if not options['skip_migrate']:
+            with self.step('migrate') as outcome:
+                outcome['result'] = self.migrate()
+
+        if not options['skip_static']:
+            with self.step('collectstatic') as outcome:
+                outcome['result'] = self.collect_static()
+
+        self.stdout.write(self.style.SUCCESS(f'[startup] ready in {time.monotonic() - start:.2f}s'))
+
+    def migrate(self):
+        if not pending_migrations():
+            return 'up to date, skipped'
+        with migration_lock():
+            # Another replica may have applied them while this one waited for the lock
+            pending = pending_migrations()
+            if not pending:
+                return 'applied by another replica'
+            call_command('migrate', interactive=False, verbosity=0)
+        return f'applied {len(pending)} migrations'
+
+    def collect_static(self):
+        sources_hash = static_sources_hash()
+        if static_files_current(sources_hash):
+            return 'up to date, skipped'
+        call_command('collectstatic', interactive=False, verbosity=0)
+        write_static_stamp(sources_hash)
+        return 'collected'
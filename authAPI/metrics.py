@@ -0,0 +1,79 @@
+"""
+Business metrics exported in the Prometheus text format at `/metrics`.
+
+With several worker processes (gunicorn, uvicorn --workers) set `PROMETHEUS_MULTIPROC_DIR`
+to an empty, writable directory before the workers start: every process then writes its
+samples to memory-mapped files there and the endpoint merges the files of all workers.
+Without it metrics are kept in process memory, which is only correct for a single process.
+
+Increments are lock-protected in-memory or mmap writes, with no I/O or syscalls. Labelled
+series that are hit on every request are bound once below, so the hot path never resolves
+label values.
+"""
+import hmac
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.views.decorators.http import require_GET
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Histogram, generate_latest
+from prometheus_client import multiprocess, values
+
+LOGINS = Counter('auth_logins_total', 'Login attempts through the login form.', ['outcome'])
+LOGIN_SUCCEEDED = LOGINS.labels('success')
+LOGIN_FAILED = LOGINS.labels('failure')
+LOGIN_DURATION = Histogram(
+    'auth_login_duration_seconds', 'Time spent verifying the credentials of a login attempt.',
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+PASSWORD_RESET_EMAILS = Counter('auth_password_reset_emails_total', 'Password reset emails sent.')
+AUDIT_EVENTS = Counter('auth_audit_events_total', 'Authentication audit events by write outcome.', ['outcome'])
+AUDIT_EVENTS_WRITTEN = AUDIT_EVENTS.labels('written')
+AUDIT_EVENTS_DROPPED = AUDIT_EVENTS.labels('dropped')
+
+PRODUCT_SELECTIONS = Counter('product_selections_total', 'Product selection attempts.', ['outcome'])
+PRODUCT_SELECTED = PRODUCT_SELECTIONS.labels('selected')
+PRODUCT_SELECTION_CONFLICTS = PRODUCT_SELECTIONS.labels('conflict')
+PRODUCT_REPORTS = Counter('product_reports_total', 'Product reports filed.')
+
+
+def is_multiprocess():
+    return values.ValueClass is not values.MutexValue
+
+
+def render_metrics():
+    """
+    Returns the current metrics of all worker processes as Prometheus text.
+    """
+    if is_multiprocess():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry)
+
+
+def is_authorized(request):
+    # Scrapers send `Authorization: Bearer <METRICS_TOKEN>`; staff can also view it in the browser
+    token = settings.METRICS_TOKEN
+    header = request.META.get('HTTP_AUTHORIZATION', '')
+    if token and hmac.compare_digest(header.encode(), f'Bearer {token}'.encode()):
+        return True
+    return request.user.is_authenticated and request.user.is_staff
+
+
+@require_GET
+def metrics_view(request):
+    """
+    Serves the metrics to Prometheus.
+
+    Args:
+    - request: The HTTP request object, with the metrics bearer token or a staff session.
+
+    Returns:
+    - The metrics in the Prometheus text format, or 403 if the caller is not authorized.
+    """
+    if not is_authorized(request):
+        return HttpResponse('Forbidden', status=403, content_type='text/plain')
+    response = HttpResponse(render_metrics(), content_type=CONTENT_TYPE_LATEST)
+    response['Cache-Control'] = 'no-store'
+    return response
@@ -0,0 +1,330 @@
+import gzip
+import hmac
+import json
+import mimetypes
+import os
+import random
+import re
+import secrets
+import zlib
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed, SuspiciousFileOperation
+from django.http import FileResponse, HttpResponse, HttpResponseNotModified
+from django.utils._os import safe_join
+from django.utils.cache import patch_vary_headers
+from django.utils.crypto import get_random_string
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.http import http_date
+
+from authAPI.profiling import profiler
+from authAPI.routers import pin_primary
+
+try:
+    import brotli
+except ImportError:  # Brotli is optional; gzip is always available
+    brotli = None
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+ACCEPT_ENCODING_RE = re.compile(r'\s*([\w*-]+)\s*(?:;\s*q\s*=\s*([\d.]+))?')
+
+
+def negotiate_encoding(accept_encoding, available):
+    """
+    Returns the first encoding of `available` (in order of preference) that the client
+    accepts according to its `Accept-Encoding` header, or None.
+    """
+    weights = {}
+    for item in accept_encoding.split(','):
+        match = ACCEPT_ENCODING_RE.match(item)
+        if match:
+            weights[match.group(1).lower()] = float(match.group(2) or 1)
+    wildcard = weights.get('*', 0)
+    for encoding in available:
+        if weights.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+
+class ReplicaPinningMiddleware:
+    """
+    Pins a client's reads to the primary database for a short window after it writes.
+
+    Any unsafe request is served entirely from the primary. When it succeeds, a
+    short-lived cookie keeps the client's following reads on the primary for
+    `REPLICA_PIN_SECONDS`, so it sees its own changes despite replication lag.
+    """
+    cookie_name = 'pin_primary'
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        is_write = request.method not in SAFE_METHODS
+        token = pin_primary.set(is_write or self.cookie_name in request.COOKIES)
+        try:
+            response = self.get_response(request)
+        finally:
+            pin_primary.reset(token)
+
+        if is_write and response.status_code < 400 and settings.DATABASE_REPLICAS:
+            response.set_cookie(
+                self.cookie_name, '1', max_age=settings.REPLICA_PIN_SECONDS, httponly=True, samesite='Lax'
+            )
+        return response
+
+
+class StreamCompressor:
+    """
+    Incremental gzip or brotli compressor sharing one interface for both encodings.
+
+    With `max_random_bytes`, the gzip header carries a random file name of 1 to that many
+    bytes, as Django's `GZipMiddleware` does, so the compressed length does not reveal
+    secrets in the body (BREACH). Brotli has no such field.
+    """
+
+    def __init__(self, encoding, level, max_random_bytes=0):
+        self.encoding = encoding
+        if encoding == 'br':
+            self._compressor = brotli.Compressor(quality=level)
+        else:
+            self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        self._padding = get_random_string(secrets.randbelow(max_random_bytes) + 1) if max_random_bytes else None
+
+    def compress(self, data, flush=False):
+        """
+        Compresses `data`; with `flush` the output is decodable up to this point.
+        """
+        if self.encoding == 'br':
+            output = self._compressor.process(data)
+            return output + self._compressor.flush() if flush else output
+        output = self._compressor.compress(data)
+        return self.pad(output + self._compressor.flush(zlib.Z_SYNC_FLUSH) if flush else output)
+
+    def pad(self, output):
+        # zlib writes the 10-byte gzip header with its first output
+        if self._padding is None or not output:
+            return output
+        header = bytearray(output[:10])
+        header[3] = gzip.FNAME
+        output, self._padding = bytes(header) + self._padding.encode() + b'\x00' + output[10:], None
+        return output
+
+    def finish(self):
+        if self.encoding == 'br':
+            return self._compressor.finish()
+        return self.pad(self._compressor.flush())
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Compresses responses with brotli or gzip, negotiated from `Accept-Encoding`.
+
+    Bodies smaller than `COMPRESSION_MIN_SIZE` are sent as is. Streaming responses are
+    compressed chunk by chunk and flushed after every chunk, so clients still receive
+    data as soon as it is produced.
+
+    gzip output is padded with random-length headers like Django's `GZipMiddleware`. HTML
+    pages carry CSRF tokens, so they are never sent as brotli, which cannot be padded.
+    """
+    excluded_content_types = ('image/', 'video/', 'audio/', 'application/zip', 'application/gzip')
+    max_random_bytes = 100
+
+    def process_response(self, request, response):
+        if response.has_header('Content-Encoding') or request.method == 'HEAD':
+            return response
+        content_type = response.get('Content-Type', '')
+        if content_type.startswith(self.excluded_content_types) and 'svg' not in content_type:
+            return response
+        if not response.streaming and len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        encoding = self.negotiate(request.META.get('HTTP_ACCEPT_ENCODING', ''), html=content_type.startswith('text/html'))
+        if encoding is None:
+            return response
+        level = settings.COMPRESSION_BROTLI_QUALITY if encoding == 'br' else settings.COMPRESSION_GZIP_LEVEL
+
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = self.compress_async(
+                    response.streaming_content, encoding, level, self.max_random_bytes,
+                )
+            else:
+                response.streaming_content = self.compress_stream(
+                    response.streaming_content, encoding, level, self.max_random_bytes,
+                )
+            del response['Content-Length']
+        else:
+            compressor = StreamCompressor(encoding, level, self.max_random_bytes)
+            compressed = compressor.compress(response.content) + compressor.finish()
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response['Content-Length'] = str(len(compressed))
+
+        # The representation changed, so a strong ETag no longer matches it byte for byte
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+        response['Content-Encoding'] = encoding
+        return response
+
+    def negotiate(self, accept_encoding, html=False):
+        """
+        Returns 'br', 'gzip' or None for the given `Accept-Encoding` header value; never 'br' for HTML.
+        """
+        return negotiate_encoding(accept_encoding, ('br', 'gzip') if brotli is not None and not html else ('gzip',))
+
+    @staticmethod
+    def compress_stream(chunks, encoding, level, max_random_bytes):
+        compressor = StreamCompressor(encoding, level, max_random_bytes)
+        for chunk in chunks:
+            output = compressor.compress(chunk, flush=True)
+            if output:
+                yield output
+        yield compressor.finish()
+
+    @staticmethod
+    async def compress_async(chunks, encoding, level, max_random_bytes):
+        compressor = StreamCompressor(encoding, level, max_random_bytes)
+        async for chunk in chunks:
+            output = compressor.compress(chunk, flush=True)
+            if output:
+                yield output
+        yield compressor.finish()
+
+
+class StaticFile:
+    """
+    A collected static file and its precompressed variants, resolved once per process.
+    """
+
+    def __init__(self, path, cache_control):
+        stat = os.stat(path)
+        self.path = path
+        self.content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        self.cache_control = cache_control
+        self.last_modified = http_date(stat.st_mtime)
+        self.etag = f'{int(stat.st_mtime):x}-{stat.st_size:x}'
+        # Variants in order of preference, as written by CompressedManifestStaticFilesStorage
+        self.variants = {
+            encoding: path + suffix
+            for encoding, suffix in (('br', '.br'), ('gzip', '.gz'))
+            if os.path.isfile(path + suffix)
+        }
+
+    def response(self, request):
+        encoding = negotiate_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''), tuple(self.variants))
+        path = self.variants.get(encoding, self.path)
+        etag = f'"{self.etag}-{encoding}"' if encoding else f'"{self.etag}"'
+        if request.META.get('HTTP_IF_NONE_MATCH') == etag:
+            response = HttpResponseNotModified()
+        elif request.method == 'HEAD':
+            response = HttpResponse(content_type=self.content_type)
+            response['Content-Length'] = str(os.path.getsize(path))
+        else:
+            response = FileResponse(open(path, 'rb'), content_type=self.content_type)
+            # Named after the original so the disposition does not advertise `.br`/`.gz`
+            response['Content-Disposition'] = f'inline; filename="{os.path.basename(self.path)}"'
+        if encoding:
+            response['Content-Encoding'] = encoding
+        if self.variants:
+            patch_vary_headers(response, ('Accept-Encoding',))
+        response['ETag'] = etag
+        response['Last-Modified'] = self.last_modified
+        response['Cache-Control'] = self.cache_control
+        return response
+
+
+class StaticFilesMiddleware:
+    """
+    Serves collected static files from `STATIC_ROOT` before URL resolution and views.
+
+    Content-hashed names listed in the storage manifest never change, so they are cached by
+    browsers for a year (`immutable`); other files for `STATIC_MAX_AGE` seconds. The brotli or
+    gzip variant written by collectstatic is picked from `Accept-Encoding`, so nothing is
+    compressed per request. Paths that are not collected fall through to the next handler.
+    """
+    immutable_cache_control = 'public, max-age=31536000, immutable'
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if not settings.STATIC_ROOT or '://' in settings.STATIC_URL:
+            raise MiddlewareNotUsed('Static files are not served by the app')
+        self.prefix = settings.STATIC_URL
+        self.root = settings.STATIC_ROOT
+        self.hashed_names = self.load_manifest()
+        self.files = {}
+
+    def load_manifest(self):
+        try:
+            with open(os.path.join(self.root, 'staticfiles.json')) as f:
+                return set(json.load(f).get('paths', {}).values())
+        except (OSError, ValueError):
+            return set()
+
+    def find(self, name):
+        static_file = self.files.get(name)
+        if static_file is None:
+            try:
+                path = safe_join(self.root, name)
+            except SuspiciousFileOperation:
+                return None
+            if not os.path.isfile(path):
+                return None
+            if name in self.hashed_names:
+                cache_control = self.immutable_cache_control
+            else:
+                cache_control = f'public, max-age={settings.STATIC_MAX_AGE}'
+            # Only existing files are remembered, so unknown paths cannot grow the cache
+            static_file = self.files[name] = StaticFile(path, cache_control)
+        return static_file
+
+    def __call__(self, request):
+        if request.method in ('GET', 'HEAD') and request.path.startswith(self.prefix):
+            static_file = self.find(request.path[len(self.prefix):])
+            if static_file is not None:
+                return static_file.response(request)
+        return self.get_response(request)
+
+
+class MemoryProfilingMiddleware:
+    """
+    Profiles the memory of sampled requests to selected views (see `authAPI.profiling`).
+
+    Tracing starts once the URL is resolved and ends when the response is returned, or
+    for streaming responses once their content has been sent.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if not settings.MEMORY_PROFILE_VIEWS and not settings.MEMORY_PROFILE_TOKEN:
+            raise MiddlewareNotUsed('Memory profiling is disabled')
+        self.views = set(settings.MEMORY_PROFILE_VIEWS)
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        profile = getattr(request, '_memory_profile', None)
+        if profile is None:
+            return response
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = profile.awrap(response.streaming_content)
+            else:
+                response.streaming_content = profile.wrap(response.streaming_content)
+            # Servers close the response even when its content was never iterated
+            response._resource_closers.append(profile.finish)
+        else:
+            profile.observe()
+            profile.finish()
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        token = settings.MEMORY_PROFILE_TOKEN
+        header = request.META.get('HTTP_X_MEMORY_PROFILE')
+        requested = bool(token and header) and hmac.compare_digest(header.encode(), token.encode())
+        view = request.resolver_match.view_name
+        if requested or (view in self.views and random.random() < settings.MEMORY_PROFILE_SAMPLE_RATE):
+            request._memory_profile = profiler.begin(view)
+        return None
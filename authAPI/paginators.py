@@ -0,0 +1,31 @@
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that avoids `COUNT(*)` over large unfiltered tables.
+
+    On PostgreSQL the planner's row estimate from `pg_class` is used when the queryset
+    has no filters and the estimate is above `estimate_threshold`; smaller tables and
+    filtered querysets are counted exactly. Partitioned tables have no estimate of their
+    own, so the estimates of their partitions are summed.
+    """
+    estimate_threshold = 100000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        connection = connections[queryset.db]
+        if connection.vendor == 'postgresql' and not queryset.query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'SELECT SUM(GREATEST(reltuples, 0))::bigint FROM pg_class WHERE oid = %s::regclass '
+                    'OR oid IN (SELECT inhrelid FROM pg_inherits WHERE inhparent = %s::regclass)',
+                    [queryset.model._meta.db_table] * 2,
+                )
+                row = cursor.fetchone()
+            if row and row[0] > self.estimate_threshold:
+                return row[0]
+        return super().count
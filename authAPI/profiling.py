@@ -0,0 +1,250 @@
+"""
+Sampled per-view memory profiling with tracemalloc.
+
+`authAPI.middleware.MemoryProfilingMiddleware` profiles a request when:
+- its URL name is listed in `MEMORY_PROFILE_VIEWS`, for a `MEMORY_PROFILE_SAMPLE_RATE`
+  fraction of those requests;
+- or it sends `X-Memory-Profile: <MEMORY_PROFILE_TOKEN>`, which is always profiled.
+Tracing only runs during a profiled request, so other requests pay nothing but the check.
+With neither setting configured the middleware removes itself.
+
+A profiled request records its peak traced memory and the allocation sites holding the most
+memory at the largest point observed: when the view returns, and after each chunk of a
+streaming response. Reports are aggregated per view and served to staff at
+`/memory-profile`. With `MEMORY_PROFILE_DIR` set, every process also writes its report to
+`<dir>/memory-profile-<pid>.json` and the page merges the reports of all processes.
+
+tracemalloc traces the whole process: one request is profiled at a time, and allocations
+of other threads during it are included.
+"""
+import json
+import os
+import threading
+import tracemalloc
+
+from django.conf import settings
+from django.http import JsonResponse
+from django.views.decorators.http import require_GET
+
+# Sites kept per view; the smallest are dropped beyond it
+MAX_SITES = 50
+# A new snapshot is taken when traced memory has grown this much since the last one
+SNAPSHOT_GROWTH = 1.25
+FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+]
+
+
+def site_name(traceback):
+    frames = []
+    for frame in traceback:
+        filename = frame.filename
+        if 'site-packages' + os.sep in filename:
+            filename = filename.split('site-packages' + os.sep, 1)[1]
+        elif filename.startswith(str(settings.BASE_DIR)):
+            filename = os.path.relpath(filename, settings.BASE_DIR)
+        frames.append(f'{filename}:{frame.lineno}')
+    return ' < '.join(frames)
+
+
+class MemoryProfile:
+    """
+    Tracing of one request, from `MemoryProfiler.begin` to `finish`.
+    """
+
+    def __init__(self, profiler, view):
+        self.profiler = profiler
+        self.view = view
+        self.snapshot = None
+        self.snapshot_size = 0
+        self.finished = False
+
+    def observe(self):
+        """
+        Keeps a snapshot of the live allocations when memory is the highest seen so far.
+        """
+        current = tracemalloc.get_traced_memory()[0]
+        if current > self.snapshot_size * SNAPSHOT_GROWTH:
+            self.snapshot = tracemalloc.take_snapshot()
+            self.snapshot_size = current
+
+    def finish(self):
+        """
+        Stops tracing and records the profile; later calls do nothing.
+        """
+        if self.finished:
+            return
+        self.finished = True
+        try:
+            peak = tracemalloc.get_traced_memory()[1]
+            snapshot = self.snapshot
+        finally:
+            tracemalloc.stop()
+            self.profiler.release()
+        statistics = []
+        if snapshot is not None:
+            key = 'traceback' if settings.MEMORY_PROFILE_FRAMES > 1 else 'lineno'
+            statistics = snapshot.filter_traces(FILTERS).statistics(key)[:settings.MEMORY_PROFILE_TOP]
+        self.profiler.record(self.view, peak, [(site_name(stat.traceback), stat.size, stat.count) for stat in statistics])
+
+    def wrap(self, content):
+        """
+        Returns the streaming content, finishing the profile once it is consumed or closed.
+
+        A generator closed before it started never runs its `finally`, so the middleware also
+        finishes the profile when the response is closed.
+        """
+        try:
+            for chunk in content:
+                yield chunk
+                self.observe()
+        finally:
+            self.finish()
+
+    async def awrap(self, content):
+        try:
+            async for chunk in content:
+                yield chunk
+                self.observe()
+        finally:
+            self.finish()
+
+
+class MemoryProfiler:
+    """
+    Starts profiles and aggregates their results per view.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Held for the duration of a profiled request
+        self._tracing = threading.Lock()
+        self.views = {}
+
+    def begin(self, view):
+        """
+        Starts tracing for a request to `view`.
+
+        Returns:
+        - A `MemoryProfile`, or None when another request is being profiled or tracemalloc
+          is already used by someone else.
+        """
+        if not self._tracing.acquire(blocking=False):
+            return None
+        if tracemalloc.is_tracing():
+            self._tracing.release()
+            return None
+        tracemalloc.start(settings.MEMORY_PROFILE_FRAMES)
+        return MemoryProfile(self, view)
+
+    def release(self):
+        self._tracing.release()
+
+    def record(self, view, peak, sites):
+        """
+        Adds one profiled request; `sites` are (site, bytes, blocks) tuples.
+        """
+        with self._lock:
+            stats = self.views.setdefault(view, {'requests': 0, 'peak_max': 0, 'peak_total': 0, 'sites': {}})
+            stats['requests'] += 1
+            stats['peak_max'] = max(stats['peak_max'], peak)
+            stats['peak_total'] += peak
+            for site, size, count in sites:
+                # [profiles seen in, total bytes, largest bytes, total blocks]
+                totals = stats['sites'].setdefault(site, [0, 0, 0, 0])
+                totals[0] += 1
+                totals[1] += size
+                totals[2] = max(totals[2], size)
+                totals[3] += count
+            if len(stats['sites']) > MAX_SITES:
+                largest = sorted(stats['sites'].items(), key=lambda item: item[1][2], reverse=True)[:MAX_SITES]
+                stats['sites'] = dict(largest)
+            data = json.dumps(self.views) if settings.MEMORY_PROFILE_DIR else None
+        if data is not None:
+            self.write(data)
+
+    def write(self, data):
+        path = os.path.join(settings.MEMORY_PROFILE_DIR, f'memory-profile-{os.getpid()}.json')
+        # Written aside and renamed, so readers never see a partial file
+        with open(f'{path}.tmp', 'w') as f:
+            f.write(data)
+        os.replace(f'{path}.tmp', path)
+
+    def reset(self):
+        with self._lock:
+            self.views = {}
+
+    def collected(self):
+        """
+        Returns the raw aggregates of this process, or of every process writing to `MEMORY_PROFILE_DIR`.
+        """
+        if not settings.MEMORY_PROFILE_DIR:
+            with self._lock:
+                return [json.loads(json.dumps(self.views))]
+        reports = []
+        for name in sorted(os.listdir(settings.MEMORY_PROFILE_DIR)):
+            if name.startswith('memory-profile-') and name.endswith('.json'):
+                try:
+                    with open(os.path.join(settings.MEMORY_PROFILE_DIR, name)) as f:
+                        reports.append(json.load(f))
+                except (OSError, ValueError):
+                    continue
+        return reports
+
+    def report(self):
+        """
+        Returns the merged report: per view, the request count, peak memory and top allocation sites.
+        """
+        merged = {}
+        for views in self.collected():
+            for view, stats in views.items():
+                total = merged.setdefault(view, {'requests': 0, 'peak_max': 0, 'peak_total': 0, 'sites': {}})
+                total['requests'] += stats['requests']
+                total['peak_max'] = max(total['peak_max'], stats['peak_max'])
+                total['peak_total'] += stats['peak_total']
+                for site, (seen, size, largest, count) in stats['sites'].items():
+                    totals = total['sites'].setdefault(site, [0, 0, 0, 0])
+                    totals[0] += seen
+                    totals[1] += size
+                    totals[2] = max(totals[2], largest)
+                    totals[3] += count
+        report = {}
+        for view, stats in sorted(merged.items(), key=lambda item: item[1]['peak_max'], reverse=True):
+            sites = sorted(stats['sites'].items(), key=lambda item: item[1][2], reverse=True)
+            report[view] = {
+                'requests': stats['requests'],
+                'peak_max_kb': round(stats['peak_max'] / 1024, 1),
+                'peak_mean_kb': round(stats['peak_total'] / stats['requests'] / 1024, 1),
+                'top_sites': [{
+                    'site': site,
+                    'largest_kb': round(largest / 1024, 1),
+                    'mean_kb': round(size / seen / 1024, 1),
+                    'mean_blocks': round(count / seen),
+                    'profiles': seen,
+                } for site, (seen, size, largest, count) in sites[:settings.MEMORY_PROFILE_TOP]],
+            }
+        return report
+
+
+profiler = MemoryProfiler()
+
+
+@require_GET
+def memory_profile_view(request):
+    """
+    Shows the aggregated memory profiles to staff.
+
+    Args:
+    - request: The HTTP request object, from a staff session.
+
+    Returns:
+    - JSON report per view, ordered by peak memory, or 403 for other users.
+    """
+    if not (request.user.is_authenticated and request.user.is_staff):
+        return JsonResponse({'error': 'Only admins can view memory profiles.'}, status=403)
+    response = JsonResponse(profiler.report(), json_dumps_params={'indent': 2})
+    response['Cache-Control'] = 'no-store'
+    return response
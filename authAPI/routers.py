@@ -0,0 +1,54 @@
+"""
+Database routing for read replicas.
+
+Product reads go to one of the `DATABASE_REPLICAS` aliases, except while the current
+request is pinned to the primary (see `authAPI.middleware.ReplicaPinningMiddleware`).
+Replicas that fail to connect are skipped for `REPLICA_RETRY_SECONDS`.
+"""
+import random
+import time
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+# Set for the duration of a request that must read its own writes.
+pin_primary = ContextVar('pin_primary', default=False)
+
+
+class ReplicaRouter:
+    """
+    Sends reads of the apps in `read_app_labels` to a healthy replica.
+    """
+    read_app_labels = {'products'}
+
+    def __init__(self):
+        self._down_until = {}
+
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label not in self.read_app_labels or pin_primary.get():
+            return None
+        replicas = [alias for alias in settings.DATABASE_REPLICAS if self.is_available(alias)]
+        return random.choice(replicas) if replicas else DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def is_available(self, alias):
+        """
+        Returns whether `alias` can serve reads, marking it down on connection errors.
+        """
+        if self._down_until.get(alias, 0) > time.monotonic():
+            return False
+        try:
+            connections[alias].ensure_connection()
+        except DatabaseError:
+            self._down_until[alias] = time.monotonic() + settings.REPLICA_RETRY_SECONDS
+            return False
+        return True
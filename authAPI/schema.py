@@ -0,0 +1,132 @@
+"""
+Precomputed OpenAPI schema.
+
+The schema is generated once - by `manage.py build_openapi_schema` at build time, or
+lazily on the first request - and then served from memory with an ETag. drf_yasg is
+only imported when the schema or one of the documentation UIs is first needed, which
+keeps it out of worker start-up.
+"""
+import hashlib
+import os
+from functools import lru_cache
+
+from django.conf import settings
+from django.http import Http404, HttpResponse, HttpResponseNotModified
+from django.urls import reverse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET
+
+
+def api_info():
+    from drf_yasg import openapi
+
+    return openapi.Info(
+        title="API Documentation",
+        default_version='v1',
+        description="Auto-generated API documentation",
+        terms_of_service="https://www.google.com/policies/terms/",
+        contact=openapi.Contact(email="support@yourapp.com"),
+        license=openapi.License(name="BSD License"),
+    )
+
+
+@lru_cache(maxsize=None)
+def get_schema_view():
+    from drf_yasg.views import get_schema_view as yasg_schema_view
+    from rest_framework import permissions
+
+    return yasg_schema_view(
+        api_info(),
+        public=True,
+        permission_classes=(permissions.AllowAny,),
+    )
+
+
+def generate_schema():
+    """
+    Introspects every API view and returns the schema as JSON bytes.
+    """
+    from drf_yasg.codecs import OpenAPICodecJson
+
+    generator = get_schema_view().generator_class(api_info())
+    return OpenAPICodecJson(validators=[]).encode(generator.get_schema(request=None, public=True))
+
+
+def write_schema(path=None):
+    """
+    Generates the schema and writes it to `path` (default `OPENAPI_SCHEMA_PATH`).
+
+    Returns:
+    - A tuple of (path, content hash).
+    """
+    path = path or settings.OPENAPI_SCHEMA_PATH
+    content = generate_schema()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(content)
+    return path, content_hash(content)
+
+
+def content_hash(content):
+    return hashlib.sha256(content).hexdigest()[:16]
+
+
+@lru_cache(maxsize=None)
+def load_schema():
+    """
+    Returns (content, content hash), reading the build artifact or generating it once.
+    """
+    try:
+        with open(settings.OPENAPI_SCHEMA_PATH, 'rb') as f:
+            content = f.read()
+    except FileNotFoundError:
+        content = generate_schema()
+    return content, content_hash(content)
+
+
+def schema_response(request, cache_control):
+    content, digest = load_schema()
+    etag = f'"{digest}"'
+    if etag in request.META.get('HTTP_IF_NONE_MATCH', ''):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(content, content_type='application/json')
+    response['ETag'] = etag
+    response['Cache-Control'] = cache_control
+    response['Link'] = f'<{reverse("openapi-schema-hashed", args=[digest])}>; rel="alternate"'
+    return response
+
+
+@require_GET
+def openapi_schema(request):
+    """
+    Serves the current schema; clients revalidate cheaply with If-None-Match.
+    """
+    return schema_response(request, 'public, no-cache')
+
+
+@require_GET
+def openapi_schema_hashed(request, digest):
+    """
+    Serves the schema under its content hash, cacheable forever.
+    """
+    if digest != load_schema()[1]:
+        raise Http404('Unknown schema version')
+    return schema_response(request, 'public, max-age=31536000, immutable')
+
+
+def ui_view(renderer):
+    """
+    Returns a view rendering the Swagger or ReDoc UI, building the drf_yasg view on first use.
+
+    The UIs load the schema from `openapi-schema` (see SWAGGER_SETTINGS['SPEC_URL']).
+    """
+    @csrf_exempt
+    def view(request, *args, **kwargs):
+        return _ui_view(renderer)(request, *args, **kwargs)
+    return view
+
+
+@lru_cache(maxsize=None)
+def _ui_view(renderer):
+    return get_schema_view().with_ui(renderer, cache_timeout=0)
@@ -30,30 +30,48 @@ INSTALLED_APPS = [
     'django.contrib.staticfiles',
     'rest_framework',
     'rest_framework_simplejwt',
+    'rest_framework_simplejwt.token_blacklist',
     'corsheaders',
     'account',
     'products',
     'drf_yasg',
+    'authAPI',
 ]
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'authAPI.middleware.StaticFilesMiddleware',  # Collected static files, precompressed and long-cached
+    'authAPI.middleware.CompressionMiddleware',  # gzip/brotli response compression
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',  # CORS Middleware
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'authAPI.middleware.ReplicaPinningMiddleware',  # Read-your-writes for replica routing
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'authAPI.middleware.MemoryProfilingMiddleware',  # Sampled tracemalloc profiles; removed unless configured
 ]
 
+# Per-view memory profiling (see authAPI/profiling.py); reports at /memory-profile for staff
+MEMORY_PROFILE_VIEWS = [name for name in os.getenv('MEMORY_PROFILE_VIEWS', '').split(',') if name]  # URL names, e.g. dashboard
+MEMORY_PROFILE_SAMPLE_RATE = float(os.getenv('MEMORY_PROFILE_SAMPLE_RATE', '0.01'))  # Fraction of their requests profiled
+MEMORY_PROFILE_TOKEN = os.getenv('MEMORY_PROFILE_TOKEN', '')  # `X-Memory-Profile: <token>` profiles any request
+MEMORY_PROFILE_FRAMES = int(os.getenv('MEMORY_PROFILE_FRAMES', '1'))  # Stack frames per allocation site
+MEMORY_PROFILE_TOP = int(os.getenv('MEMORY_PROFILE_TOP', '10'))  # Allocation sites reported per view
+MEMORY_PROFILE_DIR = os.getenv('MEMORY_PROFILE_DIR', '')  # Per-process report files, merged by the report page
+
+# Response compression (brotli is used when the optional `brotli` package is installed)
+COMPRESSION_MIN_SIZE = int(os.getenv('COMPRESSION_MIN_SIZE', '512'))  # Bytes; smaller bodies are sent as is
+COMPRESSION_GZIP_LEVEL = int(os.getenv('COMPRESSION_GZIP_LEVEL', '6'))  # 1 (fastest) - 9 (smallest)
+COMPRESSION_BROTLI_QUALITY = int(os.getenv('COMPRESSION_BROTLI_QUALITY', '5'))  # 0 (fastest) - 11 (smallest)
+
 ROOT_URLCONF = 'authAPI.urls'
 
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [os.path.join(BASE_DIR, 'templates')],
-        'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
                 'django.template.context_processors.debug',
@@ -61,11 +79,21 @@ TEMPLATES = [
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
             ],
+            # Templates are compiled once per process, whatever DEBUG is; runserver's
+            # autoreloader still clears the cache when a template file changes
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
         },
     },
 ]
 
 WSGI_APPLICATION = 'authAPI.wsgi.application'
+# Workers import lazily loaded code, connect to the databases and fill caches before serving (see authAPI/warmup.py)
+WORKER_WARMUP = os.getenv('WORKER_WARMUP', 'True') == 'True'
 
 # Database (use environment variables or hardcoded values for sensitive data)
 DATABASES = {
@@ -76,8 +104,31 @@ DATABASES = {
         'PASSWORD': os.getenv('POSTGRES_PASSWORD', 'postgres'),  # Ensure this matches your docker-compose value
         'HOST': os.getenv('DB_HOST', 'db'),  # Points to the 'db' service in Docker Compose
         'PORT': os.getenv('DB_PORT', '5432'),  # PostgreSQL default port
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', '0')),  # Seconds a connection is reused; 0 reconnects per request
+        'CONN_HEALTH_CHECKS': True,  # Reused connections are checked before each request
     }
 }
+if os.getenv('DB_ENGINE') == 'sqlite':
+    # Local development without PostgreSQL
+    DATABASES['default'] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.path.join(BASE_DIR, 'db.sqlite3'),
+    }
+
+# Read replicas for product reads (comma separated hosts, or SQLite file names when DB_ENGINE=sqlite).
+# Each one is exposed as a `replica_<n>` alias; tests mirror them onto `default`.
+for index, replica in enumerate(filter(None, os.getenv('DB_REPLICAS', '').split(',')), start=1):
+    replica_settings = dict(DATABASES['default'], TEST={'MIRROR': 'default'})
+    if replica_settings['ENGINE'] == 'django.db.backends.sqlite3':
+        replica_settings['NAME'] = os.path.join(BASE_DIR, replica)
+    else:
+        replica_settings['HOST'] = replica
+    DATABASES[f'replica_{index}'] = replica_settings
+
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias.startswith('replica_')]
+DATABASE_ROUTERS = ['authAPI.routers.ReplicaRouter']
+REPLICA_PIN_SECONDS = int(os.getenv('REPLICA_PIN_SECONDS', '5'))  # Read-your-writes window after a write
+REPLICA_RETRY_SECONDS = int(os.getenv('REPLICA_RETRY_SECONDS', '30'))  # How long a failed replica is skipped
 
 # Password validation (Security best practice: Enforce strong password rules)
 AUTH_PASSWORD_VALIDATORS = [
@@ -106,6 +157,13 @@ USE_TZ = True
 STATIC_URL = '/static/'
 STATICFILES_DIRS = [os.path.join(BASE_DIR, 'static')]
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')  # For production
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    # collectstatic writes content-hashed names plus .gz/.br variants (see authAPI/storage.py)
+    'staticfiles': {'BACKEND': 'authAPI.storage.CompressedManifestStaticFilesStorage'},
+}
+STATIC_MAX_AGE = int(os.getenv('STATIC_MAX_AGE', '60'))  # Seconds; content-hashed files are cached for a year
+STATIC_BROTLI_QUALITY = int(os.getenv('STATIC_BROTLI_QUALITY', '11'))  # Paid once per collectstatic; lower is faster
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')  # For user-uploaded content
 
@@ -119,7 +177,7 @@ AUTH_USER_MODEL = 'account.User'
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
         'rest_framework.authentication.SessionAuthentication',
-        'rest_framework_simplejwt.authentication.JWTAuthentication',  # JWT tokens
+        'account.authentication.JWTAuthentication',  # JWT tokens, rejecting revoked sessions
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
@@ -127,23 +185,100 @@ REST_FRAMEWORK = {
     ],
 }
 
+# Batch endpoint (/api/batch/) limits
+BATCH_MAX_REQUESTS = int(os.getenv('BATCH_MAX_REQUESTS', '20'))
+BATCH_MAX_WORKERS = int(os.getenv('BATCH_MAX_WORKERS', '4'))  # Concurrent reads per batch; 1 runs them inline
+BATCH_ALLOWED_PREFIXES = ['/api/user/', '/api/products/']
+
+# Product change feed (/api/products/changes/)
+PRODUCT_CHANGES_GAP_SECONDS = float(os.getenv('PRODUCT_CHANGES_GAP_SECONDS', '300'))  # Longest wait for an uncommitted event; keep above the DB transaction timeout
+PRODUCT_CHANGES_MAX_LIMIT = 1000
+PRODUCT_CHANGES_MAX_WAIT = 30  # Seconds a long-poll or stream may stay open
+
+# Live product events (/api/products/events/, served by the ASGI app)
+PRODUCT_EVENTS_BROKER = os.getenv('PRODUCT_EVENTS_BROKER', 'local')  # 'local' (one process) or 'outbox' (multi-process)
+PRODUCT_EVENTS_POLL_SECONDS = float(os.getenv('PRODUCT_EVENTS_POLL_SECONDS', '1'))  # Outbox polling interval
+PRODUCT_EVENTS_QUEUE_SIZE = 100  # Pending events per connection before the oldest are dropped
+PRODUCT_EVENTS_KEEPALIVE_SECONDS = 15
+PRODUCT_EVENTS_MAX_BACKLOG = 5000  # Missed events replayed on reconnect; beyond it the client resyncs
+
+# Catalog analytics (/api/products/analytics/) are recomputed at most this often
+PRODUCT_ANALYTICS_CACHE_SECONDS = int(os.getenv('PRODUCT_ANALYTICS_CACHE_SECONDS', '60'))
+
+# Prometheus metrics (/metrics). Scrapers authenticate with `Authorization: Bearer <METRICS_TOKEN>`;
+# with several worker processes also set PROMETHEUS_MULTIPROC_DIR (see authAPI/metrics.py)
+METRICS_TOKEN = os.getenv('METRICS_TOKEN', '')
+
+# Reverse proxies (addresses or networks) whose X-Forwarded-For header is trusted for the client address
+TRUSTED_PROXIES = [proxy for proxy in os.getenv('TRUSTED_PROXIES', '').split(',') if proxy]
+
+# Authentication audit events are buffered per process and written in batches (see account/audit.py)
+AUTH_AUDIT_BACKGROUND_FLUSH = os.getenv('AUTH_AUDIT_BACKGROUND_FLUSH', 'True') == 'True'  # Flush from a background thread
+AUTH_AUDIT_FLUSH_SECONDS = float(os.getenv('AUTH_AUDIT_FLUSH_SECONDS', '2'))  # Longest time an event stays buffered
+AUTH_AUDIT_BATCH_SIZE = int(os.getenv('AUTH_AUDIT_BATCH_SIZE', '200'))  # Pending events that trigger a flush
+AUTH_AUDIT_MAX_PENDING = int(os.getenv('AUTH_AUDIT_MAX_PENDING', '5000'))  # Requests write the buffer themselves beyond this
+AUTH_AUDIT_RETENTION_DAYS = int(os.getenv('AUTH_AUDIT_RETENTION_DAYS', '365'))  # Older events are removed by purge_expired
+
+# Rendered dashboard rows are cached per product version (see products/rendering.py)
+PRODUCT_ROW_CACHE_SECONDS = int(os.getenv('PRODUCT_ROW_CACHE_SECONDS', '86400'))
+CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    # One entry per product; keep MAX_ENTRIES above the catalog size or most rows are re-rendered
+    'product_rows': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'product-rows',
+        'OPTIONS': {'MAX_ENTRIES': int(os.getenv('PRODUCT_ROW_CACHE_MAX_ENTRIES', '50000'))},
+    },
+}
+if os.getenv('PRODUCT_ROW_CACHE_REDIS_URL'):
+    # Shared by every worker and host; requires the `redis` package
+    CACHES['product_rows'] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.getenv('PRODUCT_ROW_CACHE_REDIS_URL'),
+    }
+DASHBOARD_STREAM = os.getenv('DASHBOARD_STREAM', 'True') == 'True'  # Send the page head before the product rows
+DASHBOARD_STREAM_CHUNK_SIZE = int(os.getenv('DASHBOARD_STREAM_CHUNK_SIZE', '200'))  # Rows per flushed chunk
+
+# Product search from the database or from the process-local read model (see products/read_model.py)
+PRODUCT_SEARCH_BACKEND = os.getenv('PRODUCT_SEARCH_BACKEND', 'database')  # 'database' or 'memory'
+PRODUCT_READ_MODEL_REFRESH_SECONDS = float(os.getenv('PRODUCT_READ_MODEL_REFRESH_SECONDS', '5'))  # How stale searches may be
+PRODUCT_READ_MODEL_REBUILD_SECONDS = int(os.getenv('PRODUCT_READ_MODEL_REBUILD_SECONDS', '3600'))  # Full reload from the database
+PRODUCT_READ_MODEL_MAX_DELTA = int(os.getenv('PRODUCT_READ_MODEL_MAX_DELTA', '10000'))  # Changed rows kept before the arrays are rebuilt
+PRODUCT_READ_MODEL_CHANGE_OVERLAP_SECONDS = float(os.getenv('PRODUCT_READ_MODEL_CHANGE_OVERLAP_SECONDS', '5'))  # Re-read window; cover the longest write transaction and replica lag
+
+# Product reports are stored in monthly partitions on PostgreSQL (see manage_report_partitions)
+PRODUCT_REPORT_PARTITIONS_AHEAD = int(os.getenv('PRODUCT_REPORT_PARTITIONS_AHEAD', '3'))  # Future months created in advance
+PRODUCT_REPORT_RETENTION_MONTHS = int(os.getenv('PRODUCT_REPORT_RETENTION_MONTHS', '12'))  # Older months are dropped
+
 # Simple JWT settings (Security best practice: Short token lifetime)
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=40),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=1),
-    "ROTATE_REFRESH_TOKENS": False,
-    "BLACKLIST_AFTER_ROTATION": False,
+    "ROTATE_REFRESH_TOKENS": True,
+    "BLACKLIST_AFTER_ROTATION": True,
     "UPDATE_LAST_LOGIN": False,
     "AUTH_HEADER_TYPES": ("Bearer",),
     "AUTH_HEADER_NAME": "HTTP_AUTHORIZATION",
     "USER_ID_FIELD": "id",
     "USER_ID_CLAIM": "user_id",
     "TOKEN_TYPE_CLAIM": "token_type",
+    "AUTH_TOKEN_CLASSES": ("authAPI.signing.AccessToken",),  # Verified with JWT_PRIVATE_KEYS when configured
     "TOKEN_OBTAIN_SERIALIZER": "rest_framework_simplejwt.serializers.TokenObtainPairSerializer",
     "TOKEN_REFRESH_SERIALIZER": "rest_framework_simplejwt.serializers.TokenRefreshSerializer",
     "TOKEN_VERIFY_SERIALIZER": "rest_framework.simplejwt.serializers.TokenVerifySerializer",
 }
 
+# Token sessions (/api/user/token/, see account/tokens.py). Revoked sessions are checked in memory, synced from
+# the blacklist tables by a background thread; other processes reject them within TOKEN_REVOCATION_SYNC_SECONDS.
+TOKEN_REVOCATION_BACKGROUND_SYNC = os.getenv('TOKEN_REVOCATION_BACKGROUND_SYNC', 'True') == 'True'  # Sync from a background thread
+TOKEN_REVOCATION_SYNC_SECONDS = float(os.getenv('TOKEN_REVOCATION_SYNC_SECONDS', '5'))  # Longest time a revocation takes to apply
+TOKEN_REVOCATION_REBUILD_SECONDS = int(os.getenv('TOKEN_REVOCATION_REBUILD_SECONDS', '600'))  # Full reload, dropping expired sessions
+
+# Asymmetric token signing (see authAPI/signing.py). Comma-separated PEM files, newest first: the first
+# key signs, the others only verify tokens issued before the last rotation. Empty keeps HS256 with SECRET_KEY.
+JWT_PRIVATE_KEYS = [path for path in os.getenv('JWT_PRIVATE_KEYS', '').split(',') if path]
+JWKS_MAX_AGE = int(os.getenv('JWKS_MAX_AGE', '300'))  # Seconds other services may cache /.well-known/jwks.json
+
 # Email Configuration
 EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
 EMAIL_HOST = 'smtp.gmail.com'
@@ -181,4 +316,10 @@ LOGIN_URL = 'login'
 
 SWAGGER_SETTINGS = {
     'VALIDATOR_URL': 'http://localhost:8189',
-}
\ No newline at end of file
+    'SPEC_URL': 'openapi-schema',  # Precomputed schema (see authAPI/schema.py)
+}
+REDOC_SETTINGS = {
+    'SPEC_URL': 'openapi-schema',
+}
+# Written by `manage.py build_openapi_schema`; generated on first request when missing
+OPENAPI_SCHEMA_PATH = os.getenv('OPENAPI_SCHEMA_PATH', os.path.join(BASE_DIR, 'openapi', 'openapi.json'))
\ No newline at end of file
@@ -0,0 +1,192 @@
+"""
+Asymmetric JWT signing with key rotation.
+
+`JWT_PRIVATE_KEYS` lists PEM private keys (RSA or Ed25519). The first one signs new tokens;
+the others are previous keys that only verify tokens issued before a rotation, and can be
+removed once `REFRESH_TOKEN_LIFETIME` has passed. Every key is identified by its RFC 7638
+thumbprint, sent as the `kid` header of the tokens it signs and published at `/.well-known/jwks.json`,
+so other services verify tokens locally (see `authAPI.verifier`) without sharing a secret.
+
+Without configured keys tokens keep being signed with `SECRET_KEY` (HS256).
+"""
+import base64
+import hashlib
+import json
+from functools import lru_cache
+
+import jwt
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.translation import gettext_lazy as _
+from django.views.decorators.http import require_GET
+from rest_framework_simplejwt import state, tokens
+from rest_framework_simplejwt.backends import TokenBackend
+from rest_framework_simplejwt.exceptions import TokenBackendError
+from rest_framework_simplejwt.settings import api_settings
+
+
+def b64url(data):
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode()
+
+
+def public_jwk(private_key):
+    """
+    Returns (algorithm, public JWK without `kid`/`alg`) for an RSA or Ed25519 private key.
+    """
+    from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+    from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+
+    public_key = private_key.public_key()
+    if isinstance(private_key, rsa.RSAPrivateKey):
+        numbers = public_key.public_numbers()
+        return 'RS256', {
+            'kty': 'RSA',
+            'e': b64url(numbers.e.to_bytes((numbers.e.bit_length() + 7) // 8, 'big')),
+            'n': b64url(numbers.n.to_bytes((numbers.n.bit_length() + 7) // 8, 'big')),
+        }
+    if isinstance(private_key, ed25519.Ed25519PrivateKey):
+        return 'EdDSA', {'kty': 'OKP', 'crv': 'Ed25519', 'x': b64url(public_key.public_bytes(Encoding.Raw, PublicFormat.Raw))}
+    raise ValueError(f'Unsupported signing key type {type(private_key).__name__}; use RSA or Ed25519')
+
+
+def thumbprint(jwk):
+    # RFC 7638: SHA-256 over the required members, sorted and without whitespace
+    canonical = json.dumps(jwk, sort_keys=True, separators=(',', ':'))
+    return b64url(hashlib.sha256(canonical.encode()).digest())
+
+
+class SigningKey:
+    def __init__(self, private_key):
+        self.private_key = private_key
+        self.algorithm, jwk = public_jwk(private_key)
+        self.public_key = private_key.public_key()
+        self.kid = thumbprint(jwk)
+        self.jwk = {**jwk, 'kid': self.kid, 'alg': self.algorithm, 'use': 'sig'}
+
+    @classmethod
+    def from_pem(cls, pem):
+        from cryptography.hazmat.primitives.serialization import load_pem_private_key
+        return cls(load_pem_private_key(pem, password=None))
+
+
+class KeyRingTokenBackend(TokenBackend):
+    """
+    Token backend that signs with the active key and verifies with the key named by `kid`.
+
+    Verification only accepts the algorithm of that key, so a token cannot pick a weaker one.
+    """
+    def __init__(self, keys, **kwargs):
+        self.keys = list(keys)
+        self.active = self.keys[0]
+        self.keys_by_kid = {key.kid: key for key in self.keys}
+        super().__init__('RS256', **kwargs)
+
+    def _validate_algorithm(self, algorithm):
+        # Algorithms come from the key types, which SigningKey already restricts
+        pass
+
+    def encode(self, payload):
+        jwt_payload = payload.copy()
+        if self.audience is not None:
+            jwt_payload['aud'] = self.audience
+        if self.issuer is not None:
+            jwt_payload['iss'] = self.issuer
+        return jwt.encode(
+            jwt_payload,
+            self.active.private_key,
+            algorithm=self.active.algorithm,
+            headers={'kid': self.active.kid},
+            json_encoder=self.json_encoder,
+        )
+
+    def decode(self, token, verify=True):
+        try:
+            key = self.keys_by_kid.get(jwt.get_unverified_header(token).get('kid'))
+            if key is None:
+                raise TokenBackendError(_('Token is invalid or expired'))
+            return jwt.decode(
+                token,
+                key.public_key,
+                algorithms=[key.algorithm],
+                audience=self.audience,
+                issuer=self.issuer,
+                leeway=self.get_leeway(),
+                options={'verify_aud': self.audience is not None, 'verify_signature': verify},
+            )
+        except jwt.InvalidTokenError as ex:
+            raise TokenBackendError(_('Token is invalid or expired')) from ex
+
+
+@lru_cache(maxsize=None)
+def get_signing_keys():
+    keys = []
+    for path in settings.JWT_PRIVATE_KEYS:
+        with open(path, 'rb') as f:
+            keys.append(SigningKey.from_pem(f.read()))
+    return keys
+
+
+@lru_cache(maxsize=None)
+def get_token_backend():
+    """
+    Returns the backend signing and verifying this app's tokens.
+    """
+    keys = get_signing_keys()
+    if not keys:
+        return state.token_backend
+    return KeyRingTokenBackend(
+        keys,
+        audience=api_settings.AUDIENCE,
+        issuer=api_settings.ISSUER,
+        leeway=api_settings.LEEWAY,
+        json_encoder=api_settings.JSON_ENCODER,
+    )
+
+
+@lru_cache(maxsize=None)
+def jwks_document():
+    body = json.dumps({'keys': [key.jwk for key in get_signing_keys()]}, separators=(',', ':')).encode()
+    return body, f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+@receiver(setting_changed)
+def reset_keys(setting, **kwargs):
+    if setting in {'JWT_PRIVATE_KEYS', 'SIMPLE_JWT'}:
+        get_signing_keys.cache_clear()
+        get_token_backend.cache_clear()
+        jwks_document.cache_clear()
+
+
+class AccessToken(tokens.AccessToken):
+    def get_token_backend(self):
+        return get_token_backend()
+
+
+class RefreshToken(tokens.RefreshToken):
+    access_token_class = AccessToken
+
+    def get_token_backend(self):
+        return get_token_backend()
+
+
+@require_GET
+def jwks_view(request):
+    """
+    Publishes the public keys that verify this app's tokens as a JSON Web Key Set.
+
+    Args:
+    - request: The HTTP request object.
+
+    Returns:
+    - The key set, cacheable for `JWKS_MAX_AGE` seconds, or 304 if the client's copy is current.
+    """
+    body, etag = jwks_document()
+    if request.META.get('HTTP_IF_NONE_MATCH') == etag:
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(body, content_type='application/jwk-set+json')
+    response['ETag'] = etag
+    response['Cache-Control'] = f'public, max-age={settings.JWKS_MAX_AGE}'
+    return response
@@ -0,0 +1,115 @@
+"""
+Building blocks of the container start-up (`manage.py prepare_container`).
+
+Every replica of a deploy starts the same image against the same database, so the work
+done at start-up is checked first and skipped when it is already done: migrations only run
+when the code has unapplied ones, under a database-wide lock so exactly one replica applies
+them, and static files are only collected when their sources changed.
+"""
+import hashlib
+import os
+import random
+import time
+import zlib
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.db import OperationalError, connections
+from django.db.migrations.executor import MigrationExecutor
+
+# Key of the PostgreSQL advisory lock held while migrating
+MIGRATION_LOCK_ID = zlib.crc32(b'authAPI.prepare_container.migrate')
+STATIC_STAMP_NAME = '.sources.sha256'
+
+
+def wait_for_database(alias='default', timeout=60, initial_delay=0.1, max_delay=5):
+    """
+    Waits until the database accepts connections, backing off exponentially between attempts.
+
+    Returns:
+    - The number of attempts made.
+
+    Raises:
+    - OperationalError if the database is still unreachable after `timeout` seconds.
+    """
+    connection = connections[alias]
+    deadline = time.monotonic() + timeout
+    delay = initial_delay
+    attempts = 0
+    while True:
+        attempts += 1
+        try:
+            connection.ensure_connection()
+            return attempts
+        except OperationalError:
+            if time.monotonic() + delay > deadline:
+                raise
+            # Jitter keeps replicas started together from probing in lockstep
+            time.sleep(delay * random.uniform(0.5, 1))
+            delay = min(delay * 2, max_delay)
+
+
+def pending_migrations(alias='default'):
+    """
+    Returns the migrations defined in the code but not yet applied to the database.
+    """
+    executor = MigrationExecutor(connections[alias])
+    return [migration for migration, backwards in executor.migration_plan(executor.loader.graph.leaf_nodes())]
+
+
+@contextmanager
+def migration_lock(alias='default'):
+    """
+    Serializes migrations across replicas with a PostgreSQL session advisory lock.
+
+    Other backends run a single process in practice and are not locked.
+    """
+    connection = connections[alias]
+    if connection.vendor != 'postgresql':
+        yield
+        return
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT pg_advisory_lock(%s)', [MIGRATION_LOCK_ID])
+    try:
+        yield
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT pg_advisory_unlock(%s)', [MIGRATION_LOCK_ID])
+
+
+def static_sources_hash():
+    """
+    Hashes the path and content of every file `collectstatic` would copy, and the storage
+    class that post-processes them.
+    """
+    digest = hashlib.sha256(f"{settings.STORAGES['staticfiles']['BACKEND']}\n".encode())
+    seen = set()
+    for finder in finders.get_finders():
+        for path, storage in finder.list(['CVS', '.*', '*~']):
+            # The first finder providing a path wins, as in collectstatic
+            if path in seen:
+                continue
+            seen.add(path)
+            digest.update(path.encode())
+            with storage.open(path) as f:
+                for chunk in iter(lambda: f.read(1 << 16), b''):
+                    digest.update(chunk)
+    return digest.hexdigest()
+
+
+def static_stamp_path():
+    return os.path.join(settings.STATIC_ROOT, STATIC_STAMP_NAME)
+
+
+def static_files_current(sources_hash):
+    try:
+        with open(static_stamp_path()) as f:
+            return f.read().strip() == sources_hash
+    except FileNotFoundError:
+        return False
+
+
+def write_static_stamp(sources_hash):
+    with open(static_stamp_path(), 'w') as f:
+        f.write(sources_hash)
@@ -0,0 +1,63 @@
+"""
+Static files storage producing content-hashed, precompressed assets.
+
+`collectstatic` writes every file under a content-hashed name (`base.8d3c1f2e6a9b.css`) listed in
+`staticfiles.json`, then stores gzip and brotli variants next to the hashed text assets so
+`StaticFilesMiddleware` serves them without compressing anything per request.
+"""
+import gzip
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+
+from authAPI.middleware import brotli
+
+# Source maps are skipped: only developer tools fetch them and they are the largest files
+COMPRESSIBLE_EXTENSIONS = ('.css', '.js', '.json', '.svg', '.txt', '.html', '.xml', '.ico', '.ttf', '.eot')
+MIN_COMPRESS_SIZE = 256  # Bytes; smaller files are not worth a second request variant
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    # Missing manifest entries fall back to the plain name instead of failing the page
+    manifest_strict = False
+
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run=dry_run, **options)
+        if dry_run:
+            return
+        names = [name for name in set(self.hashed_files.values()) if name.endswith(COMPRESSIBLE_EXTENSIONS)]
+        # zlib and brotli release the GIL, so threads compress files in parallel
+        with ThreadPoolExecutor() as executor:
+            for name, written in zip(names, executor.map(self.compress, names)):
+                for variant in written:
+                    yield name, variant, True
+
+    def compress(self, name):
+        """
+        Writes the `.gz` (and `.br`, when brotli is installed) variants of `name`.
+
+        Variants that would not be smaller than the original are skipped.
+
+        Returns:
+        - The names of the variants written.
+        """
+        path = self.path(name)
+        with open(path, 'rb') as f:
+            content = f.read()
+        if len(content) < MIN_COMPRESS_SIZE:
+            return []
+        variants = [('.gz', lambda data: gzip.compress(data, compresslevel=9, mtime=0))]
+        if brotli is not None:
+            variants.append(('.br', lambda data: brotli.compress(data, quality=settings.STATIC_BROTLI_QUALITY)))
+        written = []
+        for suffix, compress in variants:
+            compressed = compress(content)
+            if len(compressed) < len(content):
+                with open(path + suffix, 'wb') as f:
+                    f.write(compressed)
+                written.append(name + suffix)
+            elif os.path.exists(path + suffix):
+                os.remove(path + suffix)
+        return written
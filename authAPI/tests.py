@@ -0,0 +1,466 @@
+import gzip
+import os
+import tempfile
+import tracemalloc
+from io import StringIO
+from unittest import mock
+
+import jwt
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.core.files.storage import FileSystemStorage
+from django.core.management import call_command
+from django.db import OperationalError, connection
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from prometheus_client import REGISTRY
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from account.audit import audit_log
+from account.models import User
+from account.tokens import revocations
+from authAPI.metrics import render_metrics
+from authAPI.middleware import CompressionMiddleware, MemoryProfilingMiddleware, StaticFilesMiddleware, brotli
+from authAPI.profiling import profiler
+from authAPI.signing import RefreshToken, get_signing_keys
+from authAPI.startup import pending_migrations, wait_for_database
+from authAPI.storage import CompressedManifestStaticFilesStorage
+from authAPI.verifier import TokenVerifier
+from authAPI.warmup import warm_up, warm_up_worker
+from products.models import Product
+
+
+@override_settings(COMPRESSION_MIN_SIZE=200, COMPRESSION_GZIP_LEVEL=6, COMPRESSION_BROTLI_QUALITY=5)
+class CompressionMiddlewareTests(SimpleTestCase):
+    body = b'{"name": "Product", "description": "A test product"}' * 50
+
+    def process(self, response, accept_encoding):
+        request = RequestFactory().get('/', HTTP_ACCEPT_ENCODING=accept_encoding)
+        return CompressionMiddleware(lambda request: response)(request)
+
+    def test_gzip(self):
+        response = self.process(HttpResponse(self.body), 'gzip, deflate')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+        self.assertEqual(gzip.decompress(response.content), self.body)
+
+    def test_brotli_preferred_when_available(self):
+        if brotli is None:
+            self.skipTest('brotli is not installed')
+        response = self.process(HttpResponse(self.body, content_type='application/json'), 'gzip;q=0.8, br')
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(brotli.decompress(response.content), self.body)
+
+    def test_gzip_length_is_padded_randomly(self):
+        lengths = {len(self.process(HttpResponse(self.body), 'gzip').content) for _ in range(10)}
+        self.assertGreater(len(lengths), 1)
+        chunks = [b'<tr><td>row %d</td></tr>' % i for i in range(100)]
+        response = self.process(StreamingHttpResponse(iter(chunks)), 'gzip')
+        self.assertEqual(gzip.decompress(b''.join(response.streaming_content)), b''.join(chunks))
+
+    def test_html_is_never_sent_as_brotli(self):
+        response = self.process(HttpResponse(self.body, content_type='text/html; charset=utf-8'), 'br, gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.content), self.body)
+
+    def test_small_body_and_unsupported_encoding_are_not_compressed(self):
+        self.assertFalse(self.process(HttpResponse(b'tiny'), 'gzip').has_header('Content-Encoding'))
+        self.assertFalse(self.process(HttpResponse(self.body), 'identity').has_header('Content-Encoding'))
+        self.assertFalse(self.process(HttpResponse(self.body), 'gzip;q=0').has_header('Content-Encoding'))
+
+    def test_streaming_chunks_are_flushed(self):
+        chunks = [b'<tr><td>row %d</td></tr>' % i for i in range(100)]
+        response = self.process(StreamingHttpResponse(iter(chunks)), 'gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        parts = list(response.streaming_content)
+        self.assertGreater(len(parts), 1)
+        self.assertEqual(gzip.decompress(b''.join(parts)), b''.join(chunks))
+
+
+class StaticFilesTests(SimpleTestCase):
+    css = b'.card { box-shadow: 0 4px 8px rgba(0, 0, 0, 0.1); }\n' * 40
+
+    def setUp(self):
+        self.static_root = tempfile.TemporaryDirectory()
+        self.addCleanup(self.static_root.cleanup)
+        source = tempfile.TemporaryDirectory()
+        self.addCleanup(source.cleanup)
+        os.makedirs(os.path.join(source.name, 'css'))
+        with open(os.path.join(source.name, 'css', 'app.css'), 'wb') as f:
+            f.write(self.css)
+
+        storage = CompressedManifestStaticFilesStorage(location=self.static_root.name)
+        storage.save('css/app.css', open(os.path.join(source.name, 'css', 'app.css'), 'rb'))
+        list(storage.post_process({'css/app.css': (FileSystemStorage(location=source.name), 'css/app.css')}))
+        self.hashed_name = storage.stored_name('css/app.css')
+
+    def get(self, path, **headers):
+        with self.settings(STATIC_ROOT=self.static_root.name, STATIC_URL='/static/'):
+            middleware = StaticFilesMiddleware(lambda request: HttpResponse(status=404))
+            return middleware(RequestFactory().get(path, **headers))
+
+    def test_collectstatic_writes_hashed_and_compressed_variants(self):
+        path = os.path.join(self.static_root.name, self.hashed_name)
+        self.assertRegex(self.hashed_name, r'^css/app\.[0-9a-f]{12}\.css$')
+        self.assertEqual(gzip.decompress(open(path + '.gz', 'rb').read()), self.css)
+        if brotli is not None:
+            self.assertEqual(brotli.decompress(open(path + '.br', 'rb').read()), self.css)
+
+    def test_hashed_file_is_served_precompressed_and_immutable(self):
+        response = self.get(f'/static/{self.hashed_name}', HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(response['Content-Type'], 'text/css')
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertEqual(gzip.decompress(b''.join(response.streaming_content)), self.css)
+
+        response = self.get(f'/static/{self.hashed_name}', HTTP_ACCEPT_ENCODING='gzip', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_unhashed_and_unknown_paths(self):
+        response = self.get('/static/css/app.css')
+        self.assertNotIn('Content-Encoding', response)
+        self.assertEqual(response['Cache-Control'], 'public, max-age=60')
+        self.assertEqual(b''.join(response.streaming_content), self.css)
+        self.assertEqual(self.get('/static/css/missing.css').status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(self.get('/static/../settings.py').status_code, status.HTTP_404_NOT_FOUND)
+
+
+@override_settings(BATCH_MAX_WORKERS=1, BATCH_MAX_REQUESTS=3)
+class BatchViewTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email='testuser@example.com', password='testpass123', name='Test User', tc=True)
+        self.product = Product.objects.create(name="Product 1", description="A test product", price=10.00, available_stock=100)
+        self.client.login(email='testuser@example.com', password='testpass123')
+
+    def test_batch_runs_reads_and_writes_in_order(self):
+        response = self.client.post(reverse('batch'), {'requests': [
+            {'method': 'GET', 'path': '/api/products/search/?query=Product&fields=id,name'},
+            {'method': 'POST', 'path': f'/api/products/select/{self.product.id}/'},
+            {'method': 'GET', 'path': '/api/products/selected/'},
+        ]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        search, select, selected = response.json()
+        self.assertEqual(search['body'], [{'id': self.product.id, 'name': 'Product 1'}])
+        self.assertEqual(select['status'], status.HTTP_200_OK)
+        self.assertEqual(selected['body']['count'], 1)
+
+    def test_batch_authenticates_once_with_jwt(self):
+        self.client.logout()
+        token = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        response = self.client.post(reverse('batch'), [
+            {'method': 'GET', 'path': '/api/products/selected/'},
+            {'method': 'GET', 'path': '/api/products/missing/'},
+        ], format='json')
+        self.assertEqual([result['status'] for result in response.json()], [200, 404])
+
+    def test_batch_limits(self):
+        too_many = [{'method': 'GET', 'path': '/api/products/selected/'}] * 4
+        self.assertEqual(self.client.post(reverse('batch'), too_many, format='json').status_code, 400)
+        nested = [{'method': 'POST', 'path': '/api/batch/'}]
+        self.assertEqual(self.client.post(reverse('batch'), nested, format='json').status_code, 400)
+
+    def test_streaming_and_long_polling_items_are_refused(self):
+        response = self.client.post(reverse('batch'), [
+            {'method': 'GET', 'path': '/api/products/changes/?stream=true'},
+            {'method': 'GET', 'path': '/api/products/events/'},
+            {'method': 'GET', 'path': '/api/products/changes/?wait=30'},
+        ], format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([result['status'] for result in response.json()], [400, 400, 400])
+
+        response = self.client.post(reverse('batch'), [{'method': 'GET', 'path': '/api/products/'}], format='json')
+        [listing] = response.json()
+        self.assertEqual(listing['status'], status.HTTP_200_OK)
+        self.assertIn('Product 1', listing['body'])
+
+
+# The Swagger UI page links static files, which are not collected for tests
+@override_settings(STORAGES={**settings.STORAGES, 'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'}})
+class OpenAPISchemaTests(APITestCase):
+    def test_schema_is_served_with_etag(self):
+        response = self.client.get(reverse('openapi-schema'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('/api/products/search/', response.json()['paths'])
+        etag = response['ETag']
+
+        response = self.client.get(reverse('openapi-schema'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        hashed = reverse('openapi-schema-hashed', args=[etag.strip('"')])
+        response = self.client.get(hashed)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertEqual(self.client.get(reverse('openapi-schema-hashed', args=['stale'])).status_code, 404)
+
+    def test_ui_points_at_precomputed_schema(self):
+        response = self.client.get(reverse('schema-swagger-ui'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertContains(response, reverse('openapi-schema'))
+
+
+@override_settings(METRICS_TOKEN='scrape-token', AUTH_AUDIT_BACKGROUND_FLUSH=False)
+class MetricsTests(APITestCase):
+    def setUp(self):
+        self.addCleanup(audit_log.clear)
+        self.user = User.objects.create_user(email='testuser@example.com', password='testpass123', name='Test User', tc=True)
+        self.product = Product.objects.create(name="Product 1", description="", price=1, selected_by=self.user)
+
+    def sample(self, name, **labels):
+        return REGISTRY.get_sample_value(name, labels) or 0
+
+    def test_instrumented_views(self):
+        failures = self.sample('auth_logins_total', outcome='failure')
+        conflicts = self.sample('product_selections_total', outcome='conflict')
+        reports = self.sample('product_reports_total')
+
+        self.client.post(reverse('login'), {'email': 'testuser@example.com', 'password': 'wrong'})
+        other = User.objects.create_user(email='other@example.com', password='testpass123', name='Other', tc=True)
+        self.client.force_authenticate(other)
+        self.client.post(reverse('product-select', args=[self.product.id]))
+        self.client.post(reverse('product-report', args=[self.product.id]), {'reason': 'Defective'})
+
+        self.assertEqual(self.sample('auth_logins_total', outcome='failure'), failures + 1)
+        self.assertEqual(self.sample('product_selections_total', outcome='conflict'), conflicts + 1)
+        self.assertEqual(self.sample('product_reports_total'), reports + 1)
+        self.assertIn(b'auth_login_duration_seconds_bucket', render_metrics())
+
+    def test_endpoint_requires_token_or_staff(self):
+        self.assertEqual(self.client.get(reverse('metrics')).status_code, status.HTTP_403_FORBIDDEN)
+        response = self.client.get(reverse('metrics'), HTTP_AUTHORIZATION='Bearer scrape-token')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn(b'product_reports_total', response.content)
+        self.assertTrue(response['Content-Type'].startswith('text/plain'))
+
+        self.client.force_login(User.objects.create_superuser(email='admin@example.com', password='testpass123', name='Admin', tc=True))
+        self.assertEqual(self.client.get(reverse('metrics')).status_code, status.HTTP_200_OK)
+
+
+@override_settings(MEMORY_PROFILE_VIEWS=['product-search', 'dashboard'], MEMORY_PROFILE_SAMPLE_RATE=1,
+                   MEMORY_PROFILE_TOKEN='profile-token', MEMORY_PROFILE_DIR='')
+class MemoryProfilingTests(APITestCase):
+    def setUp(self):
+        profiler.reset()
+        self.addCleanup(profiler.reset)
+        self.user = User.objects.create_user(email='testuser@example.com', password='testpass123', name='Test User', tc=True)
+        Product.objects.bulk_create(Product(name=f'Product {i}', description='x' * 100, price=i) for i in range(50))
+        self.client.force_login(self.user)
+
+    def test_selected_views_are_profiled(self):
+        self.client.get(reverse('product-search'), {'query': 'Product'})
+        self.client.get(reverse('product-selected'))
+        self.assertFalse(tracemalloc.is_tracing())
+
+        report = profiler.report()
+        self.assertEqual(list(report), ['product-search'])
+        self.assertEqual(report['product-search']['requests'], 1)
+        self.assertGreater(report['product-search']['peak_max_kb'], 0)
+        self.assertTrue(report['product-search']['top_sites'])
+        self.assertTrue(all(':' in site['site'] for site in report['product-search']['top_sites']))
+
+    def test_header_profiles_any_view(self):
+        self.client.get(reverse('product-selected'), HTTP_X_MEMORY_PROFILE='wrong')
+        self.assertEqual(profiler.report(), {})
+        self.client.get(reverse('product-selected'), HTTP_X_MEMORY_PROFILE='profile-token')
+        self.assertEqual(profiler.report()['product-selected']['requests'], 1)
+
+    @override_settings(DASHBOARD_STREAM=True, DASHBOARD_STREAM_CHUNK_SIZE=10)
+    def test_streamed_response_is_profiled_until_sent(self):
+        response = self.client.get(reverse('dashboard'))
+        self.assertTrue(tracemalloc.is_tracing())
+        b''.join(response.streaming_content)
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertEqual(profiler.report()['dashboard']['requests'], 1)
+        response.close()
+        self.assertEqual(profiler.report()['dashboard']['requests'], 1)
+
+    @override_settings(DASHBOARD_STREAM=True)
+    def test_streamed_response_closed_unread_stops_tracing(self):
+        response = self.client.get(reverse('dashboard'))
+        self.assertTrue(tracemalloc.is_tracing())
+        response.close()
+        self.assertFalse(tracemalloc.is_tracing())
+        # The next profiled request can trace again
+        self.client.get(reverse('product-search'), {'query': 'Product'})
+        self.assertEqual(set(profiler.report()), {'dashboard', 'product-search'})
+
+    def test_reports_of_all_processes_are_merged_for_staff(self):
+        with tempfile.TemporaryDirectory() as directory, self.settings(MEMORY_PROFILE_DIR=directory):
+            self.client.get(reverse('product-search'), {'query': 'Product'})
+            with open(os.path.join(directory, 'memory-profile-1.json'), 'w') as f:
+                f.write('{"product-search": {"requests": 2, "peak_max": 1, "peak_total": 2, "sites": {}}}')
+
+            self.assertEqual(self.client.get(reverse('memory-profile')).status_code, status.HTTP_403_FORBIDDEN)
+            self.client.force_login(User.objects.create_superuser(email='admin@example.com', password='testpass123', name='Admin', tc=True))
+            response = self.client.get(reverse('memory-profile'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['product-search']['requests'], 3)
+
+    @override_settings(MEMORY_PROFILE_VIEWS=[], MEMORY_PROFILE_TOKEN='')
+    def test_middleware_is_removed_when_disabled(self):
+        with self.assertRaises(MiddlewareNotUsed):
+            MemoryProfilingMiddleware(lambda request: HttpResponse())
+
+
+class AsymmetricSigningTests(APITestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.key_dir = tempfile.TemporaryDirectory()
+        cls.old_key = os.path.join(cls.key_dir.name, 'old.pem')
+        cls.new_key = os.path.join(cls.key_dir.name, 'new.pem')
+        call_command('generate_signing_key', cls.old_key, algorithm='RS256', stdout=open(os.devnull, 'w'))
+        call_command('generate_signing_key', cls.new_key, algorithm='EdDSA', stdout=open(os.devnull, 'w'))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.key_dir.cleanup()
+        super().tearDownClass()
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='testuser@example.com', password='testpass123', name='Test User', tc=True)
+
+    def fetch_jwks(self):
+        response = self.client.get(reverse('jwks'))
+        return response.json(), int(response['Cache-Control'].rsplit('=', 1)[1])
+
+    def access_token(self):
+        return str(RefreshToken.for_user(self.user).access_token)
+
+    def test_tokens_are_signed_with_active_key_and_verified_locally(self):
+        with self.settings(JWT_PRIVATE_KEYS=[self.new_key]):
+            token = self.access_token()
+            [key] = get_signing_keys()
+            self.assertEqual(jwt.get_unverified_header(token), {'alg': 'EdDSA', 'kid': key.kid, 'typ': 'JWT'})
+            response = self.client.get(reverse('product-selected'), HTTP_AUTHORIZATION=f'Bearer {token}')
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+            verifier = TokenVerifier('http://testserver/.well-known/jwks.json', fetch=self.fetch_jwks)
+            for _ in range(3):
+                self.assertEqual(verifier.verify(token)['user_id'], self.user.id)
+            self.assertEqual(verifier.fetches, 1)
+            with self.assertRaises(jwt.InvalidTokenError):
+                verifier.verify(str(RefreshToken.for_user(self.user)))
+
+    def test_rotation_keeps_previous_tokens_valid(self):
+        with self.settings(JWT_PRIVATE_KEYS=[self.old_key]):
+            old_token = self.access_token()
+            verifier = TokenVerifier('http://testserver/.well-known/jwks.json', fetch=self.fetch_jwks, min_refresh_interval=0)
+            verifier.verify(old_token)
+
+        with self.settings(JWT_PRIVATE_KEYS=[self.new_key, self.old_key]):
+            new_token = self.access_token()
+            self.assertEqual(jwt.get_unverified_header(new_token)['alg'], 'EdDSA')
+            response = self.client.get(reverse('product-selected'), HTTP_AUTHORIZATION=f'Bearer {old_token}')
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            # The unknown kid of the new key makes the verifier refetch the key set once
+            verifier.verify(new_token)
+            verifier.verify(old_token)
+            self.assertEqual(verifier.fetches, 2)
+
+        with self.settings(JWT_PRIVATE_KEYS=[self.new_key]):
+            response = self.client.get(reverse('product-selected'), HTTP_AUTHORIZATION=f'Bearer {old_token}')
+            self.assertIn(response.status_code, (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN))
+
+    @override_settings(JWKS_MAX_AGE=600)
+    def test_jwks_is_cacheable(self):
+        with self.settings(JWT_PRIVATE_KEYS=[self.new_key, self.old_key]):
+            response = self.client.get(reverse('jwks'))
+            self.assertEqual(response['Cache-Control'], 'public, max-age=600')
+            self.assertEqual([key['alg'] for key in response.json()['keys']], ['EdDSA', 'RS256'])
+            self.assertNotIn('d', response.json()['keys'][1])
+            response = self.client.get(reverse('jwks'), HTTP_IF_NONE_MATCH=response['ETag'])
+            self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+
+class PrepareContainerTests(TestCase):
+    def test_database_probe_backs_off(self):
+        failures = [OperationalError('starting up')] * 3
+        with mock.patch.object(connection, 'ensure_connection', side_effect=failures + [None]), \
+                mock.patch('authAPI.startup.random.uniform', return_value=1), \
+                mock.patch('authAPI.startup.time.sleep') as sleep:
+            self.assertEqual(wait_for_database(initial_delay=0.1, max_delay=0.3), 4)
+        self.assertEqual([call.args[0] for call in sleep.call_args_list], [0.1, 0.2, 0.3])
+
+    def test_database_probe_gives_up(self):
+        with mock.patch.object(connection, 'ensure_connection', side_effect=OperationalError('down')), \
+                mock.patch('authAPI.startup.time.sleep'):
+            with self.assertRaises(OperationalError):
+                wait_for_database(timeout=0)
+
+    def test_work_already_done_is_skipped(self):
+        self.assertEqual(pending_migrations(), [])
+        storages = {
+            'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+            'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+        }
+        with tempfile.TemporaryDirectory() as static_root, self.settings(STATIC_ROOT=static_root, STORAGES=storages):
+            out = StringIO()
+            call_command('prepare_container', stdout=out)
+            self.assertIn('migrate: up to date, skipped', out.getvalue())
+            self.assertIn('collectstatic: collected', out.getvalue())
+            self.assertTrue(os.path.exists(os.path.join(static_root, 'admin', 'css', 'base.css')))
+
+            out = StringIO()
+            call_command('prepare_container', stdout=out)
+            self.assertIn('collectstatic: up to date, skipped', out.getvalue())
+
+
+class WarmUpTests(TestCase):
+    def setUp(self):
+        warm_up.reset()
+        self.addCleanup(warm_up.reset)
+        self.addCleanup(revocations.reset)
+        stderr = mock.patch('authAPI.warmup.sys.stderr', new_callable=StringIO)
+        self.stderr = stderr.start()
+        self.addCleanup(stderr.stop)
+
+    def test_steps_are_timed_and_reported(self):
+        self.assertTrue(warm_up.run())
+        self.assertEqual(list(warm_up.steps), ['imports', 'urls', 'templates', 'database', 'caches'])
+        self.assertIn('[warmup] worker', self.stderr.getvalue())
+        self.assertIn('ready after', self.stderr.getvalue())
+
+        response = self.client.get(reverse('readiness'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['steps'].keys(), warm_up.steps.keys())
+
+    def test_worker_does_not_keep_import_time_connections(self):
+        with mock.patch.object(warm_up, 'run') as run, mock.patch('authAPI.warmup.connections') as connections:
+            warm_up_worker()
+        run.assert_called_once_with()
+        connections.close_all.assert_called_once_with()
+
+    def test_not_ready_until_failed_steps_succeed(self):
+        with mock.patch('authAPI.warmup.connections') as connections, self.assertLogs('authAPI.warmup', 'ERROR'):
+            connections.__getitem__.return_value.ensure_connection.side_effect = OperationalError('starting up')
+            self.assertFalse(warm_up.run())
+            response = self.client.get(reverse('readiness'))
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response.json()['steps']['database']['error'], 'starting up')
+
+        # The probe retries the failed step
+        self.assertEqual(self.client.get(reverse('readiness')).status_code, status.HTTP_200_OK)
+        self.assertTrue(warm_up.ready)
+
+    @override_settings(DATABASE_REPLICAS=['replica_1'])
+    def test_unavailable_replica_only_degrades(self):
+        replica = mock.Mock(**{'ensure_connection.side_effect': OperationalError('replica down')})
+        with mock.patch('authAPI.warmup.connections', {'default': connection, 'replica_1': replica}), \
+                self.assertLogs('authAPI.warmup', 'WARNING'):
+            self.assertTrue(warm_up.run())
+        self.assertEqual(warm_up.steps['database']['degraded'], ['replica_1'])
+        self.assertIn('database', self.stderr.getvalue())
+        self.assertIn('(degraded: replica_1)', self.stderr.getvalue())
+        response = self.client.get(reverse('readiness'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['steps']['database']['degraded'], ['replica_1'])
+
+    @override_settings(WORKER_WARMUP=False)
+    def test_ready_without_warm_up_when_disabled(self):
+        self.assertEqual(self.client.get(reverse('readiness')).status_code, status.HTTP_200_OK)
+        self.assertEqual(warm_up.steps, {})
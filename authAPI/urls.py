@@ -16,31 +16,28 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path,include
-from rest_framework import permissions
-from drf_yasg.views import get_schema_view
-from drf_yasg import openapi
-from django.views.decorators.csrf import csrf_exempt
+from authAPI.metrics import metrics_view
+from authAPI.profiling import memory_profile_view
+from authAPI.schema import openapi_schema, openapi_schema_hashed, ui_view
+from authAPI.signing import jwks_view
+from authAPI.views import BatchView
+from authAPI.warmup import readiness_view
 
 
-schema_view = get_schema_view(
-   openapi.Info(
-      title="API Documentation",
-      default_version='v1',
-      description="Auto-generated API documentation",
-      terms_of_service="https://www.google.com/policies/terms/",
-      contact=openapi.Contact(email="support@yourapp.com"),
-      license=openapi.License(name="BSD License"),
-   ),
-   public=True,
-   permission_classes=(permissions.AllowAny,),  # Ensure this is present and correct
-)
 urlpatterns = [
-    path('swagger/', csrf_exempt(schema_view.with_ui('swagger', cache_timeout=0)), name='schema-swagger-ui'),
-    path('redoc/', csrf_exempt(schema_view.with_ui('redoc', cache_timeout=0)), name='schema-redoc'),
+    path('swagger/', ui_view('swagger'), name='schema-swagger-ui'),
+    path('redoc/', ui_view('redoc'), name='schema-redoc'),
+    path('openapi.json', openapi_schema, name='openapi-schema'),
+    path('openapi/<str:digest>.json', openapi_schema_hashed, name='openapi-schema-hashed'),
     path('', include('account.urls')),
     path('admin/', admin.site.urls),
     path('api/user/', include('account.urls')),
     path('api/products/', include('products.urls')),
+    path('api/batch/', BatchView.as_view(), name='batch'),
+    path('metrics', metrics_view, name='metrics'),
+    path('memory-profile', memory_profile_view, name='memory-profile'),
+    path('.well-known/jwks.json', jwks_view, name='jwks'),
+    path('ready', readiness_view, name='readiness'),
 
 
 
@@ -0,0 +1,117 @@
+"""
+Local verification of this app's access tokens, for other services.
+
+    verifier = TokenVerifier('https://auth.example.com/.well-known/jwks.json')
+    claims = verifier.verify(token)
+
+Depends only on PyJWT and cryptography, not on Django, so it can be copied into other
+services. The key set is fetched once and kept in memory for the `max-age` the JWKS
+endpoint sends; a token signed by a key that is not cached yet (right after a rotation)
+triggers at most one refetch per `min_refresh_interval`. Every other verification is
+CPU-only, with no network calls.
+"""
+import json
+import logging
+import re
+import threading
+import time
+import urllib.request
+
+import jwt
+
+logger = logging.getLogger(__name__)
+
+MAX_AGE_RE = re.compile(r'max-age=(\d+)')
+
+
+class TokenVerifier:
+    def __init__(self, jwks_url, audience=None, issuer=None, token_type='access',
+                 min_refresh_interval=30, default_max_age=300, timeout=5, fetch=None):
+        """
+        Args:
+        - jwks_url: URL of the auth service's `/.well-known/jwks.json`.
+        - audience, issuer: Expected `aud` and `iss` claims, if the auth service sets them.
+        - token_type: Required `token_type` claim; None accepts any type.
+        - min_refresh_interval: Minimum seconds between key set fetches caused by unknown keys.
+        - default_max_age: Cache lifetime of the key set when the response has no `max-age`.
+        - timeout: Seconds to wait for the JWKS endpoint.
+        - fetch: Optional callable returning (key set dict, max-age or None), replacing the HTTP fetch.
+        """
+        self.jwks_url = jwks_url
+        self.audience = audience
+        self.issuer = issuer
+        self.token_type = token_type
+        self.min_refresh_interval = min_refresh_interval
+        self.default_max_age = default_max_age
+        self.timeout = timeout
+        self.fetch = fetch or self.fetch_jwks
+        self.fetches = 0
+        self._keys = {}
+        self._expires_at = 0
+        self._fetched_at = float('-inf')
+        self._lock = threading.Lock()
+
+    def fetch_jwks(self):
+        with urllib.request.urlopen(self.jwks_url, timeout=self.timeout) as response:
+            match = MAX_AGE_RE.search(response.headers.get('Cache-Control', ''))
+            return json.load(response), int(match[1]) if match else None
+
+    def refresh(self):
+        now = time.monotonic()
+        self._fetched_at = now
+        self.fetches += 1
+        try:
+            document, max_age = self.fetch()
+        except Exception:
+            if not self._keys:
+                raise
+            # Keep verifying with the cached keys while the endpoint is unreachable
+            logger.warning('Could not refresh JWKS from %s; using cached keys', self.jwks_url, exc_info=True)
+            self._expires_at = now + self.min_refresh_interval
+            return
+        self._keys = {
+            jwk['kid']: (jwt.PyJWK(jwk), jwk['alg'])
+            for jwk in document.get('keys', [])
+            if jwk.get('use', 'sig') == 'sig' and 'kid' in jwk and 'alg' in jwk
+        }
+        self._expires_at = now + (self.default_max_age if max_age is None else max_age)
+
+    def get_key(self, kid):
+        now = time.monotonic()
+        unknown = kid not in self._keys and now - self._fetched_at >= self.min_refresh_interval
+        if now >= self._expires_at or unknown:
+            with self._lock:
+                # Another thread may have refreshed while this one waited
+                now = time.monotonic()
+                unknown = kid not in self._keys and now - self._fetched_at >= self.min_refresh_interval
+                if now >= self._expires_at or unknown:
+                    self.refresh()
+        return self._keys.get(kid)
+
+    def verify(self, token):
+        """
+        Verifies the signature and claims of `token`.
+
+        Returns:
+        - The token's claims.
+
+        Raises:
+        - jwt.InvalidTokenError if the token is malformed, expired, signed by an unknown key,
+          or of the wrong type.
+        """
+        kid = jwt.get_unverified_header(token).get('kid')
+        entry = self.get_key(kid)
+        if entry is None:
+            raise jwt.InvalidTokenError(f'Token is signed by an unknown key {kid!r}')
+        key, algorithm = entry
+        claims = jwt.decode(
+            token,
+            key.key,
+            algorithms=[algorithm],
+            audience=self.audience,
+            issuer=self.issuer,
+            options={'verify_aud': self.audience is not None, 'require': ['exp']},
+        )
+        if self.token_type is not None and claims.get('token_type') != self.token_type:
+            raise jwt.InvalidTokenError(f"Expected a token of type {self.token_type!r}")
+        return claims
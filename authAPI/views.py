@@ -0,0 +1,190 @@
+import asyncio
+import io
+import json
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+
+from django.conf import settings
+from django.db import connections
+from django.http import HttpRequest, HttpResponse, QueryDict
+from django.urls import Resolver404, resolve
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from authAPI.middleware import SAFE_METHODS, ReplicaPinningMiddleware
+from authAPI.routers import pin_primary
+
+logger = logging.getLogger(__name__)
+
+
+class BatchView(APIView):
+    """
+    Executes several account/product API calls in a single round trip.
+
+    The batch is authenticated once; sub-requests reuse the resolved user and skip the
+    middleware stack. Consecutive reads run concurrently, writes run one at a time in
+    the order given, and everything after a write reads from the primary database.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, format=None):
+        """
+        Runs the sub-requests in `requests` and returns their responses in order.
+
+        Args:
+        - request: The HTTP request object with a list of `{"method", "path", "body"}` items,
+          either as the body itself or under `requests`.
+
+        Returns:
+        - JSON list of `{"status", "headers", "body"}` results, or 400 for an invalid batch.
+          JSON bodies are inlined; any other body is returned as a string.
+        """
+        items = request.data.get('requests') if isinstance(request.data, dict) else request.data
+        if not isinstance(items, list) or not items:
+            return Response({'error': 'Expected a non-empty list of requests.'}, status=status.HTTP_400_BAD_REQUEST)
+        if len(items) > settings.BATCH_MAX_REQUESTS:
+            return Response(
+                {'error': f'A batch may contain at most {settings.BATCH_MAX_REQUESTS} requests.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            subrequests = [self.build_subrequest(request, item) for item in items]
+        except ValueError as exc:
+            return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        results = [None] * len(subrequests)
+        pinned = ReplicaPinningMiddleware.cookie_name in request.COOKIES
+        workers = settings.BATCH_MAX_WORKERS
+        with ThreadPoolExecutor(max_workers=workers) if workers > 1 else _InlineExecutor() as executor:
+            index = 0
+            while index < len(subrequests):
+                if subrequests[index].method not in SAFE_METHODS:
+                    results[index] = self.execute(subrequests[index], pinned=True)
+                    pinned = pinned or results[index]['status'] < 400
+                    index += 1
+                    continue
+                # Run the whole run of consecutive reads at once
+                end = index
+                while end < len(subrequests) and subrequests[end].method in SAFE_METHODS:
+                    end += 1
+                futures = {
+                    position: executor.submit(copy_context().run, self.execute_in_thread, subrequests[position], pinned)
+                    for position in range(index, end)
+                }
+                for position, future in futures.items():
+                    results[position] = future.result()
+                index = end
+        # Sub-response JSON bodies are embedded as they are instead of being parsed and re-encoded
+        content = '[' + ','.join(
+            json.dumps({'status': result['status'], 'headers': result['headers']})[:-1] + ', "body": ' + result['body'] + '}'
+            for result in results
+        ) + ']'
+        return HttpResponse(content, content_type='application/json')
+
+    def build_subrequest(self, request, item):
+        """
+        Builds an HttpRequest for one batch item, sharing the batch's user and session.
+        """
+        if not isinstance(item, dict):
+            raise ValueError('Each request must be an object with "method" and "path".')
+        method = str(item.get('method', 'GET')).upper()
+        path, _, query = str(item.get('path', '')).partition('?')
+        if not path.startswith(tuple(settings.BATCH_ALLOWED_PREFIXES)):
+            raise ValueError(f'Path is not allowed in a batch: {path}')
+        body = json.dumps(item['body']).encode() if item.get('body') is not None else b''
+
+        subrequest = HttpRequest()
+        subrequest.method = method
+        subrequest.path = subrequest.path_info = path
+        subrequest.META = {
+            key: value for key, value in request.META.items()
+            if key.isupper() and key not in ('HTTP_AUTHORIZATION', 'CONTENT_TYPE', 'CONTENT_LENGTH')
+        }
+        subrequest.META.update({
+            'REQUEST_METHOD': method,
+            'PATH_INFO': path,
+            'QUERY_STRING': query,
+            'CONTENT_TYPE': 'application/json',
+            'CONTENT_LENGTH': str(len(body)),
+        })
+        subrequest.GET = QueryDict(query)
+        subrequest.COOKIES = request.COOKIES
+        subrequest._stream = io.BytesIO(body)
+        subrequest._read_started = False
+        # Authenticated (and CSRF-checked) once for the whole batch
+        subrequest.user = request.user
+        subrequest.session = request._request.session
+        subrequest._dont_enforce_csrf_checks = True
+        return subrequest
+
+    def execute(self, subrequest, pinned):
+        """
+        Dispatches one sub-request to its view and returns the serialized result.
+
+        Long-polls (`wait`), async views and streaming responses are refused with a 400
+        result: they would hold the whole batch open or have no body to embed.
+        """
+        if 'wait' in subrequest.GET:
+            return self.error_result(status.HTTP_400_BAD_REQUEST, 'Long-polling (wait) is not supported in a batch.')
+        token = pin_primary.set(pinned or subrequest.method not in SAFE_METHODS)
+        try:
+            match = resolve(subrequest.path_info)
+            if asyncio.iscoroutinefunction(match.func):
+                return self.error_result(status.HTTP_400_BAD_REQUEST, 'Streaming endpoints cannot be batched.')
+            subrequest.resolver_match = match
+            response = match.func(subrequest, *match.args, **match.kwargs)
+            if callable(getattr(response, 'render', None)):
+                response = response.render()
+            if response.streaming:
+                response.close()
+                return self.error_result(status.HTTP_400_BAD_REQUEST, 'Streaming responses cannot be batched.')
+            return self.serialize(response)
+        except Resolver404:
+            return self.error_result(status.HTTP_404_NOT_FOUND, 'Not found.')
+        except Exception:
+            logger.exception('Batch sub-request %s %s failed', subrequest.method, subrequest.path)
+            return self.error_result(status.HTTP_500_INTERNAL_SERVER_ERROR, 'Internal error.')
+        finally:
+            pin_primary.reset(token)
+
+    def execute_in_thread(self, subrequest, pinned):
+        try:
+            return self.execute(subrequest, pinned)
+        finally:
+            if settings.BATCH_MAX_WORKERS > 1:
+                connections.close_all()
+
+    @staticmethod
+    def error_result(status_code, message):
+        return {'status': status_code, 'headers': {}, 'body': json.dumps({'error': message})}
+
+    @staticmethod
+    def serialize(response):
+        """
+        Returns the status, selected headers and the body as JSON text.
+        """
+        headers = {key: response[key] for key in ('Content-Type', 'Location', 'ETag') if response.has_header(key)}
+        body = response.content.decode(response.charset or 'utf-8')
+        if not headers.get('Content-Type', '').startswith('application/json'):
+            body = json.dumps(body)
+        return {'status': response.status_code, 'headers': headers, 'body': body or 'null'}
+
+
+class _InlineExecutor:
+    """
+    Minimal executor stand-in that runs submitted calls immediately.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def submit(self, func, *args):
+        future = Future()
+        future.set_result(func(*args))
+        return future
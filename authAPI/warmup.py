@@ -0,0 +1,193 @@
+"""
+Worker warm-up, run by `authAPI.wsgi` and `authAPI.asgi` before the worker serves requests.
+
+The first requests of a fresh worker would otherwise pay for:
+- imports: the DRF and simplejwt classes named in settings, which are imported lazily;
+- urls: importing every URLconf and view module and building the URL resolvers;
+- templates: compiling the templates into the per-process cached loader;
+- database: checking that the primary and every replica are reachable; replicas that are
+  down are reported as degraded without failing the step;
+- caches: loading the signing keys, the OpenAPI schema, the revoked token sessions and,
+  with `PRODUCT_SEARCH_BACKEND = 'memory'`, the catalog read model.
+
+Each step is timed and the total is written to stderr as `[warmup] ...`. `/ready` answers
+503 until every step has succeeded, so load balancers only route to warmed workers. A step
+that failed (e.g. the database was still starting) is retried by the next readiness probe.
+
+drf_yasg is not imported: the schema is precomputed and the documentation UIs import it
+on first use (see `authAPI.schema`).
+"""
+import logging
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+from django.http import JsonResponse
+from django.template.loader import get_template
+from django.urls import get_resolver
+from django.views.decorators.http import require_GET
+
+logger = logging.getLogger(__name__)
+
+
+def import_modules():
+    from rest_framework.settings import api_settings
+    from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+    # Reading the settings imports the classes they name
+    for name in ('DEFAULT_AUTHENTICATION_CLASSES', 'DEFAULT_PERMISSION_CLASSES', 'DEFAULT_RENDERER_CLASSES',
+                 'DEFAULT_PARSER_CLASSES', 'DEFAULT_CONTENT_NEGOTIATION_CLASS', 'DEFAULT_PAGINATION_CLASS'):
+        getattr(api_settings, name)
+    jwt_settings.AUTH_TOKEN_CLASSES
+
+
+def populate_urls():
+    # Imports every URLconf, and with it every view module, then builds the lookup tables
+    resolver = get_resolver()
+    resolver.reverse_dict
+    resolver.resolve('/')
+
+
+def compile_templates():
+    for directory in settings.TEMPLATES[0]['DIRS']:
+        for path in sorted(Path(directory).rglob('*.html')):
+            get_template(path.relative_to(directory).as_posix())
+
+
+def connect_databases():
+    # Only the primary is required: `ReplicaRouter` sends reads to it while replicas are down
+    connections[DEFAULT_DB_ALIAS].ensure_connection()
+    degraded = []
+    for alias in settings.DATABASE_REPLICAS:
+        try:
+            connections[alias].ensure_connection()
+        except DatabaseError:
+            logger.warning('Replica %s is unavailable', alias, exc_info=True)
+            degraded.append(alias)
+    return {'degraded': degraded} if degraded else None
+
+
+def load_caches():
+    from account.tokens import revocations
+    from authAPI.schema import load_schema
+    from authAPI.signing import get_token_backend
+    from products.read_model import catalog
+
+    get_token_backend()
+    # Without the build artifact the schema would be generated, importing drf_yasg
+    if os.path.exists(settings.OPENAPI_SCHEMA_PATH):
+        load_schema()
+    revocations.sync(full=True)
+    if settings.PRODUCT_SEARCH_BACKEND == 'memory':
+        catalog.refresh(full=True)
+
+
+STEPS = [
+    ('imports', import_modules),
+    ('urls', populate_urls),
+    ('templates', compile_templates),
+    ('database', connect_databases),
+    ('caches', load_caches),
+]
+
+
+class WarmUp:
+    """
+    Runs the warm-up steps once per process and keeps their outcome for the readiness check.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.steps = {}
+        self.seconds = None
+
+    @property
+    def ready(self):
+        return len(self.steps) == len(STEPS) and all('error' not in step for step in self.steps.values())
+
+    def run(self, blocking=True):
+        """
+        Runs the steps that have not succeeded yet.
+
+        Returns:
+        - Whether every step has succeeded; False without waiting when `blocking` is false and
+          another thread is warming up.
+        """
+        if not self._lock.acquire(blocking=blocking):
+            return False
+        try:
+            if self.ready:
+                return True
+            start = time.monotonic()
+            for name, step in STEPS:
+                if name in self.steps and 'error' not in self.steps[name]:
+                    continue
+                step_start = time.monotonic()
+                try:
+                    details = step()
+                except Exception as exc:
+                    logger.exception('Warm-up step %s failed', name)
+                    self.steps[name] = {'seconds': round(time.monotonic() - step_start, 3), 'error': str(exc)}
+                else:
+                    self.steps[name] = {'seconds': round(time.monotonic() - step_start, 3), **(details or {})}
+            self.seconds = round((self.seconds or 0) + time.monotonic() - start, 3)
+            self.report()
+            return self.ready
+        finally:
+            self._lock.release()
+
+    def report(self):
+        details = ', '.join(
+            f"{name} {'failed' if 'error' in step else '%.2fs' % step['seconds']}"
+            + (f" (degraded: {', '.join(step['degraded'])})" if step.get('degraded') else '')
+            for name, step in self.steps.items()
+        )
+        outcome = 'ready' if self.ready else 'not ready'
+        sys.stderr.write(f'[warmup] worker {os.getpid()} {outcome} after {self.seconds:.2f}s ({details})\n')
+
+    def reset(self):
+        with self._lock:
+            self.steps = {}
+            self.seconds = None
+
+
+warm_up = WarmUp()
+
+
+def warm_up_worker():
+    """
+    Warms up the process while `authAPI.wsgi` or `authAPI.asgi` is imported.
+
+    The database connections opened meanwhile are closed again. They belong to the importing
+    thread, which under ASGI is not the one running requests, and with `gunicorn --preload`
+    they would be shared by the forked workers.
+    """
+    warm_up.run()
+    connections.close_all()
+
+
+@require_GET
+def readiness_view(request):
+    """
+    Tells load balancers whether this worker has warmed up.
+
+    Args:
+    - request: The HTTP request object.
+
+    Returns:
+    - JSON with the warm-up time and steps; 200 once every step has succeeded, 503 before.
+      Failed steps are retried by the probe. Unavailable replicas are listed as `degraded`
+      in the database step but do not make the worker unready.
+    """
+    if settings.WORKER_WARMUP:
+        ready = warm_up.ready or warm_up.run(blocking=False)
+    else:
+        ready = True
+    response = JsonResponse({'ready': ready, 'warmup_seconds': warm_up.seconds, 'steps': warm_up.steps},
+                            status=200 if ready else 503)
+    response['Cache-Control'] = 'no-store'
+    return response
@@ -3,6 +3,9 @@ WSGI config for authAPI project.
 
 It exposes the WSGI callable as a module-level variable named ``application``.
 
+The worker warms up (see ``authAPI/warmup.py``) before the server receives the
+application, so its first requests do not pay for imports, templates and caches.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/4.2/howto/deployment/wsgi/
 """
@@ -14,3 +17,10 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'authAPI.settings')
 
 application = get_wsgi_application()
+
+from django.conf import settings  # noqa: E402
+
+if settings.WORKER_WARMUP:
+    from authAPI.warmup import warm_up_worker
+
+    warm_up_worker()
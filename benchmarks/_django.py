@@ -0,0 +1,64 @@
+"""
+Shared bootstrap for the benchmark scripts.
+
+Each benchmark runs against a throwaway test database created from the configured
+`default` connection, so it never touches real data:
+
+    python -m benchmarks.bench_available_products --sizes 10000,100000
+"""
+import os
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+def setup():
+    """
+    Configures Django for a standalone benchmark script.
+    """
+    if str(BASE_DIR) not in sys.path:
+        sys.path.insert(0, str(BASE_DIR))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'authAPI.settings')
+    import django
+    django.setup()
+
+
+@contextmanager
+def bench_database(verbosity=0):
+    """
+    Creates a disposable test database for the duration of the block.
+    """
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    setup_test_environment()
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=verbosity, autoclobber=True, serialize=False)
+    try:
+        yield connection
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity)
+        teardown_test_environment()
+
+
+def timed(func, repeat=5):
+    """
+    Runs `func` `repeat` times and returns (best, median) wall time in milliseconds.
+    """
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return min(samples), statistics.median(samples)
+
+
+def parse_sizes(value):
+    """
+    Parses a comma separated list of catalog sizes, e.g. "1000,10000".
+    """
+    return [int(size) for size in value.split(',') if size]
@@ -0,0 +1,46 @@
+"""
+Times catalog analytics: the uncached aggregate queries and the cached response path.
+"""
+import argparse
+import random
+
+from benchmarks._django import bench_database, parse_sizes, setup, timed
+
+
+def run(sizes, repeat):
+    from django.core.cache import cache
+
+    from account.models import User
+    from products.analytics import catalog_analytics, compute_catalog_analytics
+    from products.models import Product, ProductReport
+
+    user = User.objects.create_user(email='bench@example.com', password='benchpass123', name='Bench', tc=True)
+    print(f"{'size':>10} {'path':<10} {'best ms':>10} {'median ms':>10}")
+    for size in sizes:
+        Product.objects.all().delete()
+        for start in range(0, size, 10000):
+            Product.objects.bulk_create([
+                Product(name=f'Product {i}', description='', price=random.randint(100, 100000) / 100,
+                        available_stock=random.randint(0, 100), selected_by=user if random.random() < 0.3 else None)
+                for i in range(start, min(start + 10000, size))
+            ])
+        product_ids = list(Product.objects.values_list('id', flat=True)[:1000])
+        ProductReport.objects.bulk_create(
+            [ProductReport(product_id=random.choice(product_ids), reported_by=user, reason='x') for _ in range(size // 100)]
+        )
+        best, median = timed(lambda: compute_catalog_analytics(10), repeat)
+        print(f'{size:>10} {"uncached":<10} {best:>10.2f} {median:>10.2f}')
+        cache.clear()
+        catalog_analytics(10)
+        best, median = timed(lambda: catalog_analytics(10), repeat)
+        print(f'{size:>10} {"cached":<10} {best:>10.3f} {median:>10.3f}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=parse_sizes, default=parse_sizes('10000,100000,1000000'))
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    setup()
+    with bench_database():
+        run(args.sizes, args.repeat)
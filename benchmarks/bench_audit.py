@@ -0,0 +1,54 @@
+"""
+Measures what the authentication audit trail adds to an auth request.
+
+Compares writing one `AuthEvent` row per event (what a synchronous INSERT in the view
+would cost) with appending it to the `account.audit` buffer, and reports how long the
+buffered events then take to write in batches.
+"""
+import argparse
+
+from benchmarks._django import bench_database, setup, timed
+
+
+def run(count, repeat):
+    from django.test import RequestFactory, override_settings
+
+    from account.audit import audit_log
+    from account.models import AuthEvent, User
+
+    user = User.objects.create_user(email='bench@example.com', name='Bench', tc=True, password='bench')
+    request = RequestFactory().post('/login/', HTTP_USER_AGENT='bench')
+
+    def insert():
+        for _ in range(count):
+            AuthEvent.objects.create(user=user, email=user.email, kind=AuthEvent.LOGIN, ip_address='127.0.0.1',
+                                     user_agent='bench')
+
+    def record():
+        for _ in range(count):
+            audit_log.record(AuthEvent.LOGIN, request, user=user)
+
+    with override_settings(AUTH_AUDIT_BACKGROUND_FLUSH=False, AUTH_AUDIT_BATCH_SIZE=count + 1,
+                           AUTH_AUDIT_MAX_PENDING=count + 1):
+        _, sync_ms = timed(insert, repeat)
+        _, record_ms = timed(record, repeat)
+        audit_log.clear()
+        print(f"{'synchronous INSERT per event':<36} {sync_ms / count * 1000:>8.1f} us/event in the request")
+        print(f"{'buffered record()':<36} {record_ms / count * 1000:>8.1f} us/event in the request")
+        for batch_size in (100, 500):
+            with override_settings(AUTH_AUDIT_BATCH_SIZE=batch_size):
+                def flush():
+                    record()
+                    audit_log.flush()
+                _, flush_ms = timed(flush, repeat)
+            print(f"{f'bulk_create in batches of {batch_size}':<36} {(flush_ms - record_ms) / count * 1000:>8.1f} us/event in the flusher")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=2000, help='Events per timed run.')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    setup()
+    with bench_database():
+        run(args.count, args.repeat)
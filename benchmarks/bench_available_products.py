@@ -0,0 +1,69 @@
+"""
+Benchmarks available-product lookups and the "my selections" listing.
+
+Populates catalogs of increasing size where a fraction of products is selected,
+then times the queries behind `?available_only=true` and `/api/products/selected/`
+and prints the query plan so index usage can be checked.
+"""
+import argparse
+import random
+
+from benchmarks._django import bench_database, parse_sizes, setup, timed
+
+
+def populate(size, users, selected_ratio, batch_size=5000):
+    from products.models import Product
+
+    Product.objects.all().delete()
+    batch = []
+    for i in range(size):
+        selected_by = random.choice(users) if random.random() < selected_ratio else None
+        batch.append(Product(
+            name=f'Product {i:08d}', description='', price=i % 1000, available_stock=i % 50,
+            selected_by=selected_by,
+        ))
+        if len(batch) >= batch_size:
+            Product.objects.bulk_create(batch)
+            batch = []
+    Product.objects.bulk_create(batch)
+
+
+def run(sizes, selected_ratio, repeat):
+    from account.models import User
+    from products.models import Product
+
+    users = User.objects.bulk_create([
+        User(email=f'bench{i}@example.com', name=f'Bench {i}', tc=True, password='!') for i in range(100)
+    ])
+    user = users[0]
+    print(f"{'size':>10} {'query':<28} {'best ms':>10} {'median ms':>10}")
+    for size in sizes:
+        populate(size, users, selected_ratio)
+        queries = {
+            'available count': lambda: Product.objects.filter(selected_by__isnull=True).count(),
+            'available first page': lambda: list(
+                Product.objects.filter(selected_by__isnull=True).order_by('name').values('id', 'name')[:50]
+            ),
+            'my selections page': lambda: list(
+                user.selected_products.order_by('id').values('id', 'name')[:50]
+            ),
+        }
+        for label, query in queries.items():
+            best, median = timed(query, repeat)
+            print(f'{size:>10} {label:<28} {best:>10.2f} {median:>10.2f}')
+    print()
+    print('Plan (available first page):')
+    print(Product.objects.filter(selected_by__isnull=True).order_by('name').values('id', 'name')[:50].explain())
+    print('Plan (my selections page):')
+    print(user.selected_products.order_by('id').values('id', 'name')[:50].explain())
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=parse_sizes, default=parse_sizes('10000,100000,1000000'))
+    parser.add_argument('--selected-ratio', type=float, default=0.9)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    setup()
+    with bench_database():
+        run(args.sizes, args.selected_ratio, args.repeat)
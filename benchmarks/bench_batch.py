@@ -0,0 +1,52 @@
+"""
+Compares one /api/batch/ call against the same API calls issued sequentially.
+
+Requests go through the full in-process middleware stack, so the difference is the
+per-request authentication, session and middleware overhead (network round trips
+would add to the sequential total).
+"""
+import argparse
+
+from benchmarks._django import bench_database, setup, timed
+
+
+def run(products, repeat):
+    from django.test import Client
+
+    from account.models import User
+    from products.models import Product
+
+    user = User.objects.create_user(email='bench@example.com', password='benchpass123', name='Bench', tc=True)
+    Product.objects.bulk_create(
+        [Product(name=f'Product {i}', description='', price=i, available_stock=i) for i in range(products)]
+    )
+    calls = [
+        {'method': 'GET', 'path': '/api/products/search/?query=Product 1&fields=id,name'},
+        {'method': 'GET', 'path': '/api/products/search/?query=Product 2&fields=id,name'},
+        {'method': 'GET', 'path': '/api/products/selected/'},
+        {'method': 'GET', 'path': '/api/products/search/?available_only=true&fields=id'},
+    ]
+    client = Client()
+    client.force_login(user)
+
+    def sequential():
+        for call in calls:
+            client.get(call['path'])
+
+    def batched():
+        client.post('/api/batch/', calls, content_type='application/json')
+
+    print(f"{'mode':<12} {'calls':>6} {'best ms':>10} {'median ms':>10}")
+    for label, func in (('sequential', sequential), ('batch', batched)):
+        best, median = timed(func, repeat)
+        print(f'{label:<12} {len(calls):>6} {best:>10.2f} {median:>10.2f}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--products', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+    setup()
+    with bench_database():
+        run(args.products, args.repeat)
@@ -0,0 +1,58 @@
+"""
+Measures bytes saved and CPU cost of response compression per body size and level.
+
+Bodies are JSON product rows similar to ProductSearchView output, so ratios reflect
+what the API actually sends.
+"""
+import argparse
+import json
+import time
+
+from benchmarks._django import parse_sizes, setup
+
+
+def make_body(size):
+    rows, length, i = [], 2, 0
+    while length < size:
+        row = {'id': i, 'name': f'Product {i}', 'description': f'Description of product number {i}',
+               'price': f'{i % 1000}.00', 'available_stock': i % 50}
+        rows.append(row)
+        length += len(json.dumps(row)) + 2
+        i += 1
+    return json.dumps(rows).encode()[:size]
+
+
+def cpu_ms(func, repeat):
+    start = time.process_time()
+    for _ in range(repeat):
+        func()
+    return (time.process_time() - start) * 1000 / repeat
+
+
+def run(sizes, repeat):
+    from authAPI.middleware import StreamCompressor, brotli
+
+    configs = [('gzip', level) for level in (1, 6, 9)]
+    if brotli is not None:
+        configs += [('br', quality) for quality in (1, 5, 11)]
+    else:
+        print('brotli is not installed; only gzip is measured\n')
+
+    print(f"{'body':>10} {'encoding':<8} {'level':>5} {'bytes out':>10} {'saved':>7} {'cpu ms':>9}")
+    for size in sizes:
+        body = make_body(size)
+        for encoding, level in configs:
+            def compress():
+                compressor = StreamCompressor(encoding, level)
+                return compressor.compress(body) + compressor.finish()
+            out = len(compress())
+            print(f'{size:>10} {encoding:<8} {level:>5} {out:>10} {1 - out / size:>7.1%} {cpu_ms(compress, repeat):>9.3f}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=parse_sizes, default=parse_sizes('1024,10240,102400,1048576'))
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+    setup()
+    run(args.sizes, args.repeat)
@@ -0,0 +1,93 @@
+"""
+Concurrent editors incrementing the same product's stock, with and without optimistic concurrency.
+
+Each editor thread reads the product, waits `--think-ms` (the time a user spends editing),
+then writes stock + 1. `save()` rewrites the row unconditionally and loses the updates of
+editors who read the same version. The API path PATCHes with `If-Match` and re-reads on 412,
+so the final stock always equals the number of edits. Reports the lost updates, retries and
+throughput of both; the API path's throughput includes the request handling.
+
+SQLite serializes writers, so run it against PostgreSQL (or a file-backed SQLite test database).
+"""
+import argparse
+import logging
+import threading
+import time
+
+from benchmarks._django import bench_database, setup
+
+
+def save_editor(product_id, edits, think, stats):
+    from products.models import Product
+
+    for _ in range(edits):
+        product = Product.objects.get(id=product_id)
+        time.sleep(think)
+        product.available_stock += 1
+        product.save()
+
+
+def api_editor(product_id, edits, think, stats, user):
+    from django.test import Client
+    from django.urls import reverse
+
+    client = Client()
+    client.force_login(user)
+    url = reverse('product-detail', args=[product_id])
+    for _ in range(edits):
+        while True:
+            current = client.get(url)
+            time.sleep(think)
+            response = client.patch(
+                url, {'available_stock': current.json()['available_stock'] + 1},
+                content_type='application/json', HTTP_IF_MATCH=current['ETag'],
+            )
+            if response.status_code == 200:
+                break
+            assert response.status_code == 412, response.content
+            with stats['lock']:
+                stats['retries'] += 1
+
+
+def run(editors, edits, think):
+    from django.db import close_old_connections
+
+    from account.models import User
+    from products.models import Product
+
+    # Every retry is a 412, which Django logs as a warning
+    logging.getLogger('django.request').setLevel(logging.ERROR)
+    user = User.objects.create_user(email='bench@example.com', name='Bench', tc=True, password='bench')
+    print(f"{'mode':<12} {'editors':>8} {'edits':>7} {'final':>7} {'lost':>6} {'retries':>8} {'edits/s':>9}")
+    for mode, editor, extra in [('save()', save_editor, ()), ('If-Match', api_editor, (user,))]:
+        product = Product.objects.create(name='Contended', description='', price=1, available_stock=0)
+        stats = {'lock': threading.Lock(), 'retries': 0}
+
+        def work():
+            try:
+                editor(product.id, edits, think, stats, *extra)
+            finally:
+                close_old_connections()
+
+        threads = [threading.Thread(target=work) for _ in range(editors)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        total = editors * edits
+        final = Product.objects.get(id=product.id).available_stock
+        print(f'{mode:<12} {editors:>8} {total:>7} {final:>7} {total - final:>6} {stats["retries"]:>8} '
+              f'{total / elapsed:>9.0f}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--editors', type=int, default=8)
+    parser.add_argument('--edits', type=int, default=25, help='Successful edits per editor.')
+    parser.add_argument('--think-ms', type=float, default=2)
+    args = parser.parse_args()
+    setup()
+    with bench_database():
+        run(args.editors, args.edits, args.think_ms / 1000)
@@ -0,0 +1,96 @@
+"""
+Measures time to first byte, total time and peak memory of the dashboard render.
+
+Compares the full in-memory render with the streamed render (`DASHBOARD_STREAM`) at
+increasing catalog sizes. Each render runs in a forked process so its peak resident
+memory is measured on its own; this relies on /proc and only works on Linux.
+"""
+import argparse
+import os
+import time
+
+from benchmarks._django import bench_database, parse_sizes, setup
+
+
+def populate(size, batch_size=5000):
+    from products.models import Product
+
+    Product.objects.all().delete()
+    batch = []
+    for i in range(size):
+        batch.append(Product(name=f'Product {i:08d}', description='Benchmark product', price=i % 1000,
+                             available_stock=i % 50))
+        if len(batch) >= batch_size:
+            Product.objects.bulk_create(batch)
+            batch = []
+    Product.objects.bulk_create(batch)
+
+
+def memory_status(field):
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith(field + ':'):
+                return int(line.split()[1])  # kB
+
+
+def measure(client, url, stream):
+    """
+    Renders the dashboard in a child process and returns (ttfb ms, total ms, peak growth kB, bytes).
+    """
+    from django.test import override_settings
+
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        # Resets the peak resident size to the current one
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        baseline = memory_status('VmRSS')
+        with override_settings(DASHBOARD_STREAM=stream):
+            start = time.perf_counter()
+            response = client.get(url)
+            if response.streaming:
+                chunks = iter(response.streaming_content)
+                size = len(next(chunks))
+                ttfb = time.perf_counter() - start
+                size += sum(len(chunk) for chunk in chunks)
+            else:
+                size = len(response.content)
+                ttfb = time.perf_counter() - start
+            total = time.perf_counter() - start
+        peak = memory_status('VmHWM') - baseline
+        os.write(write_fd, f'{ttfb * 1000} {total * 1000} {peak} {size}'.encode())
+        os._exit(0)
+    os.close(write_fd)
+    with os.fdopen(read_fd) as f:
+        result = f.read()
+    os.waitpid(pid, 0)
+    ttfb, total, peak, size = result.split()
+    return float(ttfb), float(total), int(peak), int(size)
+
+
+def run(sizes):
+    from django.test import Client
+    from django.urls import reverse
+
+    from account.models import User
+
+    user = User.objects.create_user(email='bench@example.com', name='Bench', tc=True, password='bench')
+    client = Client()
+    client.force_login(user)
+    print(f"{'size':>10} {'mode':<8} {'ttfb ms':>10} {'total ms':>10} {'peak MB':>9} {'MB sent':>9}")
+    for size in sizes:
+        populate(size)
+        for mode, stream in [('full', False), ('stream', True)]:
+            ttfb, total, peak, sent = measure(client, reverse('dashboard'), stream)
+            print(f'{size:>10} {mode:<8} {ttfb:>10.1f} {total:>10.1f} {peak / 1024:>9.1f} {sent / (1 << 20):>9.1f}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=parse_sizes, default=parse_sizes('1000,10000,50000'))
+    args = parser.parse_args()
+    setup()
+    with bench_database():
+        run(args.sizes)
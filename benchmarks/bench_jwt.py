@@ -0,0 +1,52 @@
+"""
+Measures token issue and verify throughput per signing algorithm.
+
+`verify (local)` is what other services pay per request with `authAPI.verifier.TokenVerifier`
+once the key set is cached; `verify (backend)` is this app's own check in JWTAuthentication.
+"""
+import argparse
+import time
+
+from benchmarks._django import setup, timed
+
+
+def ops_per_second(func, count, repeat):
+    _, median = timed(lambda: [func() for _ in range(count)], repeat)
+    return count / (median / 1000)
+
+
+def run(count, repeat):
+    from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+    from rest_framework_simplejwt import state
+
+    from authAPI.signing import KeyRingTokenBackend, SigningKey
+    from authAPI.verifier import TokenVerifier
+
+    payload = {'token_type': 'access', 'user_id': 1, 'jti': '0' * 32, 'exp': int(time.time()) + 3600}
+    backends = [('HS256', state.token_backend, None)]
+    for algorithm, private_key in [
+        ('RS256', rsa.generate_private_key(public_exponent=65537, key_size=2048)),
+        ('EdDSA', ed25519.Ed25519PrivateKey.generate()),
+    ]:
+        key = SigningKey(private_key)
+        backends.append((algorithm, KeyRingTokenBackend([key]), key))
+
+    print(f"{'algorithm':<10} {'issue/s':>10} {'verify (backend)/s':>19} {'verify (local)/s':>17} {'token bytes':>12}")
+    for algorithm, backend, key in backends:
+        token = backend.encode(payload)
+        issue = ops_per_second(lambda: backend.encode(payload), count, repeat)
+        verify = ops_per_second(lambda: backend.decode(token), count, repeat)
+        local = '-'
+        if key is not None:
+            verifier = TokenVerifier('http://auth/.well-known/jwks.json', fetch=lambda: ({'keys': [key.jwk]}, 300))
+            local = f'{ops_per_second(lambda: verifier.verify(token), count, repeat):.0f}'
+        print(f'{algorithm:<10} {issue:>10.0f} {verify:>19.0f} {local:>17} {len(token):>12}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=2000, help='Operations per timed run.')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    setup()
+    run(args.count, args.repeat)
@@ -0,0 +1,68 @@
+"""
+Measures the per-increment cost of the application metrics and the cost of a scrape.
+
+With `--processes N` the metrics run in multi-process mode (a temporary
+PROMETHEUS_MULTIPROC_DIR): N worker processes increment the same counter and the
+merged scrape is checked to add up to the total of all workers.
+"""
+import argparse
+import multiprocessing
+import os
+import tempfile
+import time
+
+from benchmarks._django import setup
+
+
+def ns_per_call(func, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        func()
+    return (time.perf_counter() - start) * 1e9 / count
+
+
+def increment(count):
+    setup()
+    from authAPI.metrics import PRODUCT_REPORTS
+    for _ in range(count):
+        PRODUCT_REPORTS.inc()
+
+
+def run(count, processes):
+    from authAPI import metrics
+
+    cases = [
+        ('counter.inc()', metrics.PRODUCT_REPORTS.inc),
+        ('bound label .inc()', metrics.LOGIN_FAILED.inc),
+        ('.labels(...).inc()', lambda: metrics.LOGINS.labels('failure').inc()),
+        ('histogram.observe()', lambda: metrics.LOGIN_DURATION.observe(0.03)),
+    ]
+    mode = 'multi-process (mmap files)' if metrics.is_multiprocess() else 'single process (memory)'
+    print(f'mode: {mode}')
+    print(f"{'operation':<22} {'ns/call':>9}")
+    for label, func in cases:
+        print(f'{label:<22} {ns_per_call(func, count):>9.0f}')
+
+    if processes:
+        before = metrics.PRODUCT_REPORTS._value.get()
+        with multiprocessing.get_context('spawn').Pool(processes) as pool:
+            pool.map(increment, [count] * processes)
+        start = time.perf_counter()
+        body = metrics.render_metrics().decode()
+        scrape_ms = (time.perf_counter() - start) * 1000
+        total = next(float(line.split()[-1]) for line in body.splitlines() if line.startswith('product_reports_total '))
+        expected = before + count * processes
+        print(f'\nscrape of {processes + 1} processes: {scrape_ms:.2f} ms, '
+              f'product_reports_total={total:.0f} (expected {expected:.0f})')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count', type=int, default=200000, help='Increments per measurement.')
+    parser.add_argument('--processes', type=int, default=0, help='Worker processes for the multi-process check.')
+    args = parser.parse_args()
+    if args.processes:
+        # Must be set before prometheus_client is imported; spawned workers inherit it
+        os.environ['PROMETHEUS_MULTIPROC_DIR'] = tempfile.mkdtemp(prefix='metrics-bench-')
+    setup()
+    run(args.count, args.processes)
@@ -0,0 +1,47 @@
+"""
+Measures the request overhead of the memory profiling middleware.
+
+Times the product search with profiling disabled (the middleware removes itself),
+configured for the view but not sampled, and profiling every request, then prints the
+report of the profiled requests.
+"""
+import argparse
+import json
+
+from benchmarks._django import bench_database, setup, timed
+
+
+def run(size, requests, repeat):
+    from django.test import Client, override_settings
+    from django.urls import reverse
+
+    from account.models import User
+    from authAPI.profiling import profiler
+    from products.models import Product
+
+    Product.objects.bulk_create(
+        Product(name=f'Product {i:06d}', description='Benchmark product', price=i % 1000, available_stock=i % 50)
+        for i in range(size)
+    )
+    user = User.objects.create_user(email='bench@example.com', name='Bench', tc=True, password='bench')
+    url = reverse('product-search')
+    print(f"{'mode':<14} {'ms/request':>11}")
+    for mode, views, rate in [('disabled', [], 0), ('not sampled', ['product-search'], 0), ('profiled', ['product-search'], 1)]:
+        with override_settings(MEMORY_PROFILE_VIEWS=views, MEMORY_PROFILE_SAMPLE_RATE=rate, MEMORY_PROFILE_DIR=''):
+            # A new client loads the middleware with the current settings
+            client = Client()
+            client.force_login(user)
+            best, _ = timed(lambda: [client.get(url, {'query': 'Product'}) for _ in range(requests)], repeat)
+        print(f'{mode:<14} {best / requests:>11.2f}')
+    print(json.dumps(profiler.report(), indent=2))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=5000, help='Products returned by the search.')
+    parser.add_argument('--requests', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    setup()
+    with bench_database():
+        run(args.size, args.requests, args.repeat)
@@ -0,0 +1,89 @@
+"""
+Compares product search through the ORM with the in-memory catalog read model.
+
+For each catalog size this reports the snapshot build time and footprint, an incremental
+refresh after a batch of changes, then the time of a first page and of the full result
+set for selective and broad queries under each sort.
+"""
+import argparse
+import random
+import tracemalloc
+from datetime import timedelta
+
+from benchmarks._django import bench_database, parse_sizes, setup, timed
+
+WORDS = ['blue', 'red', 'green', 'steel', 'oak', 'mug', 'plate', 'lamp', 'chair', 'desk', 'rack', 'kettle']
+QUERIES = {'selective': 'kettle 0042', 'broad': 'blue'}
+SORTS = [('name', False), ('price', True), ('available_stock', False)]
+FIELDS = ('id', 'name', 'price', 'available_stock')
+
+
+def populate(size, batch_size=5000):
+    from products.models import Product
+
+    Product.objects.all().delete()
+    rng = random.Random(size)
+    batch = []
+    for i in range(size):
+        name = f'{rng.choice(WORDS).title()} {rng.choice(WORDS)} {i % 10000:04d}'
+        batch.append(Product(name=name, description='', price=rng.randint(100, 99999) / 100,
+                             available_stock=rng.randint(0, 500)))
+        if len(batch) >= batch_size:
+            Product.objects.bulk_create(batch)
+            batch = []
+    Product.objects.bulk_create(batch)
+
+
+def run(sizes, changes, repeat):
+    from django.test import override_settings
+    from django.utils import timezone
+
+    from products.models import Product
+    from products.read_model import catalog
+
+    print(f"{'size':>9} {'case':<44} {'orm ms':>9} {'memory ms':>10} {'rows':>8}")
+    for size in sizes:
+        populate(size)
+        # Backdated so that the incremental refresh below only sees the products changed by it
+        Product.objects.update(updated_at=timezone.now() - timedelta(hours=1))
+        catalog.reset()
+        tracemalloc.start()
+        catalog.refresh(full=True)
+        footprint = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        build, _ = timed(lambda: catalog.refresh(full=True), 1)
+        print(f'{size:>9} snapshot built in {build:.0f} ms, {footprint / (1 << 20):.1f} MB')
+
+        changed = list(Product.objects.order_by('?').values_list('id', flat=True)[:changes])
+        for product in Product.objects.filter(id__in=changed):
+            product.available_stock += 1
+            product.save(update_fields=['available_stock', 'updated_at'])
+        with override_settings(PRODUCT_READ_MODEL_MAX_DELTA=changes):
+            refresh, _ = timed(catalog.refresh, 1)
+        print(f'{size:>9} refresh after {changes} changes in {refresh:.0f} ms')
+
+        with override_settings(PRODUCT_READ_MODEL_REFRESH_SECONDS=3600):
+            for (label, query), (field, descending) in [(q, s) for q in QUERIES.items() for s in SORTS]:
+                products = Product.objects.filter(name__icontains=query).order_by(
+                    f"{'-' if descending else ''}{field}", 'id',
+                ).values(*FIELDS)
+                for scope, stop in [('page', 50), ('all', None)]:
+                    _, orm = timed(lambda: list(products[:stop]), repeat)
+                    results = catalog.search(query, field, descending=descending, fields=FIELDS)
+                    _, memory = timed(
+                        lambda: catalog.search(query, field, descending=descending, fields=FIELDS)[:stop], repeat,
+                    )
+                    rows = min(len(results), stop or len(results))
+                    case = f'{label} {field}{" desc" if descending else ""} ({scope})'
+                    print(f'{size:>9} {case:<44} {orm:>9.1f} {memory:>10.1f} {rows:>8}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=parse_sizes, default=parse_sizes('10000,100000,1000000'))
+    parser.add_argument('--changes', type=int, default=1000, help='Products changed before the incremental refresh.')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    setup()
+    with bench_database():
+        run(args.sizes, args.changes, args.repeat)
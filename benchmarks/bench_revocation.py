@@ -0,0 +1,76 @@
+"""
+Compares the revocation check of a token against the blacklist table with the in-memory list.
+
+For each number of revoked sessions this reports the time of a membership check through
+simplejwt's blacklist query and through `account.tokens.revocations` (half of the checked
+ids revoked), then the list's load time and footprint and the cost of an incremental sync.
+"""
+import argparse
+import tracemalloc
+import uuid
+from datetime import timedelta
+
+from benchmarks._django import bench_database, parse_sizes, setup, timed
+
+
+def populate(size, batch_size=5000):
+    from django.utils import timezone
+    from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+    BlacklistedToken.objects.all().delete()
+    OutstandingToken.objects.all().delete()
+    expires_at = timezone.now() + timedelta(days=1)
+    session_ids = [uuid.uuid4().hex for _ in range(size)]
+    for start in range(0, size, batch_size):
+        markers = OutstandingToken.objects.bulk_create(
+            OutstandingToken(jti=session_id, token='', expires_at=expires_at)
+            for session_id in session_ids[start:start + batch_size]
+        )
+        BlacklistedToken.objects.bulk_create(BlacklistedToken(token=marker) for marker in markers)
+    return session_ids
+
+
+def run(sizes, checks, repeat):
+    from django.test import override_settings
+    from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+    from account.tokens import revocations
+
+    print(f"{'revoked':>9} {'db us/check':>12} {'memory us/check':>16} {'load ms':>8} {'MB':>6} {'sync ms':>8}")
+    for size in sizes:
+        session_ids = populate(size)
+        probes = [session_ids[i % size] if i % 2 else uuid.uuid4().hex for i in range(checks)]
+
+        def check_db():
+            for session_id in probes:
+                BlacklistedToken.objects.filter(token__jti=session_id).exists()
+
+        with override_settings(TOKEN_REVOCATION_BACKGROUND_SYNC=False, TOKEN_REVOCATION_SYNC_SECONDS=3600):
+            revocations.reset()
+            tracemalloc.start()
+            revocations.sync(full=True)
+            footprint = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            load, _ = timed(lambda: revocations.sync(full=True), 1)
+
+            def check_memory():
+                for session_id in probes:
+                    session_id in revocations
+
+            db, _ = timed(check_db, repeat)
+            memory, _ = timed(check_memory, repeat)
+        with override_settings(TOKEN_REVOCATION_SYNC_SECONDS=0):
+            sync, _ = timed(revocations.sync, 1)
+        print(f'{size:>9} {db * 1000 / checks:>12.1f} {memory * 1000 / checks:>16.2f} {load:>8.0f} '
+              f'{footprint / (1 << 20):>6.1f} {sync:>8.1f}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=parse_sizes, default=parse_sizes('1000,100000,1000000'))
+    parser.add_argument('--checks', type=int, default=10000, help='Membership checks per measurement.')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    setup()
+    with bench_database():
+        run(args.sizes, args.checks, args.repeat)
@@ -0,0 +1,53 @@
+"""
+Measures ProductSearchView payload size and response time per projection/layout.
+
+Compares the default full rows against `fields=` projections and the columnar
+layout over catalogs with realistic description lengths.
+"""
+import argparse
+
+from benchmarks._django import bench_database, parse_sizes, setup, timed
+
+VARIANTS = {
+    'full rows': '',
+    'fields (no description)': 'fields=id,name,price,available_stock',
+    'fields + columnar': 'fields=id,name,price,available_stock&layout=columnar',
+    'columnar (all fields)': 'layout=columnar',
+}
+
+
+def run(sizes, description_length, repeat):
+    from django.test import Client
+
+    from account.models import User
+    from products.models import Product
+
+    user = User.objects.create_user(email='bench@example.com', password='benchpass123', name='Bench', tc=True)
+    client = Client()
+    client.force_login(user)
+    description = 'x' * description_length
+
+    print(f"{'size':>8} {'variant':<26} {'bytes':>12} {'best ms':>10} {'median ms':>10}")
+    for size in sizes:
+        Product.objects.all().delete()
+        Product.objects.bulk_create(
+            [Product(name=f'Product {i}', description=description, price=i % 1000, available_stock=i % 50)
+             for i in range(size)],
+            batch_size=5000,
+        )
+        for label, params in VARIANTS.items():
+            url = f'/api/products/search/?query=Product&{params}'
+            payload = len(client.get(url).content)
+            best, median = timed(lambda: client.get(url), repeat)
+            print(f'{size:>8} {label:<26} {payload:>12} {best:>10.2f} {median:>10.2f}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=parse_sizes, default=parse_sizes('1000,10000,50000'))
+    parser.add_argument('--description-length', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    setup()
+    with bench_database():
+        run(args.sizes, args.description_length, args.repeat)
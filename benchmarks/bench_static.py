@@ -0,0 +1,71 @@
+"""
+Measures static file request throughput through the full middleware stack.
+
+Compares `StaticFilesMiddleware` serving precompressed, content-hashed files (and 304
+revalidations) with `django.views.static.serve` plus on-the-fly compression, which is
+what `runserver` did for every request before.
+"""
+import argparse
+import json
+import os
+import tempfile
+
+from benchmarks._django import setup, timed
+
+FILES = ['admin/css/base.css', 'admin/js/actions.js', 'drf-yasg/swagger-ui-dist/swagger-ui-bundle.js']
+
+
+def run(static_root, count, repeat):
+    from django.core.management import call_command
+    from django.test import Client, RequestFactory, override_settings
+    from django.views.static import serve
+
+    from authAPI.middleware import CompressionMiddleware
+
+    with override_settings(STATIC_ROOT=static_root, STATIC_URL='/static/', ALLOWED_HOSTS=['*']):
+        if not os.path.exists(os.path.join(static_root, 'staticfiles.json')):
+            print(f'Collecting static files into {static_root} ...')
+            call_command('collectstatic', interactive=False, verbosity=0)
+        with open(os.path.join(static_root, 'staticfiles.json')) as f:
+            manifest = json.load(f)['paths']
+
+        client = Client(HTTP_ACCEPT_ENCODING='br, gzip')
+        factory = RequestFactory()
+        print(f"{'file':<48} {'case':<28} {'req/s':>9} {'bytes':>9}")
+        for name in FILES:
+            hashed = manifest[name]
+            url = f'/static/{hashed}'
+            first = client.get(url)
+            size = len(b''.join(first.streaming_content))
+
+            def middleware():
+                b''.join(client.get(url).streaming_content)
+
+            def revalidate():
+                client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+
+            compression = CompressionMiddleware(lambda request: serve(request, hashed, document_root=static_root))
+
+            def serve_and_compress():
+                response = compression(factory.get(url, HTTP_ACCEPT_ENCODING='br, gzip'))
+                return b''.join(response.streaming_content)
+
+            fallback_size = len(serve_and_compress())
+            cases = [
+                (f"middleware ({first.get('Content-Encoding', 'identity')})", middleware, size),
+                ('middleware 304', revalidate, 0),
+                ('static.serve + compression', serve_and_compress, fallback_size),
+            ]
+            for label, func, body_size in cases:
+                _, median = timed(lambda: [func() for _ in range(count)], repeat)
+                print(f'{name:<48} {label:<28} {count / (median / 1000):>9.0f} {body_size:>9}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--static-root', help='Collected static files to reuse; collected into a temporary directory otherwise.')
+    parser.add_argument('--count', type=int, default=200, help='Requests per timed run.')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    setup()
+    run(args.static_root or tempfile.mkdtemp(prefix='static-bench-'), args.count, args.repeat)
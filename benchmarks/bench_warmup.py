@@ -0,0 +1,78 @@
+"""
+Compares the first requests of a cold worker with those of a warmed one.
+
+Each case runs in a process forked before any view was imported or request served, which
+stands in for a freshly started worker. The warmed case runs `authAPI.warmup` first, as
+`authAPI.wsgi` does, and reports its duration. This relies on fork and only works on Unix.
+"""
+import argparse
+import os
+import time
+
+from benchmarks._django import bench_database, setup
+
+PATHS = ['/api/products/search/?query=Product', '/api/products/selected/', '/dashboard/']
+
+
+def measure(user, warm, requests):
+    """
+    Serves the requests in a child process and returns (warm-up ms, [first round ms per path], [later ms per path]).
+    """
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        from django.test import Client
+
+        warmup = 0
+        if warm:
+            from authAPI.warmup import warm_up_worker
+
+            start = time.perf_counter()
+            warm_up_worker()
+            warmup = (time.perf_counter() - start) * 1000
+        client = Client()
+        client.force_login(user)
+        rounds = []
+        for _ in range(requests):
+            timings = []
+            for path in PATHS:
+                start = time.perf_counter()
+                response = client.get(path)
+                if response.streaming:
+                    b''.join(response.streaming_content)
+                timings.append((time.perf_counter() - start) * 1000)
+            rounds.append(timings)
+        later = [min(column) for column in zip(*rounds[1:])] if requests > 1 else rounds[0]
+        os.write(write_fd, ' '.join(map(str, [warmup] + rounds[0] + later)).encode())
+        os._exit(0)
+    os.close(write_fd)
+    with os.fdopen(read_fd) as f:
+        values = [float(value) for value in f.read().split()]
+    os.waitpid(pid, 0)
+    return values[0], values[1:1 + len(PATHS)], values[1 + len(PATHS):]
+
+
+def run(requests):
+    from django.db import connections
+
+    from account.models import User
+    from products.models import Product
+
+    Product.objects.bulk_create(Product(name=f'Product {i}', description='', price=i) for i in range(200))
+    user = User.objects.create_user(email='bench@example.com', name='Bench', tc=True, password='bench')
+    # Children open their own connections
+    connections.close_all()
+    print(f"{'mode':<8} {'warm-up ms':>11} " + ' '.join(f'{path.split("?")[0]:>24}' for path in PATHS))
+    for mode, warm in [('cold', False), ('warmed', True)]:
+        warmup, first, later = measure(user, warm, requests)
+        print(f'{mode:<8} {warmup:>11.1f} ' + ' '.join(f'{ms:>14.1f} (then {best:>4.1f})' for ms, best in zip(first, later)))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=5, help='Rounds of requests per worker.')
+    args = parser.parse_args()
+    setup()
+    with bench_database():
+        run(args.requests)
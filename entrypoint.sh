@@ -1,17 +1,15 @@
 #!/bin/bash
+set -e
 
-# Wait for the database to be ready
-echo "Waiting for PostgreSQL to be ready..."
+# Metrics files left by previous workers would be merged into the new ones
+if [ -n "$PROMETHEUS_MULTIPROC_DIR" ]; then
+  rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+  mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+fi
 
-while ! nc -z db 5432; do
-  sleep 1
-done
+# Wait for the database (with backoff), apply pending migrations once per deploy and
+# collect static files only when they changed; each step's time is logged
+python manage.py prepare_container
 
-echo "PostgreSQL started."
-
-# Run migrations and collect static files
-python manage.py migrate
-python manage.py collectstatic --noinput
-
-# Start the Django development server
+# Run the container command (the ASGI server by default, see docker-compose.yml)
 exec "$@"
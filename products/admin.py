@@ -1,4 +1,77 @@
 from django.contrib import admin
-from .models import Product
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
 
-admin.site.register(Product)
+from authAPI.paginators import EstimatedCountPaginator
+from .models import Product, ProductEvent, ProductReport
+
+
+class ProductAdmin(admin.ModelAdmin):
+    list_display = ["id", "name", "price", "available_stock", "selected_by"]
+    list_select_related = ["selected_by"]
+    # `=id` hits the primary key; `^name` is served by the UPPER(name) pattern index
+    search_fields = ["=id", "^name"]
+    raw_id_fields = ["selected_by"]
+    readonly_fields = ["version"]
+    ordering = ["-id"]
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    actions = ["clear_selection", "mark_out_of_stock"]
+
+    def save_model(self, request, obj, form, change):
+        # Outstanding API edits based on the previous version must not overwrite this one
+        if change:
+            obj.version += 1
+        super().save_model(request, obj, form, change)
+
+    @admin.action(description="Clear selection of selected products")
+    def clear_selection(self, request, queryset):
+        with transaction.atomic():
+            updated = queryset.update(selected_by=None, updated_at=timezone.now(), version=F('version') + 1)
+            ProductEvent.record_many(queryset, ProductEvent.SELECTED)
+        self.message_user(request, f"Cleared selection on {updated} products.")
+
+    @admin.action(description="Mark selected products as out of stock")
+    def mark_out_of_stock(self, request, queryset):
+        with transaction.atomic():
+            updated = queryset.update(available_stock=0, updated_at=timezone.now(), version=F('version') + 1)
+            ProductEvent.record_many(queryset, ProductEvent.UPDATED)
+        self.message_user(request, f"Marked {updated} products as out of stock.")
+
+
+class RecentReportsFilter(admin.SimpleListFilter):
+    # Bounded `created_at` windows only touch the latest monthly partitions
+    title = "reported"
+    parameter_name = "reported"
+
+    def lookups(self, request, model_admin):
+        return [("7", "Last 7 days"), ("30", "Last 30 days"), ("90", "Last 90 days")]
+
+    def queryset(self, request, queryset):
+        if self.value() in {"7", "30", "90"}:
+            return queryset.recent(int(self.value()))
+        return queryset
+
+
+class ProductReportAdmin(admin.ModelAdmin):
+    list_display = ["id", "product", "reported_by", "created_at"]
+    list_select_related = ["product", "reported_by"]
+    list_filter = [RecentReportsFilter]
+    search_fields = ["=product__id", "=reported_by__email"]
+    raw_id_fields = ["product", "reported_by"]
+    # Served by the created_at index of each partition, newest month first
+    ordering = ["-created_at", "-id"]
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    actions = ["delete_reports"]
+
+    @admin.action(description="Delete selected reports without confirmation")
+    def delete_reports(self, request, queryset):
+        # Reports have no dependents, so this is a single DELETE rather than a per-row collection
+        deleted, _ = queryset.delete()
+        self.message_user(request, f"Deleted {deleted} reports.")
+
+
+admin.site.register(Product, ProductAdmin)
+admin.site.register(ProductReport, ProductReportAdmin)
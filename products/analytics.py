@@ -0,0 +1,108 @@
+"""
+Catalog summary statistics computed inside the database.
+
+Every figure is an aggregate query, so the cost does not depend on shipping rows to
+Python; results are cached for `PRODUCT_ANALYTICS_CACHE_SECONDS`.
+"""
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import Avg, Count, DecimalField, F, IntegerField, Max, Min, Q, Sum, Value
+from django.db.models.functions import Floor, Least
+from django.utils import timezone
+
+from .models import Product, ProductReport
+
+PERCENTILES = (0.25, 0.5, 0.75, 0.9, 0.99)
+TOP_REPORTED = 10
+
+
+def catalog_analytics(buckets=10):
+    """
+    Returns cached catalog statistics with a price histogram of `buckets` buckets.
+    """
+    key = f'products:analytics:{buckets}'
+    return cache.get_or_set(
+        key, lambda: compute_catalog_analytics(buckets), timeout=settings.PRODUCT_ANALYTICS_CACHE_SECONDS
+    )
+
+
+def compute_catalog_analytics(buckets=10):
+    products = Product.objects.all()
+    totals = products.aggregate(
+        product_count=Count('id'),
+        selected_count=Count('id', filter=Q(selected_by__isnull=False)),
+        total_stock=Sum('available_stock'),
+        stock_value=Sum(
+            F('price') * F('available_stock'), output_field=DecimalField(max_digits=20, decimal_places=2)
+        ),
+        price_min=Min('price'),
+        price_max=Max('price'),
+        price_avg=Avg('price'),
+    )
+    count = totals['product_count']
+    reports = ProductReport.objects.aggregate(
+        report_count=Count('id'), reported_products=Count('product_id', distinct=True)
+    )
+    top_reported = list(
+        ProductReport.objects.values('product_id').annotate(reports=Count('id')).order_by('-reports', 'product_id')[:TOP_REPORTED]
+    )
+    return {
+        'generated_at': timezone.now().isoformat(),
+        'product_count': count,
+        'total_stock': totals['total_stock'] or 0,
+        'stock_value': totals['stock_value'] or Decimal('0'),
+        'selection_rate': totals['selected_count'] / count if count else 0,
+        'report_count': reports['report_count'],
+        'reports_per_product': reports['report_count'] / count if count else 0,
+        'reported_product_rate': reports['reported_products'] / count if count else 0,
+        'top_reported': top_reported,
+        'price': {
+            'min': totals['price_min'],
+            'max': totals['price_max'],
+            'avg': totals['price_avg'],
+            'percentiles': price_percentiles(products, count),
+            'histogram': price_histogram(products, totals['price_min'], totals['price_max'], buckets),
+        },
+    }
+
+
+def price_percentiles(products, count):
+    """
+    Returns {percentile: price}; `percentile_cont` on PostgreSQL, nearest rank elsewhere.
+    """
+    if not count:
+        return {}
+    connection = connections[products.db]
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT percentile_cont(%s) WITHIN GROUP (ORDER BY price) FROM {Product._meta.db_table}',
+                [list(PERCENTILES)],
+            )
+            values = cursor.fetchone()[0]
+        return {str(p): Decimal(str(value)).quantize(Decimal('0.01')) for p, value in zip(PERCENTILES, values)}
+    ordered = products.order_by('price').values_list('price', flat=True)
+    return {str(p): ordered[int(p * (count - 1))] for p in PERCENTILES}
+
+
+def price_histogram(products, low, high, buckets):
+    """
+    Counts products per equal-width price bucket with a single GROUP BY.
+    """
+    if low is None:
+        return []
+    width = (high - low) / buckets or Decimal('1')
+    counts = dict(
+        products.annotate(
+            bucket=Least(
+                Floor((F('price') - Value(low)) / Value(width)), Value(buckets - 1), output_field=IntegerField()
+            )
+        ).values_list('bucket').annotate(count=Count('id')).values_list('bucket', 'count')
+    )
+    return [
+        {'from': low + width * index, 'to': low + width * (index + 1), 'count': counts.get(index, 0)}
+        for index in range(buckets)
+    ]
@@ -0,0 +1,102 @@
+"""
+Fan-out of product events to live subscribers (the dashboard's Server-Sent Events stream).
+
+In the default `local` mode events are published by the process that committed the
+change, which is enough for a single worker. With `PRODUCT_EVENTS_BROKER = 'outbox'`
+each process instead tails the `ProductEvent` outbox, so subscribers connected to any
+worker see changes committed by every other worker or host.
+"""
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, close_old_connections
+
+logger = logging.getLogger(__name__)
+
+
+def serialize_event(event):
+    return {
+        'cursor': event.id,
+        'product_id': event.product_id,
+        'kind': event.kind,
+        'data': event.data,
+    }
+
+
+class ProductEventBroker:
+    """
+    Delivers published events to every subscribed callback.
+
+    Callbacks are invoked on the publishing thread and must hand the event off quickly
+    (the SSE view schedules it onto its event loop).
+    """
+
+    def __init__(self):
+        self._subscribers = set()
+        self._lock = threading.Lock()
+        self._relay = None
+
+    def subscribe(self, callback):
+        with self._lock:
+            self._subscribers.add(callback)
+            if settings.PRODUCT_EVENTS_BROKER == 'outbox' and self._relay is None:
+                self._relay = OutboxRelay(self)
+                self._relay.start()
+
+    def unsubscribe(self, callback):
+        with self._lock:
+            self._subscribers.discard(callback)
+
+    def publish(self, event):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            try:
+                callback(event)
+            except Exception:
+                logger.exception('Product event subscriber failed')
+
+    def publish_committed(self, event):
+        """
+        Publishes an outbox row once the local transaction commits (`local` mode only).
+        """
+        if settings.PRODUCT_EVENTS_BROKER == 'local':
+            self.publish(serialize_event(event))
+
+
+class OutboxRelay(threading.Thread):
+    """
+    Polls the ProductEvent outbox and republishes new rows to the local broker.
+
+    Events behind an id that may still commit are held back, as in the change feed, so
+    a transaction that commits out of id order is not skipped.
+    """
+
+    def __init__(self, broker):
+        super().__init__(name='product-outbox-relay', daemon=True)
+        self.broker = broker
+        self.cursor = None
+
+    def run(self):
+        while True:
+            try:
+                close_old_connections()
+                self.poll()
+            except Exception:
+                logger.exception('Product outbox relay failed')
+            time.sleep(settings.PRODUCT_EVENTS_POLL_SECONDS)
+
+    def poll(self):
+        from products.models import ProductEvent
+
+        if self.cursor is None:
+            latest = ProductEvent.objects.using(DEFAULT_DB_ALIAS).order_by('-id').values_list('id', flat=True).first()
+            self.cursor = latest or 0
+        for event in ProductEvent.committed_after(self.cursor, 500):
+            self.cursor = event.id
+            self.broker.publish(serialize_event(event))
+
+
+broker = ProductEventBroker()
@@ -0,0 +1,31 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from account.housekeeping import delete_in_batches
+from products.models import ProductEvent
+
+
+class Command(BaseCommand):
+    help = (
+        'Compacts the product change feed: events older than the retention window are removed '
+        'when a newer event exists for the same product, and old deletion tombstones are dropped. '
+        'The latest snapshot of every existing product is always kept.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--retention-days', type=float, default=7,
+                            help='Full change history is kept for this many days.')
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['retention_days'])
+        old_events = ProductEvent.objects.filter(created_at__lt=cutoff)
+        superseded = old_events.filter(Exists(
+            ProductEvent.objects.filter(product_id=OuterRef('product_id'), id__gt=OuterRef('id'))
+        ))
+        compacted = delete_in_batches(superseded, batch_size=options['batch_size'])
+        tombstones = delete_in_batches(old_events.filter(kind=ProductEvent.DELETED), batch_size=options['batch_size'])
+        self.stdout.write(f'Removed {compacted} superseded events and {tombstones} tombstones')
@@ -0,0 +1,28 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from products.partitions import ensure_partitions, purge_expired_reports
+
+
+class Command(BaseCommand):
+    help = (
+        'Maintains the monthly product report partitions: creates the partitions for the coming '
+        'months and drops the ones past the retention window. On databases without partitioning '
+        'expired reports are deleted in batches instead.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--months-ahead', type=int, default=settings.PRODUCT_REPORT_PARTITIONS_AHEAD,
+                            help='Partitions are created this many months in advance.')
+        parser.add_argument('--retention-months', type=int, default=settings.PRODUCT_REPORT_RETENTION_MONTHS,
+                            help='Reports are kept for the current month plus this many previous months.')
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        created = ensure_partitions(options['months_ahead'])
+        dropped, deleted = purge_expired_reports(options['retention_months'], batch_size=options['batch_size'])
+        for name in created:
+            self.stdout.write(f'Created partition {name}')
+        for name in dropped:
+            self.stdout.write(f'Dropped partition {name}')
+        self.stdout.write(f'Created {len(created)} partitions, dropped {len(dropped)} and deleted {deleted} expired reports')
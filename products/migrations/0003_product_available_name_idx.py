@@ -0,0 +1,17 @@
+# Generated by Django 4.2 on 2026-10-19 17:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0002_product_selected_by_productreport'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(condition=models.Q(('selected_by__isnull', True)), fields=['name'], name='product_available_name_idx'),
+        ),
+    ]
@@ -0,0 +1,91 @@
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+from products.partitions import DEFAULT_PARTITION, PARENT_TABLE, add_months, create_partition, month_start
+
+PARTITIONED_TABLE = f'{PARENT_TABLE}_partitioned'
+SEQUENCE = f'{PARENT_TABLE}_part_id_seq'
+COLUMNS = 'id, reason, created_at, product_id, reported_by_id'
+
+
+def fk_index_names(schema_editor):
+    # Same names Django gives the foreign key indexes of a plain table
+    return [schema_editor._create_index_name(PARENT_TABLE, [column], suffix='') for column in ('product_id', 'reported_by_id')]
+
+
+def partition_table(apps, schema_editor):
+    # Rebuilds the report table as a monthly range-partitioned table; PostgreSQL only.
+    # The primary key has to include the partition key, so it becomes (id, created_at).
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'CREATE SEQUENCE {SEQUENCE}')
+    schema_editor.execute(
+        f'CREATE TABLE {PARTITIONED_TABLE} ('
+        f"id bigint NOT NULL DEFAULT nextval('{SEQUENCE}'), "
+        'reason text NOT NULL, '
+        'created_at timestamp with time zone NOT NULL, '
+        'product_id bigint NOT NULL, '
+        'reported_by_id bigint NOT NULL, '
+        f'CONSTRAINT {PARENT_TABLE}_part_pkey PRIMARY KEY (id, created_at)'
+        ') PARTITION BY RANGE (created_at)'
+    )
+    schema_editor.execute(f'CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {PARTITIONED_TABLE} DEFAULT')
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f'SELECT MIN(created_at) FROM {PARENT_TABLE}')
+        oldest = cursor.fetchone()[0]
+    current = month_start(timezone.now())
+    month = month_start(oldest) if oldest else current
+    while month <= add_months(current, settings.PRODUCT_REPORT_PARTITIONS_AHEAD):
+        create_partition(schema_editor.connection, month, parent=PARTITIONED_TABLE)
+        month = add_months(month, 1)
+
+    schema_editor.execute(f'INSERT INTO {PARTITIONED_TABLE} ({COLUMNS}) SELECT {COLUMNS} FROM {PARENT_TABLE}')
+    schema_editor.execute(f"SELECT setval('{SEQUENCE}', COALESCE(MAX(id), 0) + 1, false) FROM {PARTITIONED_TABLE}")
+    schema_editor.execute(f'DROP TABLE {PARENT_TABLE}')
+    schema_editor.execute(f'ALTER TABLE {PARTITIONED_TABLE} RENAME TO {PARENT_TABLE}')
+    schema_editor.execute(f'ALTER SEQUENCE {SEQUENCE} OWNED BY {PARENT_TABLE}.id')
+
+    schema_editor.execute(
+        f'ALTER TABLE {PARENT_TABLE} ADD CONSTRAINT {PARENT_TABLE}_product_id_fk '
+        'FOREIGN KEY (product_id) REFERENCES products_product (id) DEFERRABLE INITIALLY DEFERRED'
+    )
+    schema_editor.execute(
+        f'ALTER TABLE {PARENT_TABLE} ADD CONSTRAINT {PARENT_TABLE}_reported_by_id_fk '
+        f'FOREIGN KEY (reported_by_id) REFERENCES account_user (id) DEFERRABLE INITIALLY DEFERRED'
+    )
+    for name, column in zip(fk_index_names(schema_editor), ('product_id', 'reported_by_id')):
+        schema_editor.execute(f'CREATE INDEX {name} ON {PARENT_TABLE} ({column})')
+
+
+def unpartition_table(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'ALTER TABLE {PARENT_TABLE} RENAME TO {PARTITIONED_TABLE}')
+    for name in fk_index_names(schema_editor):
+        schema_editor.execute(f'DROP INDEX {name}')
+    schema_editor.create_model(apps.get_model('products', 'ProductReport'))
+    schema_editor.execute(f'INSERT INTO {PARENT_TABLE} ({COLUMNS}) SELECT {COLUMNS} FROM {PARTITIONED_TABLE}')
+    schema_editor.execute(
+        f"SELECT setval(pg_get_serial_sequence('{PARENT_TABLE}', 'id'), COALESCE(MAX(id), 0) + 1, false) "
+        f'FROM {PARENT_TABLE}'
+    )
+    # Also drops the partitions and the sequence owned by the table
+    schema_editor.execute(f'DROP TABLE {PARTITIONED_TABLE}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0002_user_email_upper_idx'),
+        ('products', '0005_product_updated_at_productevent'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_table, unpartition_table),
+        migrations.AddIndex(
+            model_name='productreport',
+            index=models.Index(fields=['created_at'], name='productreport_created_idx'),
+        ),
+    ]
@@ -1,6 +1,12 @@
 # Make sure to import from django.db, not from your local app models
-from django.db import models
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, models, transaction
 from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from .broker import broker
 
 
 
@@ -10,16 +16,186 @@ class Product(models.Model):
     price = models.DecimalField(max_digits=10, decimal_places=2)
     available_stock = models.PositiveIntegerField(default=0)
     selected_by = models.ForeignKey(get_user_model(), null=True, blank=True, on_delete=models.SET_NULL, related_name="selected_products")
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+    # Bumped by every write through `update_if_version`, for optimistic concurrency control
+    version = models.PositiveIntegerField(default=1)
+
+    class Meta:
+        indexes = [
+            # Partial index over unselected products only: keeps `available_only`
+            # searches and counts off the (much larger) selected portion of the table.
+            models.Index(fields=['name'], condition=models.Q(selected_by__isnull=True), name='product_available_name_idx'),
+        ]
 
     def __str__(self):
         return self.name
 
+    def update_if_version(self, changes, version, kind=None):
+        """
+        Writes only the `changes` columns, provided the row is still at `version`.
+
+        The check and the version bump happen in one UPDATE, so of several writers starting
+        from the same version exactly one succeeds. The change is recorded in the outbox;
+        call inside a transaction.
+
+        Returns:
+        - True if the row was updated, False if it changed (or was deleted) in the meantime.
+        """
+        now = timezone.now()
+        updated = Product.objects.filter(pk=self.pk, version=version).update(
+            **changes, version=models.F('version') + 1, updated_at=now,
+        )
+        if not updated:
+            return False
+        for field, value in changes.items():
+            setattr(self, field, value)
+        self.version = version + 1
+        self.updated_at = now
+        ProductEvent.record(self, kind or ProductEvent.UPDATED)
+        return True
+
+
+class ProductReportQuerySet(models.QuerySet):
+    def recent(self, days):
+        """
+        Reports created in the last `days` days.
+
+        Filtering on `created_at` lets PostgreSQL skip every monthly partition
+        outside the window.
+        """
+        return self.filter(created_at__gte=timezone.now() - timedelta(days=days))
+
 
 class ProductReport(models.Model):
+    """
+    Append-only product report.
+
+    On PostgreSQL the table is range-partitioned by `created_at` into monthly partitions
+    (primary key `(id, created_at)`); see `products.partitions`.
+    """
     product = models.ForeignKey(Product, on_delete=models.CASCADE)
     reported_by = models.ForeignKey(get_user_model(), on_delete=models.CASCADE)
     reason = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = ProductReportQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['created_at'], name='productreport_created_idx'),
+        ]
+
     def __str__(self):
-        return self.product.name
+        # Only uses the FK column so listing reports never loads each product
+        return f'Report #{self.pk} on product #{self.product_id}'
+
+
+class ProductEvent(models.Model):
+    """
+    Transactional outbox of product changes, consumed in `id` order by the change feed.
+
+    Events are written in the same transaction as the change they describe and carry
+    a full snapshot of the product, so only the latest event per product is needed to
+    rebuild its current state.
+    """
+    CREATED = 'created'
+    UPDATED = 'updated'
+    SELECTED = 'selected'
+    DELETED = 'deleted'
+    KIND_CHOICES = [
+        (CREATED, 'Created'),
+        (UPDATED, 'Updated'),
+        (SELECTED, 'Selected'),
+        (DELETED, 'Deleted'),
+    ]
+
+    product_id = models.BigIntegerField()
+    kind = models.CharField(max_length=16, choices=KIND_CHOICES)
+    data = models.JSONField(default=dict)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        indexes = [
+            # Finds newer events of the same product during compaction
+            models.Index(fields=['product_id', 'id'], name='productevent_product_id_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.kind} product #{self.product_id}'
+
+    @staticmethod
+    def snapshot(product):
+        return {
+            'name': product.name,
+            'description': product.description,
+            'price': str(product.price),
+            'available_stock': product.available_stock,
+            'selected_by': product.selected_by_id,
+        }
+
+    @classmethod
+    def record(cls, product, kind):
+        """
+        Records one event for `product`; call inside the transaction that changed it.
+
+        Live subscribers are notified once that transaction commits.
+        """
+        data = {} if kind == cls.DELETED else cls.snapshot(product)
+        event = cls.objects.create(product_id=product.pk, kind=kind, data=data)
+        transaction.on_commit(lambda: broker.publish_committed(event))
+        return event
+
+    @classmethod
+    def record_many(cls, products, kind):
+        """
+        Records one event per product in `products` with a single INSERT.
+        """
+        events = cls.objects.bulk_create(
+            [cls(product_id=product.pk, kind=kind, data=cls.snapshot(product)) for product in products]
+        )
+        transaction.on_commit(lambda: [broker.publish_committed(event) for event in events])
+        return events
+
+    @classmethod
+    def committed_after(cls, since, limit):
+        """
+        Returns up to `limit` events after the `since` cursor, in id order.
+
+        Transactions commit out of id order, so a missing id may belong to one still in
+        progress. Events after such a gap are held back until it is filled or cannot be
+        anymore (a rolled back or compacted event, see `gap_horizon`).
+        """
+        # Read from the primary: a lagging replica shows gaps for events already committed
+        events = list(cls.objects.using(DEFAULT_DB_ALIAS).filter(id__gt=since).order_by('id')[:limit])
+        gaps = [
+            position for position, event in enumerate(events)
+            if event.id != (events[position - 1].id if position else since) + 1
+        ]
+        if gaps:
+            horizon = cls.gap_horizon()
+            held = next((position for position in gaps if events[position].created_at > horizon), None)
+            if held is not None:
+                events = events[:held]
+        return events
+
+    @staticmethod
+    def gap_horizon():
+        """
+        Returns the time before which a missing event id is taken to be permanent.
+
+        A missing id can only belong to a transaction started before the event after it.
+        On PostgreSQL that is bounded by the oldest transaction still writing, so gaps
+        behind it are skipped at once; otherwise they wait `PRODUCT_CHANGES_GAP_SECONDS`.
+        """
+        now = timezone.now()
+        horizon = now - timedelta(seconds=settings.PRODUCT_CHANGES_GAP_SECONDS)
+        connection = connections[DEFAULT_DB_ALIAS]
+        if connection.vendor != 'postgresql':
+            return horizon
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT min(xact_start) FROM pg_stat_activity WHERE backend_xid IS NOT NULL')
+            oldest = cursor.fetchone()[0]
+        if oldest is None:
+            return now
+        # Allows for clock differences between the application and database hosts
+        return max(horizon, oldest - timedelta(seconds=1))
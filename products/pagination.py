@@ -0,0 +1,12 @@
+from rest_framework.pagination import PageNumberPagination
+
+
+class ProductPagination(PageNumberPagination):
+    """
+    Page-number pagination for product listings.
+
+    Clients may shrink or grow the page with `page_size`, capped at `max_page_size`.
+    """
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 500
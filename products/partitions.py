@@ -0,0 +1,182 @@
+"""
+Monthly range partitions of the product report table.
+
+On PostgreSQL `products_productreport` is partitioned by `created_at`: one partition per
+calendar month (UTC) named `products_productreport_pYYYYMM`, plus a DEFAULT partition that
+catches rows outside the prepared range. Expired months are detached and dropped, which
+removes them without a DELETE or the vacuum work that follows one.
+
+Other backends keep a plain table; retention falls back to batched deletes.
+"""
+import logging
+import re
+from datetime import date, datetime, timezone as dt_timezone
+
+from django.db import connections, transaction
+from django.utils import timezone
+
+from account.housekeeping import delete_in_batches
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = 'products_productreport'
+DEFAULT_PARTITION = f'{PARENT_TABLE}_default'
+PARTITION_RE = re.compile(rf'^{PARENT_TABLE}_p(\d{{4}})(\d{{2}})$')
+
+
+def month_start(value):
+    return date(value.year, value.month, 1)
+
+
+def add_months(month, months):
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month):
+    return f'{PARENT_TABLE}_p{month:%Y%m}'
+
+
+def _bound(month):
+    return datetime(month.year, month.month, 1, tzinfo=dt_timezone.utc).isoformat()
+
+
+def is_partitioned(connection):
+    if connection.vendor != 'postgresql':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s)", [PARENT_TABLE]
+        )
+        return cursor.fetchone() is not None
+
+
+def existing_partitions(connection, parent=PARENT_TABLE):
+    """
+    Returns {month: partition name} for the monthly partitions attached to `parent`.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT child.relname FROM pg_inherits '
+            'JOIN pg_class child ON child.oid = pg_inherits.inhrelid '
+            'WHERE pg_inherits.inhparent = %s::regclass',
+            [parent],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+    months = {}
+    for name in names:
+        match = PARTITION_RE.match(name)
+        if match:
+            months[date(int(match[1]), int(match[2]), 1)] = name
+    return months
+
+
+def default_partition(connection, parent=PARENT_TABLE):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT child.relname FROM pg_partitioned_table '
+            'JOIN pg_class child ON child.oid = pg_partitioned_table.partdefid '
+            'WHERE pg_partitioned_table.partrelid = %s::regclass',
+            [parent],
+        )
+        row = cursor.fetchone()
+    return row[0] if row else None
+
+
+def create_partition(connection, month, parent=PARENT_TABLE):
+    """
+    Creates the partition of `month`, moving that month's rows out of the DEFAULT partition.
+
+    PostgreSQL refuses to add a partition while the DEFAULT partition holds rows of its
+    range (e.g. the partitions were not prepared in time). The DEFAULT partition is then
+    detached, its rows of the month are moved into the new partition, and it is attached
+    again, all in one transaction.
+    """
+    name = partition_name(month)
+    start, end = _bound(month), _bound(add_months(month, 1))
+    bounds = f"FOR VALUES FROM ('{start}') TO ('{end}')"
+    default = default_partition(connection, parent)
+    with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+        misplaced = False
+        if default:
+            cursor.execute(f'SELECT 1 FROM {default} WHERE created_at >= %s AND created_at < %s LIMIT 1', [start, end])
+            misplaced = cursor.fetchone() is not None
+        if not misplaced:
+            cursor.execute(f'CREATE TABLE IF NOT EXISTS {name} PARTITION OF {parent} {bounds}')
+            return name
+        logger.warning('Moving rows of %s out of %s into %s', f'{month:%Y-%m}', default, name)
+        cursor.execute(f'ALTER TABLE {parent} DETACH PARTITION {default}')
+        cursor.execute(f'CREATE TABLE {name} PARTITION OF {parent} {bounds}')
+        cursor.execute(f'INSERT INTO {name} SELECT * FROM {default} WHERE created_at >= %s AND created_at < %s', [start, end])
+        cursor.execute(f'DELETE FROM {default} WHERE created_at >= %s AND created_at < %s', [start, end])
+        cursor.execute(f'ALTER TABLE {parent} ATTACH PARTITION {default} DEFAULT')
+    return name
+
+
+def ensure_partitions(months_ahead, using='default', now=None):
+    """
+    Creates any missing partition from the current month up to `months_ahead` months ahead.
+
+    Partitions must exist before rows for their month arrive; otherwise the rows land in the
+    DEFAULT partition, which then has to be scanned whenever a partition is added, and are
+    moved out of it when their month's partition is created late.
+
+    Returns:
+    - The names of the partitions created.
+    """
+    connection = connections[using]
+    if not is_partitioned(connection):
+        return []
+    current = month_start(now or timezone.now())
+    existing = existing_partitions(connection)
+    created = []
+    for offset in range(months_ahead + 1):
+        month = add_months(current, offset)
+        if month not in existing:
+            created.append(create_partition(connection, month))
+    return created
+
+
+def drop_expired_partitions(retention_months, using='default', now=None):
+    """
+    Detaches and drops the partitions that end before the retention cutoff.
+
+    Only whole months are dropped: the partition holding the cutoff itself is kept.
+
+    Returns:
+    - The names of the partitions dropped.
+    """
+    connection = connections[using]
+    if not is_partitioned(connection):
+        return []
+    cutoff = add_months(month_start(now or timezone.now()), -retention_months)
+    dropped = []
+    for month, name in sorted(existing_partitions(connection).items()):
+        if add_months(month, 1) > cutoff:
+            break
+        with connection.cursor() as cursor:
+            cursor.execute(f'ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}')
+            cursor.execute(f'DROP TABLE {name}')
+        dropped.append(name)
+    return dropped
+
+
+def purge_expired_reports(retention_months, batch_size=1000, using='default', now=None):
+    """
+    Applies the retention policy: reports created before the first retained month are removed.
+
+    Expired partitions are dropped first; whatever is left (the DEFAULT partition, or the whole
+    table on backends without partitioning) is deleted in batches.
+
+    Returns:
+    - A (dropped partition names, deleted row count) tuple.
+    """
+    from .models import ProductReport
+
+    dropped = drop_expired_partitions(retention_months, using=using, now=now)
+    cutoff = add_months(month_start(now or timezone.now()), -retention_months)
+    expired = ProductReport.objects.using(using).filter(
+        created_at__lt=datetime(cutoff.year, cutoff.month, 1, tzinfo=dt_timezone.utc)
+    )
+    deleted = delete_in_batches(expired, batch_size=batch_size)
+    return dropped, deleted
@@ -0,0 +1,304 @@
+"""
+Process-local, array-backed read model of the product catalog for `ProductSearchView`.
+
+With `PRODUCT_SEARCH_BACKEND = 'memory'` searches are answered from a compact snapshot
+instead of the database:
+- ids, prices (in cents) and stock are kept in `array` buffers;
+- the lowercased names are joined into one string that is split around the query;
+- a presorted array of row positions is kept per sortable field.
+Filtering, sorting and paging therefore stay in memory. The database is only queried for
+the descriptions of the rows returned.
+
+Refreshes are incremental. Every `PRODUCT_READ_MODEL_REFRESH_SECONDS`, rows whose
+`updated_at` moved, and products deleted according to the `ProductEvent` outbox, are
+pulled into a small overlay that shadows the snapshot. The snapshot is rebuilt from the
+snapshot and overlay once the overlay holds more than `PRODUCT_READ_MODEL_MAX_DELTA` rows.
+It is rebuilt from the database every `PRODUCT_READ_MODEL_REBUILD_SECONDS`, which must stay
+shorter than the outbox retention.
+
+Each refresh re-reads `PRODUCT_READ_MODEL_CHANGE_OVERLAP_SECONDS` behind the previous one.
+A change whose transaction, or replication to the replica read, takes longer than that is
+only picked up by the next rebuild, so the overlap must cover both.
+
+Names are ordered by their lowercased form, then by id, which can differ from the
+database collation for non-ASCII names.
+"""
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Sequence
+from datetime import timedelta
+from decimal import Decimal
+from heapq import merge
+from itertools import accumulate, compress, islice, repeat
+
+from django.conf import settings
+from django.utils import timezone
+
+from .models import Product, ProductEvent
+
+SORT_FIELDS = ('id', 'name', 'price', 'available_stock')
+# Matches are sorted directly below this fraction of the catalog, filtered from the
+# presorted positions above it
+SORT_MATCHES_RATIO = 1 / 16
+SEPARATOR = '\x00'  # Cannot occur in names stored by PostgreSQL
+DESCRIPTION_BATCH_SIZE = 2000
+
+# Row tuples, as kept in the overlay: (id, name, price in cents, stock, available)
+ID, NAME, PRICE, STOCK, AVAILABLE = range(5)
+FIELD_COLUMNS = {'id': ID, 'name': NAME, 'price': PRICE, 'available_stock': STOCK}
+
+
+def product_row(id, name, price, available_stock, selected_by_id):
+    return id, name, int(price * 100), available_stock, selected_by_id is None
+
+
+def fetch_rows(queryset):
+    rows = queryset.values_list('id', 'name', 'price', 'available_stock', 'selected_by_id')
+    return (product_row(*row) for row in rows.iterator(chunk_size=5000))
+
+
+def intersect(mask, other):
+    """
+    Returns the byte-wise AND of two 0/1 masks of the same length.
+    """
+    size = len(mask)
+    return bytearray((int.from_bytes(mask, 'little') & int.from_bytes(other, 'little')).to_bytes(size, 'little'))
+
+
+def row_sort_key(field):
+    if field == 'name':
+        return lambda row: (row[NAME].lower(), row[ID])
+    column = FIELD_COLUMNS[field]
+    return lambda row: (row[column], row[ID])
+
+
+class CatalogSnapshot:
+    """
+    Immutable columnar copy of the catalog, with rows ordered by id.
+    """
+
+    def __init__(self, rows):
+        self.ids = array('q')
+        self.prices = array('q')
+        self.stock = array('q')
+        self.available = bytearray()
+        self.names = []
+        lowered = []
+        for id, name, price, stock, available in rows:
+            self.ids.append(id)
+            # Interning shares the storage of repeated names
+            self.names.append(sys.intern(name))
+            self.prices.append(price)
+            self.stock.append(stock)
+            self.available.append(available)
+            lowered.append(name.lower())
+
+        self.haystack = SEPARATOR.join(lowered)
+
+        positions = range(len(self.ids))
+        self.order = {
+            'id': array('q', positions),
+            'name': array('q', sorted(positions, key=lambda pos: (lowered[pos], self.ids[pos]))),
+            'price': array('q', sorted(positions, key=lambda pos: (self.prices[pos], self.ids[pos]))),
+            'available_stock': array('q', sorted(positions, key=lambda pos: (self.stock[pos], self.ids[pos]))),
+        }
+
+    def __len__(self):
+        return len(self.ids)
+
+    def row(self, pos):
+        return self.ids[pos], self.names[pos], self.prices[pos], self.stock[pos], bool(self.available[pos])
+
+    def position(self, id):
+        pos = bisect_left(self.ids, id)
+        if pos < len(self.ids) and self.ids[pos] == id:
+            return pos
+        return None
+
+    def matching_positions(self, query):
+        """
+        Returns the positions of the rows whose name contains `query` (lowercased), in order.
+        """
+        if SEPARATOR in query:
+            return []
+        pieces = self.haystack.split(query)
+        # The number of separators before each match is the position of its row
+        positions = accumulate(map(str.count, islice(pieces, len(pieces) - 1), repeat(SEPARATOR)))
+        return list(dict.fromkeys(positions))
+
+    def merged(self, overlay):
+        """
+        Returns a new snapshot with the overlay's changes and deletions applied.
+        """
+        rows = [self.row(pos) for pos in range(len(self)) if self.ids[pos] not in overlay]
+        rows.extend(row for row in overlay.values() if row is not None)
+        rows.sort(key=lambda row: row[ID])
+        return CatalogSnapshot(rows)
+
+
+class CatalogResults(Sequence):
+    """
+    Ordered search results, only taken from `refs` and materialized as far as they are sliced.
+
+    Each reference is either a snapshot position or an overlay row tuple.
+    """
+
+    def __init__(self, snapshot, refs, length, fields, named=True):
+        self.snapshot = snapshot
+        self.refs = iter(refs)
+        self.taken = []
+        self.length = length
+        self.fields = fields
+        self.named = named
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        # Sequence would index one row at a time, each with its own description query
+        return iter(self[0:self.length])
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            return self[index:index + 1 or None][0]
+        stop = index.indices(self.length)[1]
+        if stop > len(self.taken):
+            self.taken.extend(islice(self.refs, stop - len(self.taken)))
+        rows = [self.snapshot.row(ref) if isinstance(ref, int) else ref for ref in self.taken[index]]
+        descriptions = self.descriptions([row[ID] for row in rows]) if 'description' in self.fields else {}
+        values = []
+        for row in rows:
+            value = []
+            for field in self.fields:
+                if field == 'description':
+                    value.append(descriptions.get(row[ID], ''))
+                elif field == 'price':
+                    value.append(Decimal(row[PRICE]).scaleb(-2))
+                else:
+                    value.append(row[FIELD_COLUMNS[field]])
+            values.append(dict(zip(self.fields, value)) if self.named else tuple(value))
+        return values
+
+    @staticmethod
+    def descriptions(ids):
+        descriptions = {}
+        for start in range(0, len(ids), DESCRIPTION_BATCH_SIZE):
+            batch = ids[start:start + DESCRIPTION_BATCH_SIZE]
+            descriptions.update(Product.objects.filter(pk__in=batch).values_list('id', 'description'))
+        return descriptions
+
+
+class CatalogReadModel:
+    """
+    Keeps the current snapshot and overlay, refreshing them when they are due.
+
+    The first search of a process builds the snapshot. Later refreshes run on one thread
+    while the others keep searching the previous state.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        # (snapshot, overlay); the overlay maps changed product ids to rows, or None once deleted
+        self._state = None
+        self._watermark = None
+        self._checked_at = self._built_at = 0
+
+    def state(self):
+        due = time.monotonic() - self._checked_at >= settings.PRODUCT_READ_MODEL_REFRESH_SECONDS
+        if self._state is None or due:
+            if self._lock.acquire(blocking=self._state is None):
+                try:
+                    if self._state is None or time.monotonic() - self._checked_at >= settings.PRODUCT_READ_MODEL_REFRESH_SECONDS:
+                        self.refresh()
+                finally:
+                    self._lock.release()
+        return self._state
+
+    def refresh(self, full=False):
+        """
+        Pulls changes since the last refresh, or rebuilds the snapshot when it is due.
+        """
+        now = time.monotonic()
+        started = timezone.now()
+        if full or self._state is None or now - self._built_at >= settings.PRODUCT_READ_MODEL_REBUILD_SECONDS:
+            snapshot, overlay = CatalogSnapshot(fetch_rows(Product.objects.order_by('id'))), {}
+            self._built_at = now
+        else:
+            snapshot, overlay = self._state
+            overlay = dict(overlay)
+            # Re-read behind the last refresh: a transaction that committed after it may carry an
+            # earlier `updated_at`, and a lagging replica may not have shown it yet
+            since = self._watermark - timedelta(seconds=settings.PRODUCT_READ_MODEL_CHANGE_OVERLAP_SECONDS)
+            for row in fetch_rows(Product.objects.filter(updated_at__gte=since)):
+                overlay[row[ID]] = row
+            deleted = ProductEvent.objects.filter(kind=ProductEvent.DELETED, created_at__gte=since)
+            for product_id in deleted.values_list('product_id', flat=True):
+                overlay[product_id] = None
+            if len(overlay) > settings.PRODUCT_READ_MODEL_MAX_DELTA:
+                snapshot, overlay = snapshot.merged(overlay), {}
+        self._watermark = started
+        self._checked_at = now
+        self._state = (snapshot, overlay)
+
+    def search(self, query='', sort_field='name', descending=False, available_only=False, fields=SORT_FIELDS, named=True):
+        """
+        Returns the products whose name contains `query`, ordered by `sort_field` then id.
+
+        Args:
+        - query: Case-insensitive substring of the name; empty matches every product.
+        - sort_field: One of `SORT_FIELDS`.
+        - descending: Reverses the order.
+        - available_only: Leaves out selected products.
+        - fields: Fields of each row, from `SORT_FIELDS` and `description`.
+        - named: Rows are dicts when true, tuples in `fields` order otherwise.
+
+        Returns:
+        - A `CatalogResults` sequence.
+        """
+        snapshot, overlay = self.state()
+        query = query.lower()
+        count = len(snapshot)
+
+        matches = snapshot.matching_positions(query) if query else None
+        if matches is None:
+            mask = bytearray(snapshot.available) if available_only else bytearray(b'\x01') * count
+        else:
+            mask = bytearray(count)
+            deque(map(mask.__setitem__, matches, repeat(1)), maxlen=0)
+            if available_only:
+                mask = intersect(mask, snapshot.available)
+        for id in overlay:
+            pos = snapshot.position(id)
+            if pos is not None:
+                mask[pos] = 0
+
+        if matches is not None and len(matches) < count * SORT_MATCHES_RATIO:
+            key = row_sort_key(sort_field)
+            refs = sorted((pos for pos in matches if mask[pos]), key=lambda pos: key(snapshot.row(pos)), reverse=descending)
+        else:
+            order = snapshot.order[sort_field]
+            refs = compress(reversed(order) if descending else order,
+                            map(mask.__getitem__, reversed(order) if descending else order))
+        length = mask.count(1)
+
+        changed = sorted(
+            (row for row in overlay.values()
+             if row is not None and query in row[NAME].lower() and (row[AVAILABLE] or not available_only)),
+            key=row_sort_key(sort_field), reverse=descending,
+        )
+        if changed:
+            key = row_sort_key(sort_field)
+            refs = merge(refs, changed, reverse=descending,
+                         key=lambda ref: key(snapshot.row(ref) if isinstance(ref, int) else ref))
+            length += len(changed)
+        return CatalogResults(snapshot, refs, length, fields, named)
+
+
+catalog = CatalogReadModel()
@@ -0,0 +1,125 @@
+"""
+Fragment cache for the product rows of the dashboard.
+
+Each row (table row plus its report modal) is rendered once per product version and kept
+in the `product_rows` cache under the product's id and `updated_at`, so a dashboard render
+only runs the template for rows that changed since they were last cached. Any save bumps
+`updated_at`, which moves the product to a new key; stale versions simply expire.
+
+Rows are shared between users, so they are rendered with a random placeholder in place of
+the CSRF token and cached split around it; the requesting user's token is joined in when the
+page is assembled. Product text cannot match a placeholder drawn for each render.
+
+With `DASHBOARD_STREAM` the page is streamed: everything above the rows is sent at once, then
+rows follow in chunks of `DASHBOARD_STREAM_CHUNK_SIZE` read from a server-side cursor, so
+the first byte does not wait for the catalog and memory does not grow with it.
+"""
+import secrets
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+from django.middleware.csrf import get_token
+from django.shortcuts import render
+from django.template.loader import get_template, render_to_string
+from django.utils.safestring import mark_safe
+
+ROW_TEMPLATE = '_product_row.html'
+ROWS_MARKER = '<!--product-rows-->'
+
+
+def row_cache_key(product):
+    return f'products:row-parts:{product.pk}:{product.updated_at.timestamp()}'
+
+
+def render_row(product):
+    """
+    Returns the row's HTML as the list of parts around its CSRF token.
+    """
+    placeholder = secrets.token_hex(16)
+    return get_template(ROW_TEMPLATE).render({'product': product, 'csrf_token': placeholder}).split(placeholder)
+
+
+def render_product_rows(products, request):
+    """
+    Returns the dashboard rows of `products` as safe HTML, rendering only uncached rows.
+
+    Args:
+    - products: Iterable of products, in display order.
+    - request: The HTTP request, whose CSRF token is inserted into the row forms.
+
+    Returns:
+    - The rows' HTML, marked safe for inclusion in `dashboard.html`.
+    """
+    products = list(products)
+    keys = [row_cache_key(product) for product in products]
+    cache = caches['product_rows']
+    cached = cache.get_many(keys)
+    missing = {key: render_row(product) for key, product in zip(keys, products) if key not in cached}
+    if missing:
+        cache.set_many(missing, timeout=settings.PRODUCT_ROW_CACHE_SECONDS)
+        cached.update(missing)
+    token = get_token(request)
+    return mark_safe(''.join(token.join(cached[key]) for key in keys))
+
+
+def is_asgi(request):
+    # DRF wraps the HttpRequest in its own Request
+    return isinstance(getattr(request, '_request', request), ASGIRequest)
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def dashboard_response(request, products, context, stream=None):
+    """
+    Renders `dashboard.html` with the rows of `products`, streamed when `DASHBOARD_STREAM` is on.
+
+    Args:
+    - request: The HTTP request object.
+    - products: Queryset of the products to list, in display order.
+    - context: Other template context.
+    - stream: Whether to stream the page; defaults to `DASHBOARD_STREAM`.
+
+    Returns:
+    - An HttpResponse, or a StreamingHttpResponse yielding the page head, row chunks and tail.
+    """
+    if not (settings.DASHBOARD_STREAM if stream is None else stream):
+        return render(request, 'dashboard.html', {**context, 'product_rows': render_product_rows(products, request)})
+
+    # Rows are fetched after the view returns, once `ReplicaPinningMiddleware` has unpinned
+    # the request, so the database is chosen now to keep reading the client's own writes
+    products = products.using(products.db)
+
+    # Rendered with a marker in place of the rows, then sent around them
+    page = render_to_string('dashboard.html', {**context, 'product_rows': mark_safe(ROWS_MARKER)}, request)
+    head, tail = page.split(ROWS_MARKER, 1)
+    chunk_size = settings.DASHBOARD_STREAM_CHUNK_SIZE
+
+    def stream():
+        yield head
+        for chunk in chunked(products.iterator(chunk_size=chunk_size), chunk_size):
+            yield render_product_rows(chunk, request)
+        yield tail
+
+    async def astream():
+        # Django buffers synchronous iterators under ASGI, so rows are fetched asynchronously there
+        yield head
+        chunk = []
+        async for product in products.aiterator(chunk_size=chunk_size):
+            chunk.append(product)
+            if len(chunk) == chunk_size:
+                yield await sync_to_async(render_product_rows)(chunk, request)
+                chunk = []
+        if chunk:
+            yield await sync_to_async(render_product_rows)(chunk, request)
+        yield tail
+
+    content = astream() if is_asgi(request) else stream()
+    return StreamingHttpResponse(content, content_type='text/html; charset=utf-8')
@@ -4,4 +4,5 @@ from .models import Product
 class ProductSerializer(serializers.ModelSerializer):
     class Meta:
         model = Product
-        fields = ['id', 'name', 'description', 'price', 'available_stock']
+        fields = ['id', 'name', 'description', 'price', 'available_stock', 'version']
+        read_only_fields = ['version']
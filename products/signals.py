@@ -0,0 +1,22 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Product, ProductEvent
+
+SELECTION_FIELDS = {'selected_by', 'updated_at'}
+
+
+@receiver(post_save, sender=Product)
+def record_product_saved(sender, instance, created, update_fields=None, **kwargs):
+    if created:
+        kind = ProductEvent.CREATED
+    elif update_fields and set(update_fields) <= SELECTION_FIELDS:
+        kind = ProductEvent.SELECTED
+    else:
+        kind = ProductEvent.UPDATED
+    ProductEvent.record(instance, kind)
+
+
+@receiver(post_delete, sender=Product)
+def record_product_deleted(sender, instance, **kwargs):
+    ProductEvent.record(instance, ProductEvent.DELETED)
@@ -1,8 +1,31 @@
+import json
+import re
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from io import StringIO
+from unittest import mock, skipUnless
+
+from asgiref.sync import async_to_sync, sync_to_async
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.management import call_command
+
+from django.db import OperationalError
+from django.db import connection
+from django.test import Client, RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase
 from account.models import User
-from products.models import Product, ProductReport
+from authAPI.routers import ReplicaRouter, pin_primary
+from products.broker import OutboxRelay, ProductEventBroker, broker
+from products.models import Product, ProductEvent, ProductReport
+from products import partitions
+from products.partitions import add_months, partition_name
+from products import rendering
+from products.read_model import catalog
+from products.views import _events_since, product_event_stream
 
 
 class ProductTests(APITestCase):
@@ -76,6 +99,13 @@ class ProductTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('Product already selected by another user.', str(response.data))
 
+    @override_settings(DATABASE_REPLICAS=['replica_1'])
+    def test_select_product_pins_reads_to_primary(self):
+        url = reverse('product-select', kwargs={'product_id': self.product.id})
+        response = self.client.post(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.cookies['pin_primary']['max-age'], 5)
+
     def test_report_product(self):
         url = reverse('product-report', kwargs={'product_id': self.product.id})
         data = {'reason': 'Defective'}
@@ -91,3 +121,619 @@ class ProductTests(APITestCase):
         data = {'reason': 'Defective'}
         response = self.client.post(url, data)
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)  # Expecting 404 status for non-existent product
+
+    def test_search_available_only(self):
+        another_user = User.objects.create_user(
+            email='otheruser@example.com', password='testpass123', name='Another User', tc=True
+        )
+        Product.objects.create(
+            name="Product 2", description="Taken", price=5.00, available_stock=1, selected_by=another_user
+        )
+        url = reverse('product-search') + '?query=Product&available_only=true'
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([p['name'] for p in response.data], ['Product 1'])
+
+    def test_search_sparse_fields(self):
+        url = reverse('product-search') + '?query=Product&fields=id,name'
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, [{'id': self.product.id, 'name': 'Product 1'}])
+
+    def test_search_unknown_field(self):
+        url = reverse('product-search') + '?fields=id,selected_by__password'
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('selected_by__password', response.data['error'])
+
+    def test_search_columnar_layout(self):
+        url = reverse('product-search') + '?query=Product&fields=name,available_stock&layout=columnar'
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), {'columns': ['name', 'available_stock'], 'rows': [['Product 1', 100]]})
+
+    def test_my_selected_products(self):
+        another_user = User.objects.create_user(
+            email='otheruser@example.com', password='testpass123', name='Another User', tc=True
+        )
+        Product.objects.create(name="Product 2", description="Taken", price=5.00, selected_by=another_user)
+        self.product.selected_by = self.user
+        self.product.save()
+
+        response = self.client.get(reverse('product-selected'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 1)
+        self.assertEqual(response.data['results'][0]['id'], self.product.id)
+
+
+class ProductDetailTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email='testuser@example.com', password='testpass123', name='Test User', tc=True)
+        self.client.force_authenticate(user=self.user)
+        self.product = Product.objects.create(name="Lamp", description="Desk lamp", price=10.00, available_stock=5)
+        self.url = reverse('product-detail', args=[self.product.id])
+
+    def test_get_returns_version_as_etag(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['version'], 1)
+        self.assertEqual(response['ETag'], '"1"')
+
+    def test_patch_writes_only_changed_columns(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.patch(self.url, {'name': 'Lamp XL', 'price': '10.00'}, HTTP_IF_MATCH='"1"')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['ETag'], '"2"')
+        update = next(query['sql'] for query in queries.captured_queries if query['sql'].startswith('UPDATE'))
+        self.assertIn('"name"', update)
+        self.assertNotIn('"price"', update)
+        self.assertNotIn('"description"', update)
+
+        self.product.refresh_from_db()
+        self.assertEqual((self.product.name, self.product.version), ('Lamp XL', 2))
+        event = ProductEvent.objects.filter(product_id=self.product.id).latest('id')
+        self.assertEqual((event.kind, event.data['name']), (ProductEvent.UPDATED, 'Lamp XL'))
+
+    def test_stale_writes_are_rejected(self):
+        self.client.patch(self.url, {'available_stock': 4}, HTTP_IF_MATCH='W/"1"')
+
+        response = self.client.patch(self.url, {'available_stock': 3}, HTTP_IF_MATCH='"1"')
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.assertEqual(response.data['version'], 2)
+        response = self.client.patch(self.url, {'available_stock': 3, 'version': 1})
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        response = self.client.patch(self.url, {'available_stock': 3})
+        self.assertEqual(response.status_code, status.HTTP_428_PRECONDITION_REQUIRED)
+        response = self.client.delete(self.url, HTTP_IF_MATCH='"1"')
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.available_stock, 4)
+
+    def test_concurrent_writers_cannot_both_win(self):
+        first, second = Product.objects.get(id=self.product.id), Product.objects.get(id=self.product.id)
+        self.assertTrue(first.update_if_version({'available_stock': 4}, first.version))
+        self.assertFalse(second.update_if_version({'name': 'Other'}, second.version))
+        self.assertEqual(Product.objects.get(id=self.product.id).name, 'Lamp')
+
+    def test_only_editable_fields_can_be_patched(self):
+        response = self.client.patch(self.url, {'selected_by': self.user.id}, HTTP_IF_MATCH='"1"')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('selected_by', response.data['error'])
+
+    def test_delete(self):
+        response = self.client.delete(self.url, {'version': 1})
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Product.objects.filter(id=self.product.id).exists())
+        self.assertTrue(ProductEvent.objects.filter(product_id=self.product.id, kind=ProductEvent.DELETED).exists())
+        self.assertEqual(self.client.delete(self.url, {'version': 1}).status_code, status.HTTP_404_NOT_FOUND)
+
+
+@override_settings(DATABASE_REPLICAS=['replica_1', 'replica_2'], REPLICA_RETRY_SECONDS=30)
+class ReplicaRouterTests(SimpleTestCase):
+    def setUp(self):
+        self.router = ReplicaRouter()
+        self.connections = {'replica_1': mock.Mock(), 'replica_2': mock.Mock()}
+        patcher = mock.patch('authAPI.routers.connections', self.connections)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_product_reads_go_to_replicas(self):
+        self.assertIn(self.router.db_for_read(Product), ['replica_1', 'replica_2'])
+        self.assertEqual(self.router.db_for_write(Product), 'default')
+
+    def test_other_apps_read_from_primary(self):
+        self.assertIsNone(self.router.db_for_read(User))
+
+    def test_pinned_reads_go_to_primary(self):
+        token = pin_primary.set(True)
+        try:
+            self.assertIsNone(self.router.db_for_read(Product))
+        finally:
+            pin_primary.reset(token)
+
+    def test_unavailable_replica_is_skipped(self):
+        self.connections['replica_1'].ensure_connection.side_effect = OperationalError
+        self.assertEqual(self.router.db_for_read(Product), 'replica_2')
+        self.connections['replica_2'].ensure_connection.side_effect = OperationalError
+        self.assertEqual(self.router.db_for_read(Product), 'default')
+        # The failed replica_1 is not retried until its retry window passes
+        self.assertEqual(self.connections['replica_1'].ensure_connection.call_count, 1)
+
+
+# Admin pages link static files, which are not collected for tests
+@override_settings(STORAGES={**settings.STORAGES, 'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'}})
+class ProductAdminTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_superuser(email='admin@example.com', password='testpass123', name='Admin', tc=True)
+        self.client.login(email='admin@example.com', password='testpass123')
+
+    def create_reports(self, count):
+        for i in range(count):
+            product = Product.objects.create(name=f"Product {i}", description="", price=1, selected_by=self.admin)
+            ProductReport.objects.create(product=product, reported_by=self.admin, reason="Defective")
+
+    def changelist_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(queries)
+
+    def test_changelists_do_not_query_per_row(self):
+        for name in ('admin:products_product_changelist', 'admin:products_productreport_changelist'):
+            self.create_reports(2)
+            few = self.changelist_queries(reverse(name))
+            self.create_reports(10)
+            self.assertEqual(self.changelist_queries(reverse(name)), few)
+
+    def test_clear_selection_action(self):
+        self.create_reports(3)
+        response = self.client.post(reverse('admin:products_product_changelist'), {
+            'action': 'clear_selection',
+            '_selected_action': list(Product.objects.values_list('pk', flat=True)),
+        })
+        self.assertEqual(response.status_code, status.HTTP_302_FOUND)
+        self.assertFalse(Product.objects.filter(selected_by__isnull=False).exists())
+
+
+class DashboardRenderingTests(TestCase):
+    def setUp(self):
+        caches['product_rows'].clear()
+        self.user = User.objects.create_user(email='testuser@example.com', password='testpass123', name='Test User', tc=True)
+        self.client.login(email='testuser@example.com', password='testpass123')
+        self.products = [
+            Product.objects.create(name=f"Product {i}", description="", price=i, available_stock=i) for i in range(3)
+        ]
+
+    def render_dashboard(self):
+        with mock.patch('products.rendering.render_row', wraps=rendering.render_row) as render_row:
+            response = self.client.get(reverse('dashboard'))
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            chunks = [chunk.decode() for chunk in response.streaming_content]
+        return chunks, render_row.call_count
+
+    def test_only_changed_rows_are_rendered(self):
+        chunks, rendered = self.render_dashboard()
+        self.assertEqual(rendered, 3)
+        for product in self.products:
+            self.assertIn(f'data-product-id="{product.id}"', ''.join(chunks))
+
+        self.assertEqual(self.render_dashboard()[1], 0)
+
+        self.products[1].available_stock = 42
+        self.products[1].save()
+        chunks, rendered = self.render_dashboard()
+        self.assertEqual(rendered, 1)
+        self.assertIn('<td class="product-stock">42</td>', ''.join(chunks))
+
+    def test_rows_of_a_large_catalog_stay_cached(self):
+        Product.objects.bulk_create(
+            [Product(name=f"Bulk {i}", description="", price=i, available_stock=i) for i in range(400)]
+        )
+        self.assertEqual(self.render_dashboard()[1], 403)
+        self.assertEqual(self.render_dashboard()[1], 0)
+
+    @override_settings(DASHBOARD_STREAM_CHUNK_SIZE=2)
+    def test_head_is_streamed_before_rows(self):
+        head, *rows, tail = self.render_dashboard()[0]
+        self.assertIn('id="search"', head)
+        self.assertNotIn('data-product-id', head)
+        self.assertEqual([row.count('<tr data-product-id') for row in rows], [2, 1])
+        self.assertIn('</html>', tail)
+
+        with self.settings(DASHBOARD_STREAM=False):
+            response = self.client.get(reverse('dashboard'))
+        # CSRF tokens are masked differently on every render
+        normalize = lambda html: re.sub(r'value="\w{64}"', '', re.sub(r"value=\"{{ csrf_token }}\"", '', html))
+        self.assertEqual(normalize(response.content.decode()), normalize(''.join([head, *rows, tail])))
+
+    def test_product_text_cannot_reveal_the_csrf_token(self):
+        self.products[0].description = '__csrf_token__'
+        self.products[0].save()
+        html = ''.join(self.render_dashboard()[0])
+        self.assertIn('<td>__csrf_token__</td>', html)
+
+    def test_pinned_client_streams_rows_from_primary(self):
+        # Unpinned product reads would go to a replica that does not exist here
+        db_for_read = lambda router, model, **hints: None if pin_primary.get() else 'replica_1'
+        self.client.cookies['pin_primary'] = '1'
+        with mock.patch.object(ReplicaRouter, 'db_for_read', db_for_read):
+            chunks, rendered = self.render_dashboard()
+        self.assertEqual(rendered, 3)
+
+    def test_dashboard_polls_changes_under_wsgi(self):
+        html = ''.join(self.render_dashboard()[0])
+        self.assertNotIn('new EventSource', html)
+        self.assertIn(f'let changesCursor = {ProductEvent.objects.latest("id").id};', html)
+
+    def test_api_list_is_not_streamed(self):
+        response = self.client.get(reverse('product-list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.streaming)
+        self.assertIn(f'data-product-id="{self.products[0].id}"', response.content.decode())
+
+    @override_settings(DASHBOARD_STREAM_CHUNK_SIZE=2)
+    async def test_rows_are_fetched_asynchronously_under_asgi(self):
+        await sync_to_async(self.async_client.force_login)(self.user)
+        response = await self.async_client.get(reverse('dashboard'))
+        chunks = [chunk.decode() async for chunk in response.streaming_content]
+        self.assertEqual([chunk.count('<tr data-product-id') for chunk in chunks[1:-1]], [2, 1])
+
+    def test_cached_rows_carry_the_requesting_users_csrf_token(self):
+        self.render_dashboard()
+        self.client = Client(enforce_csrf_checks=True)
+        self.client.login(email='testuser@example.com', password='testpass123')
+        chunks, rendered = self.render_dashboard()
+        self.assertEqual(rendered, 0)
+
+        select_url = reverse('product-select', args=[self.products[0].id])
+        token = re.search(
+            rf'action="{select_url}"[^>]*>\s*<input type="hidden" name="csrfmiddlewaretoken" value="(\w+)"',
+            ''.join(chunks),
+        )[1]
+        response = self.client.post(select_url, {'csrfmiddlewaretoken': token})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+@override_settings(PRODUCT_SEARCH_BACKEND='memory', PRODUCT_READ_MODEL_REFRESH_SECONDS=0)
+class CatalogReadModelTests(APITestCase):
+    def setUp(self):
+        catalog.reset()
+        self.user = User.objects.create_user(email='testuser@example.com', password='testpass123', name='Test User', tc=True)
+        self.client.force_authenticate(user=self.user)
+        names = ['Blue Mug', 'Red mug', 'Green Plate', 'Mug Rack', 'Spoon', 'Blue Plate']
+        self.products = [
+            Product.objects.create(name=name, description=f'About {name}', price=i % 3 + 0.5, available_stock=5 - i % 4)
+            for i, name in enumerate(names)
+        ]
+        self.products[1].selected_by = self.user
+        self.products[1].save()
+
+    def search(self, params, backend='memory'):
+        with self.settings(PRODUCT_SEARCH_BACKEND=backend):
+            response = self.client.get(reverse('product-search') + '?' + params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()
+
+    def assertMatchesDatabase(self):
+        for params in [
+            'query=mug', 'query=MUG&sort_field=price', 'query=plate&sort_field=available_stock&sort_direction=desc',
+            'sort_field=id&sort_direction=desc', 'query=mug&available_only=true', 'query=xyz',
+            'query=e&fields=name,price&layout=columnar', 'sort_field=price&page_size=2&page=2',
+        ]:
+            self.assertEqual(self.search(params), self.search(params, backend='database'), params)
+
+    def test_matches_database_search(self):
+        self.assertMatchesDatabase()
+
+    def test_ties_are_ordered_alike_in_both_directions(self):
+        for i in range(4):
+            Product.objects.create(name=f'Tied {i}', description='', price=7, available_stock=1)
+        for direction in ('asc', 'desc'):
+            params = f'query=tied&sort_field=price&sort_direction={direction}'
+            self.assertEqual(self.search(params), self.search(params, backend='database'), params)
+
+    def test_unpaginated_descriptions_are_read_in_one_query(self):
+        self.search('fields=id')
+        with CaptureQueriesContext(connection) as queries:
+            self.search('fields=id')
+        with self.assertNumQueries(len(queries) + 1):
+            results = self.search('fields=id,description')
+        self.assertEqual(len(results), len(self.products))
+
+    def test_changes_are_applied_incrementally(self):
+        self.search('query=mug')
+        snapshot = catalog.state()[0]
+
+        self.products[0].name = 'Teal Mug'
+        self.products[0].save()
+        self.products[3].delete()
+        Product.objects.create(name='Mug Tree', description='', price=9, available_stock=1)
+        self.assertEqual([p['name'] for p in self.search('query=mug')], ['Mug Tree', 'Red mug', 'Teal Mug'])
+        self.assertIs(catalog.state()[0], snapshot)
+        self.assertMatchesDatabase()
+
+        with self.settings(PRODUCT_READ_MODEL_MAX_DELTA=1, PRODUCT_READ_MODEL_REFRESH_SECONDS=60):
+            catalog.refresh()
+            snapshot, overlay = catalog.state()
+        self.assertEqual(overlay, {})
+        self.assertEqual(len(snapshot), 6)
+        self.assertMatchesDatabase()
+
+    def test_paginates_results(self):
+        data = self.search('query=mug&page_size=2')
+        self.assertEqual(data['count'], 3)
+        self.assertEqual([p['name'] for p in data['results']], ['Blue Mug', 'Mug Rack'])
+        self.assertIn('page=2', data['next'])
+
+
+class ProductReportRetentionTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email='testuser@example.com', password='testpass123', name='Test User', tc=True)
+        self.product = Product.objects.create(name="Product 1", description="", price=1)
+
+    def create_report(self, days_ago):
+        report = ProductReport.objects.create(product=self.product, reported_by=self.user, reason="Defective")
+        ProductReport.objects.filter(pk=report.pk).update(created_at=timezone.now() - timedelta(days=days_ago))
+        return report
+
+    def test_month_arithmetic(self):
+        self.assertEqual(add_months(date(2024, 11, 1), 3), date(2025, 2, 1))
+        self.assertEqual(add_months(date(2024, 1, 1), -1), date(2023, 12, 1))
+        self.assertEqual(partition_name(date(2024, 3, 1)), 'products_productreport_p202403')
+
+    def test_recent_reports(self):
+        recent = self.create_report(days_ago=1)
+        self.create_report(days_ago=40)
+        self.assertEqual(list(ProductReport.objects.recent(7)), [recent])
+
+    def test_retention_removes_expired_reports(self):
+        kept = self.create_report(days_ago=1)
+        self.create_report(days_ago=200)
+
+        out = StringIO()
+        call_command('manage_report_partitions', retention_months=3, stdout=out)
+
+        self.assertEqual(list(ProductReport.objects.all()), [kept])
+        self.assertIn('dropped 0 and deleted 1 expired reports', out.getvalue())
+
+
+@skipUnless(connection.vendor == 'postgresql', 'Report partitioning is PostgreSQL only')
+class ProductReportPartitionTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email='testuser@example.com', password='testpass123', name='Test User', tc=True)
+        self.product = Product.objects.create(name="Product 1", description="", price=1)
+        self.current = partitions.month_start(timezone.now())
+
+    def count_rows(self, table):
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT COUNT(*) FROM {table}')
+            return cursor.fetchone()[0]
+
+    def test_partitions_are_created_ahead_and_dropped_after_retention(self):
+        ahead = partitions.add_months(self.current, 30)
+        created = partitions.ensure_partitions(30)
+        self.assertIn(partition_name(ahead), created)
+        self.assertIn(ahead, partitions.existing_partitions(connection))
+        self.assertEqual(partitions.ensure_partitions(30), [])
+
+        expired = partitions.add_months(self.current, -12)
+        partitions.create_partition(connection, expired)
+        self.assertEqual(partitions.drop_expired_partitions(6), [partition_name(expired)])
+        self.assertNotIn(expired, partitions.existing_partitions(connection))
+
+    def test_late_partition_takes_over_rows_from_the_default_partition(self):
+        late = partitions.add_months(self.current, 40)
+        report = ProductReport.objects.create(product=self.product, reported_by=self.user, reason="Defective")
+        ProductReport.objects.filter(pk=report.pk).update(created_at=datetime(late.year, late.month, 15, tzinfo=dt_timezone.utc))
+        self.assertEqual(self.count_rows(partitions.DEFAULT_PARTITION), 1)
+
+        name = partitions.create_partition(connection, late)
+        self.assertEqual(self.count_rows(name), 1)
+        self.assertEqual(self.count_rows(partitions.DEFAULT_PARTITION), 0)
+        self.assertEqual(partitions.default_partition(connection), partitions.DEFAULT_PARTITION)
+        self.assertEqual(ProductReport.objects.get().pk, report.pk)
+
+
+class ProductChangeFeedTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email='testuser@example.com', password='testpass123', name='Test User', tc=True)
+        self.client.login(email='testuser@example.com', password='testpass123')
+        self.product = Product.objects.create(name="Product 1", description="A test product", price=10.00, available_stock=100)
+
+    def test_changes_since_cursor(self):
+        response = self.client.get(reverse('product-changes'))
+        self.assertEqual([change['kind'] for change in response.data['changes']], ['created'])
+        cursor = response.data['next']
+
+        self.client.post(reverse('product-select', kwargs={'product_id': self.product.id}))
+        response = self.client.get(reverse('product-changes'), {'since': cursor})
+        [change] = response.data['changes']
+        self.assertEqual(change['kind'], 'selected')
+        self.assertEqual(change['data']['selected_by'], self.user.id)
+
+        response = self.client.get(reverse('product-changes'), {'since': response.data['next']})
+        self.assertEqual(response.data['changes'], [])
+
+    def test_stream_changes(self):
+        response = self.client.get(reverse('product-changes'), {'stream': 'true'})
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(len(lines), 1)
+        self.assertIn('"created"', lines[0])
+
+    def test_invalid_parameters(self):
+        for params in ({'wait': 'nan'}, {'wait': 'inf', 'stream': 'true'}, {'limit': 'x'}):
+            self.assertEqual(self.client.get(reverse('product-changes'), params).status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(reverse('product-changes'), {'limit': -1})
+        self.assertEqual(len(response.data['changes']), 1)
+
+    def test_events_after_a_gap_wait_for_it_to_fill(self):
+        second = Product.objects.create(name="Product 2", description="", price=1)
+        Product.objects.create(name="Product 3", description="", price=1)
+        # As if the second event's transaction had not committed yet
+        missing = ProductEvent.objects.get(product_id=second.id).id
+        ProductEvent.objects.filter(id=missing).delete()
+
+        response = self.client.get(reverse('product-changes'))
+        self.assertEqual([change['product_id'] for change in response.data['changes']], [self.product.id])
+        self.assertEqual(response.data['next'], missing - 1)
+
+        with self.settings(PRODUCT_CHANGES_GAP_SECONDS=0):
+            response = self.client.get(reverse('product-changes'), {'since': response.data['next']})
+        self.assertEqual(len(response.data['changes']), 1)
+
+    def test_outbox_relay_holds_events_behind_an_uncommitted_id(self):
+        relay = OutboxRelay(ProductEventBroker())
+        received = []
+        relay.broker.subscribe(received.append)
+        relay.poll()
+        second = Product.objects.create(name="Product 2", description="", price=1)
+        third = Product.objects.create(name="Product 3", description="", price=1)
+        # The second event's transaction commits after the third's
+        missing = ProductEvent.objects.get(product_id=second.id).id
+        ProductEvent.objects.filter(id=missing).delete()
+        relay.poll()
+        self.assertEqual(received, [])
+
+        ProductEvent.objects.create(id=missing, product_id=second.id, kind=ProductEvent.CREATED)
+        relay.poll()
+        self.assertEqual([event['product_id'] for event in received], [second.id, third.id])
+
+    async def test_long_poll_waits_on_the_event_loop_under_asgi(self):
+        await sync_to_async(self.async_client.force_login)(self.user)
+        with mock.patch('products.views.time.sleep') as sleep:
+            response = await self.async_client.get(reverse('product-changes'), {'since': 10 ** 6, 'wait': 0.3})
+            body = b''.join([chunk async for chunk in response.streaming_content])
+        sleep.assert_not_called()
+        self.assertEqual(json.loads(body), {'changes': [], 'next': 10 ** 6})
+
+    def test_compaction_keeps_latest_event_per_product(self):
+        self.product.name = "Product 1b"
+        self.product.save()
+        deleted = Product.objects.create(name="Gone", description="", price=1)
+        deleted.delete()
+        ProductEvent.objects.update(created_at=timezone.now() - timedelta(days=30))
+
+        out = StringIO()
+        call_command('compact_product_events', retention_days=7, stdout=out)
+
+        self.assertEqual(list(ProductEvent.objects.values_list('product_id', 'kind')), [(self.product.id, 'updated')])
+        self.assertIn('Removed 2 superseded events and 1 tombstones', out.getvalue())
+
+
+@override_settings(PRODUCT_EVENTS_BROKER='local')
+class ProductEventStreamTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email='testuser@example.com', password='testpass123', name='Test User', tc=True)
+
+    def test_events_are_published_after_commit(self):
+        received = []
+        broker.subscribe(received.append)
+        self.addCleanup(broker.unsubscribe, received.append)
+        with self.captureOnCommitCallbacks(execute=True):
+            product = Product.objects.create(name="Product 1", description="", price=10.00, available_stock=5)
+            self.assertEqual(received, [])
+        self.assertEqual([(event['product_id'], event['kind']) for event in received], [(product.id, 'created')])
+
+    def test_stream_requires_authentication(self):
+        response = self.client.get(reverse('product-events'))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_stream_replays_missed_events_then_pushes_live_ones(self):
+        missed = Product.objects.create(name="Product 1", description="", price=10.00, available_stock=5)
+        request = RequestFactory().get(reverse('product-events'), HTTP_LAST_EVENT_ID='0')
+        request.user = self.user
+
+        async def read_stream():
+            response = await product_event_stream(request)
+            chunks = response.streaming_content
+            self.assertEqual(response['Content-Type'], 'text/event-stream')
+            first = [await chunks.__anext__(), await chunks.__anext__()]
+            broker.publish({'cursor': 10 ** 9, 'product_id': 42, 'kind': 'selected', 'data': {}})
+            first.append(await chunks.__anext__())
+            await chunks.aclose()
+            return first
+
+        retry, backlog, live = (chunk.decode() for chunk in async_to_sync(read_stream)())
+        self.assertTrue(retry.startswith('retry:'))
+        self.assertIn(f'"product_id": {missed.id}', backlog)
+        self.assertIn('event: selected', live)
+
+    def read_events(self, last_event_id, live_events):
+        request = RequestFactory().get(reverse('product-events'), HTTP_LAST_EVENT_ID=str(last_event_id))
+        request.user = self.user
+
+        async def read_stream():
+            response = await product_event_stream(request)
+            for event in live_events:
+                broker.publish(event)
+            chunks = []
+            async for chunk in response.streaming_content:
+                chunks.append(chunk.decode())
+                if 'event: end' in chunks[-1]:
+                    break
+            await response.streaming_content.aclose()
+            return chunks[1:-1]
+
+        return async_to_sync(read_stream)()
+
+    def test_live_events_are_not_dropped_when_committed_out_of_order(self):
+        replayed = Product.objects.create(name="Product 1", description="", price=10.00, available_stock=5)
+        [event] = ProductEvent.objects.filter(product_id=replayed.id).values_list('id', flat=True)
+        chunks = self.read_events(event - 1, [
+            # The replayed event arriving live again, then one from an older transaction
+            {'cursor': event, 'product_id': replayed.id, 'kind': 'created', 'data': {}},
+            {'cursor': event - 1, 'product_id': 42, 'kind': 'selected', 'data': {}},
+            {'cursor': 0, 'product_id': 0, 'kind': 'end', 'data': {}},
+        ])
+        self.assertEqual([chunk.split('\n')[0] for chunk in chunks], [f'id: {event}', f'id: {event - 1}'])
+
+    @override_settings(PRODUCT_EVENTS_MAX_BACKLOG=2)
+    def test_client_too_far_behind_is_told_to_resync(self):
+        for i in range(3):
+            Product.objects.create(name=f"Product {i}", description="", price=10.00, available_stock=5)
+        chunks = self.read_events(0, [{'cursor': 0, 'product_id': 0, 'kind': 'end', 'data': {}}])
+        self.assertEqual(chunks, ['event: resync\ndata: {}\n\n'])
+
+        # Replayed in pages up to the limit
+        with self.settings(PRODUCT_EVENTS_MAX_BACKLOG=3):
+            self.assertEqual(len(_events_since(0, page_size=2)), 3)
+
+
+class ProductAnalyticsTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_superuser(email='admin@example.com', password='testpass123', name='Admin', tc=True)
+        self.client.login(email='admin@example.com', password='testpass123')
+        self.products = [
+            Product.objects.create(name=f"Product {i}", description="", price=price, available_stock=2)
+            for i, price in enumerate([10, 20, 30, 40])
+        ]
+        self.products[0].selected_by = self.admin
+        self.products[0].save()
+        ProductReport.objects.create(product=self.products[1], reported_by=self.admin, reason="Defective")
+
+    def test_analytics(self):
+        response = self.client.get(reverse('product-analytics'), {'buckets': 3})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data['product_count'], 4)
+        self.assertEqual(data['stock_value'], 200.0)
+        self.assertEqual(data['selection_rate'], 0.25)
+        self.assertEqual(data['reports_per_product'], 0.25)
+        self.assertEqual(data['top_reported'], [{'product_id': self.products[1].id, 'reports': 1}])
+        self.assertEqual(data['price']['percentiles']['0.5'], 20.0)
+        self.assertEqual([bucket['count'] for bucket in data['price']['histogram']], [1, 1, 2])
+
+    def test_analytics_are_cached(self):
+        self.client.get(reverse('product-analytics'))
+        Product.objects.create(name="Product 5", description="", price=50)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('product-analytics'))
+        self.assertEqual(response.data['product_count'], 4)
+        self.assertFalse([q for q in queries if 'products_product' in q['sql']])
+
+    def test_analytics_requires_admin(self):
+        User.objects.create_user(email='testuser@example.com', password='testpass123', name='Test User', tc=True)
+        self.client.login(email='testuser@example.com', password='testpass123')
+        self.assertEqual(self.client.get(reverse('product-analytics')).status_code, status.HTTP_403_FORBIDDEN)
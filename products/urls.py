@@ -1,10 +1,16 @@
 from django.urls import path
-from .views import ProductListView, ProductSearchView, ProductCreateView, ProductSelectView, ProductReportView
+from .views import ProductListView, ProductSearchView, ProductCreateView, ProductDetailView, ProductSelectView, \
+    ProductReportView, MySelectedProductsView, ProductChangesView, ProductAnalyticsView, product_event_stream
 
 urlpatterns = [
     path('', ProductListView.as_view(), name='product-list'),  # List products
     path('search/', ProductSearchView.as_view(), name='product-search'),  # Search products
     path('create/', ProductCreateView.as_view(), name='create-product'),  # Create products
+    path('selected/', MySelectedProductsView.as_view(), name='product-selected'),  # Current user's selections
+    path('changes/', ProductChangesView.as_view(), name='product-changes'),  # Incremental change feed
+    path('events/', product_event_stream, name='product-events'),  # Server-Sent Events stream
+    path('analytics/', ProductAnalyticsView.as_view(), name='product-analytics'),  # Catalog statistics
+    path('<int:product_id>/', ProductDetailView.as_view(), name='product-detail'),  # Read, update or delete product
     path('select/<int:product_id>/', ProductSelectView.as_view(), name='product-select'),  # Select product
     path('report/<int:product_id>/', ProductReportView.as_view(), name='product-report'),  # Report product
 ]
@@ -1,11 +1,44 @@
+import asyncio
+import json
+import math
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import transaction
+from django.http import JsonResponse, StreamingHttpResponse
 from django.shortcuts import render, redirect, get_object_or_404
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
-from .models import Product, ProductReport
+from rest_framework.exceptions import AuthenticationFailed
+from .models import Product, ProductEvent, ProductReport
 from .serializers import ProductSerializer
+from .pagination import ProductPagination
+from .broker import broker, serialize_event
+from .analytics import catalog_analytics
+from .rendering import dashboard_response, is_asgi
+from . import read_model
 from django.core.exceptions import ObjectDoesNotExist
+from account.authentication import JWTAuthentication
+from authAPI.metrics import PRODUCT_REPORTS, PRODUCT_SELECTED, PRODUCT_SELECTION_CONFLICTS
+
+
+def dashboard_context(request):
+    """
+    Returns the template context of `dashboard.html` besides the product rows.
+
+    Live updates use the Server-Sent Events stream under ASGI. Under WSGI a held-open
+    stream would tie up a worker thread, so the page polls the change feed from the
+    latest event instead.
+    """
+    return {
+        'user_email': request.user.email,
+        'event_stream': is_asgi(request),
+        'changes_cursor': ProductEvent.objects.order_by('-id').values_list('id', flat=True).first() or 0,
+    }
+
 
 class DashboardView(APIView):
     """
@@ -23,8 +56,8 @@ class DashboardView(APIView):
         Returns:
         - Rendered dashboard.html template with product data.
         """
-        products = Product.objects.all()
-        return render(request, 'dashboard.html', {'products': products, 'user_email': request.user.email})
+        products = Product.objects.order_by('id')
+        return dashboard_response(request, products, dashboard_context(request))
 
 
 class ProductCreateView(APIView):
@@ -57,10 +90,141 @@ class ProductCreateView(APIView):
         """
         serializer = ProductSerializer(data=request.data)
         if serializer.is_valid():
-            serializer.save()
+            with transaction.atomic():  # Product row and its outbox event commit together
+                serializer.save()
             return redirect('dashboard')
         return render(request, 'create_product.html', {'form_errors': serializer.errors})
 
+class ProductDetailView(APIView):
+    """
+    Reads, partially updates and deletes a single product with optimistic concurrency.
+
+    Every write carries the version it is based on, either as `If-Match` (the `ETag`
+    of a previous GET or write) or as a `version` field in the body. A write based on
+    an outdated version fails with 412 (`If-Match`) or 409 (`version`) and the current
+    version, instead of silently overwriting a change its client has not seen.
+    """
+    permission_classes = [IsAuthenticated]
+    EDITABLE_FIELDS = ('name', 'description', 'price', 'available_stock')
+
+    def get(self, request, product_id, format=None):
+        """
+        Returns the product with its version as `ETag`.
+
+        Args:
+        - request: The HTTP request object.
+        - product_id: The ID of the product.
+
+        Returns:
+        - JSON response with the product, or 404 if it does not exist.
+        """
+        product = get_object_or_404(Product, id=product_id)
+        return self.product_response(product)
+
+    def patch(self, request, product_id, format=None):
+        """
+        Updates the given fields of the product, writing only the columns that changed.
+
+        Args:
+        - request: The HTTP request object with the fields to change, and `If-Match` or `version`.
+        - product_id: The ID of the product.
+
+        Returns:
+        - JSON response with the updated product and its new `ETag`, 400 for invalid data,
+          409/412 for an outdated version or 428 when no version was given.
+        """
+        product = get_object_or_404(Product, id=product_id)
+        precondition = self.precondition(request)
+        if isinstance(precondition, Response):
+            return precondition
+        version, stale_status = precondition
+        if version != product.version:
+            return self.stale_response(product.version, stale_status)
+
+        unknown = set(request.data) - set(self.EDITABLE_FIELDS) - {'version'}
+        if unknown:
+            return Response(
+                {'error': f"Fields cannot be changed: {', '.join(sorted(unknown))}"}, status=status.HTTP_400_BAD_REQUEST,
+            )
+        serializer = ProductSerializer(product, data=request.data, partial=True)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        changes = {
+            field: value for field, value in serializer.validated_data.items() if getattr(product, field) != value
+        }
+        if changes:
+            with transaction.atomic():  # Product row and its outbox event commit together
+                updated = product.update_if_version(changes, version)
+            if not updated:
+                current = Product.objects.filter(id=product_id).values_list('version', flat=True).first()
+                return self.stale_response(current, stale_status)
+        return self.product_response(product)
+
+    def delete(self, request, product_id, format=None):
+        """
+        Deletes the product if it is still at the version given.
+
+        Args:
+        - request: The HTTP request object with `If-Match` or `version`.
+        - product_id: The ID of the product.
+
+        Returns:
+        - 204 when deleted, 404 if it does not exist, 409/412 for an outdated version or
+          428 when no version was given.
+        """
+        product = get_object_or_404(Product, id=product_id)
+        precondition = self.precondition(request)
+        if isinstance(precondition, Response):
+            return precondition
+        version, stale_status = precondition
+        with transaction.atomic():
+            # Locks the row so that no write lands between the version check and the delete
+            product = Product.objects.select_for_update().filter(id=product_id).first()
+            if product is None:
+                return Response({'error': 'Product not found.'}, status=status.HTTP_404_NOT_FOUND)
+            if product.version != version:
+                return self.stale_response(product.version, stale_status)
+            product.delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    def precondition(self, request):
+        """
+        Returns the version the client's write is based on and the status for a stale one.
+
+        Returns:
+        - (version, 412 or 409), or an error response when no usable version was sent.
+        """
+        if_match = request.headers.get('If-Match')
+        if if_match:
+            # Weak tags are accepted: CompressionMiddleware weakens the ETags of compressed responses
+            tag = if_match.split(',')[0].strip().removeprefix('W/').strip('"')
+            if tag.isdigit():
+                return int(tag), status.HTTP_412_PRECONDITION_FAILED
+            return Response({'error': 'If-Match must be an ETag returned by this endpoint.'},
+                            status=status.HTTP_400_BAD_REQUEST)
+        version = request.data.get('version')
+        if version is None:
+            return Response({'error': 'Send If-Match or the version being changed.'},
+                            status=status.HTTP_428_PRECONDITION_REQUIRED)
+        try:
+            return int(version), status.HTTP_409_CONFLICT
+        except (TypeError, ValueError):
+            return Response({'error': 'version must be a number.'}, status=status.HTTP_400_BAD_REQUEST)
+
+    @staticmethod
+    def stale_response(current_version, stale_status):
+        if current_version is None:
+            return Response({'error': 'Product not found.'}, status=status.HTTP_404_NOT_FOUND)
+        return Response(
+            {'error': 'Product was changed by someone else; reload it and retry.', 'version': current_version},
+            status=stale_status, headers={'ETag': f'"{current_version}"'},
+        )
+
+    @staticmethod
+    def product_response(product):
+        return Response(ProductSerializer(product).data, status=status.HTTP_200_OK, headers={'ETag': f'"{product.version}"'})
+
+
 class ProductListView(APIView):
     """
     Lists all products for authenticated users.
@@ -75,37 +239,105 @@ class ProductListView(APIView):
         Returns:
         - Rendered dashboard.html template with product data.
         """
-        products = Product.objects.all()
-        return render(request, 'dashboard.html', {'products': products, 'user_email': request.user.email})
+        products = Product.objects.order_by('id')
+        # Not streamed: API clients, batch sub-requests included, expect a complete body
+        return dashboard_response(request, products, dashboard_context(request), stream=False)
 
 
 
 class ProductSearchView(APIView):
     """
     Provides search functionality for products with sorting options.
+
+    `fields` narrows the columns that are selected and returned (see `SEARCH_FIELDS`),
+    and `layout=columnar` returns `{"columns": [...], "rows": [[...], ...]}` so that
+    large result sets carry each column name once instead of once per row. Passing
+    `page` or `page_size` paginates the results.
+
+    With `PRODUCT_SEARCH_BACKEND = 'memory'` searches run against the process-local
+    read model (see `products.read_model`) instead of the database.
     """
     permission_classes = [IsAuthenticated]
+    SEARCH_FIELDS = ('id', 'name', 'description', 'price', 'available_stock')
 
     def get(self, request, format=None):
         """
         Handles product search based on a query and sorts by specified fields.
 
         Args:
-        - request: The HTTP request object with search and sorting data.
+        - request: The HTTP request object with search, sorting, `fields` and `layout` data.
 
         Returns:
-        - JSON response with filtered and sorted product data.
+        - JSON response with filtered and sorted product data, or 400 for unknown fields.
         """
         search_query = request.GET.get('query', '')
         sort_field = request.GET.get('sort_field', 'name')
         sort_direction = request.GET.get('sort_direction', 'asc')
+        available_only = request.GET.get('available_only', '').lower() in ('1', 'true', 'yes')
+        columnar = request.GET.get('layout') == 'columnar'
+
+        fields = self.SEARCH_FIELDS
+        if request.GET.get('fields'):
+            fields = tuple(dict.fromkeys(field.strip() for field in request.GET['fields'].split(',') if field.strip()))
+            unknown = [field for field in fields if field not in self.SEARCH_FIELDS]
+            if unknown or not fields:
+                return Response(
+                    {'error': f"Unknown fields: {', '.join(unknown)}. Allowed: {', '.join(self.SEARCH_FIELDS)}"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+        if settings.PRODUCT_SEARCH_BACKEND == 'memory' and sort_field in read_model.SORT_FIELDS:
+            products = read_model.catalog.search(
+                search_query, sort_field, descending=sort_direction == 'desc', available_only=available_only,
+                fields=fields, named=not columnar,
+            )
+        else:
+            products = Product.objects.filter(name__icontains=search_query)
+            if available_only:
+                # Matches the partial index on unselected products.
+                products = products.filter(selected_by__isnull=True)
+            # Ties are ordered by id in the same direction, like the memory backend
+            if sort_direction == 'desc':
+                products = products.order_by(f'-{sort_field}', '-id')
+            else:
+                products = products.order_by(sort_field, 'id')
+            products = products.values_list(*fields) if columnar else products.values(*fields)
+
+        paginator = None
+        if 'page' in request.GET or 'page_size' in request.GET:
+            paginator = ProductPagination()
+            products = paginator.paginate_queryset(products, request, view=self)
+        if columnar:
+            data = {'columns': list(fields), 'rows': [list(row) for row in products]}
+        else:
+            data = list(products)
+        if paginator:
+            return paginator.get_paginated_response(data)
+        return Response(data, status=status.HTTP_200_OK)
 
-        if sort_direction == 'desc':
-            sort_field = f'-{sort_field}'
 
-        products = Product.objects.filter(name__icontains=search_query).order_by(sort_field)
-        data = list(products.values('id', 'name', 'description', 'price', 'available_stock'))
-        return Response(data, status=status.HTTP_200_OK)
+class MySelectedProductsView(APIView):
+    """
+    Lists the products currently selected by the authenticated user.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, format=None):
+        """
+        Returns a paginated list of the user's selected products.
+
+        Args:
+        - request: The HTTP request object, optionally with `page` and `page_size`.
+
+        Returns:
+        - Paginated JSON response with the selected products.
+        """
+        products = request.user.selected_products.order_by('id').values(
+            'id', 'name', 'description', 'price', 'available_stock'
+        )
+        paginator = ProductPagination()
+        page = paginator.paginate_queryset(products, request, view=self)
+        return paginator.get_paginated_response(page)
 
 # Mark a product as selected by the user
 class ProductSelectView(APIView):
@@ -127,11 +359,18 @@ class ProductSelectView(APIView):
         """
         product = get_object_or_404(Product, id=product_id)
 
-        if product.selected_by and product.selected_by != request.user:
+        if product.selected_by_id and product.selected_by_id != request.user.id:
+            PRODUCT_SELECTION_CONFLICTS.inc()
             return Response({'error': 'Product already selected by another user.'}, status=status.HTTP_400_BAD_REQUEST)
 
-        product.selected_by = request.user
-        product.save()
+        with transaction.atomic():  # Product row and its outbox event commit together
+            # Conditional on the version read above, so two users cannot both select it
+            selected = product.update_if_version({'selected_by': request.user}, product.version, ProductEvent.SELECTED)
+        if not selected:
+            PRODUCT_SELECTION_CONFLICTS.inc()
+            return Response({'error': 'Product was changed by someone else; reload it and retry.'},
+                            status=status.HTTP_409_CONFLICT)
+        PRODUCT_SELECTED.inc()
         return Response({'status': 'Product selected successfully'}, status=status.HTTP_200_OK)
 
 class ProductReportView(APIView):
@@ -154,4 +393,229 @@ class ProductReportView(APIView):
         product = get_object_or_404(Product, id=product_id)
         reason = request.data.get('reason')
         ProductReport.objects.create(product=product, reported_by=request.user, reason=reason)
+        PRODUCT_REPORTS.inc()
         return redirect('dashboard')
+
+
+class ProductChangesView(APIView):
+    """
+    Incremental feed of product changes for downstream mirrors.
+
+    Clients pass the `next` cursor of their previous call as `since` and receive only
+    the changes recorded after it. Events behind an id that may still commit are held back
+    (see `ProductEvent.committed_after`).
+
+    Under ASGI, long-polls and streams wait on the event loop; under WSGI each one holds
+    a worker thread while it waits.
+    """
+    permission_classes = [IsAuthenticated]
+    poll_interval = 0.25
+
+    def get(self, request, format=None):
+        """
+        Returns the changes after a cursor, optionally waiting for new ones.
+
+        Args:
+        - request: The HTTP request object with `since` (cursor, default 0), `limit`,
+          `wait` (seconds to long-poll when nothing changed) and `stream` (emit NDJSON
+          batches as they arrive for `wait` seconds).
+
+        Returns:
+        - JSON response with `changes` and the `next` cursor, or a streaming NDJSON response.
+        """
+        try:
+            since = int(request.GET.get('since', 0))
+            limit = max(1, min(int(request.GET.get('limit', 500)), settings.PRODUCT_CHANGES_MAX_LIMIT))
+            wait = float(request.GET.get('wait', 0))
+        except ValueError:
+            return Response({'error': 'since, limit and wait must be numbers.'}, status=status.HTTP_400_BAD_REQUEST)
+        if not math.isfinite(wait):
+            return Response({'error': 'wait must be a finite number.'}, status=status.HTTP_400_BAD_REQUEST)
+        wait = min(max(wait, 0), settings.PRODUCT_CHANGES_MAX_WAIT)
+
+        if request.GET.get('stream', '').lower() in ('1', 'true', 'yes'):
+            content = self.astream(since, limit, wait) if is_asgi(request) else self.stream(since, limit, wait)
+            response = StreamingHttpResponse(content, content_type='application/x-ndjson')
+            response['Cache-Control'] = 'no-cache'
+            return response
+        if wait and is_asgi(request):
+            response = StreamingHttpResponse(self.apoll(since, limit, wait), content_type='application/json')
+            response['Cache-Control'] = 'no-cache'
+            return response
+
+        deadline = time.monotonic() + wait
+        changes = self.fetch(since, limit)
+        while not changes and time.monotonic() < deadline:
+            time.sleep(self.poll_interval)
+            changes = self.fetch(since, limit)
+        return Response(self.page(since, changes), status=status.HTTP_200_OK)
+
+    def fetch(self, since, limit):
+        return [
+            {'cursor': event.id, 'product_id': event.product_id, 'kind': event.kind,
+             'data': event.data, 'created_at': event.created_at.isoformat()}
+            for event in ProductEvent.committed_after(since, limit)
+        ]
+
+    @staticmethod
+    def page(since, changes):
+        return {'changes': changes, 'next': changes[-1]['cursor'] if changes else since}
+
+    def stream(self, since, limit, wait):
+        deadline = time.monotonic() + wait
+        while True:
+            changes = self.fetch(since, limit)
+            if changes:
+                since = changes[-1]['cursor']
+                yield json.dumps(self.page(since, changes)) + '\n'
+            elif time.monotonic() >= deadline:
+                return
+            else:
+                time.sleep(self.poll_interval)
+
+    async def astream(self, since, limit, wait):
+        deadline = time.monotonic() + wait
+        while True:
+            changes = await sync_to_async(self.fetch)(since, limit)
+            if changes:
+                since = changes[-1]['cursor']
+                yield json.dumps(self.page(since, changes)) + '\n'
+            elif time.monotonic() >= deadline:
+                return
+            else:
+                await asyncio.sleep(self.poll_interval)
+
+    async def apoll(self, since, limit, wait):
+        # A long-poll sent as one streamed document, so the wait does not hold the thread running sync views
+        deadline = time.monotonic() + wait
+        changes = await sync_to_async(self.fetch)(since, limit)
+        while not changes and time.monotonic() < deadline:
+            await asyncio.sleep(self.poll_interval)
+            changes = await sync_to_async(self.fetch)(since, limit)
+        yield json.dumps(self.page(since, changes))
+
+
+class ProductAnalyticsView(APIView):
+    """
+    Summary statistics over the whole catalog for administrators.
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, format=None):
+        """
+        Returns price distribution, stock value, selection and report rates.
+
+        Args:
+        - request: The HTTP request object, optionally with `buckets` (histogram size, 1-100).
+
+        Returns:
+        - JSON response with the (cached) catalog statistics.
+        """
+        try:
+            buckets = int(request.GET.get('buckets', 10))
+        except ValueError:
+            buckets = 0
+        if not 1 <= buckets <= 100:
+            return Response({'error': 'buckets must be between 1 and 100.'}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(catalog_analytics(buckets), status=status.HTTP_200_OK)
+
+
+def _stream_user(request):
+    """
+    Resolves the user of an event stream from the session or a Bearer token.
+    """
+    if request.user.is_authenticated:
+        return request.user
+    try:
+        result = JWTAuthentication().authenticate(request)
+    except AuthenticationFailed:
+        return None
+    return result[0] if result else None
+
+
+def _events_since(cursor, page_size=500):
+    """
+    Returns the events after `cursor`, or None when more than `PRODUCT_EVENTS_MAX_BACKLOG` are pending.
+    """
+    events = []
+    while True:
+        page = [serialize_event(event) for event in ProductEvent.objects.filter(id__gt=cursor).order_by('id')[:page_size]]
+        events.extend(page)
+        if len(events) > settings.PRODUCT_EVENTS_MAX_BACKLOG:
+            return None
+        if len(page) < page_size:
+            return events
+        cursor = page[-1]['cursor']
+
+
+def _offer(queue, event):
+    # A slow client loses its oldest pending events rather than growing without bound
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(event)
+
+
+def _format_sse(event):
+    return f"id: {event['cursor']}\nevent: {event['kind']}\ndata: {json.dumps(event)}\n\n"
+
+
+async def _sse_stream(queue, backlog, callback):
+    # The backlog is read after subscribing, so its events may also arrive live. Events are
+    # not deduplicated by cursor order: transactions commit out of id order.
+    replayed = {event['cursor'] for event in backlog or ()}
+    try:
+        yield 'retry: 3000\n\n'
+        if backlog is None:
+            # Too far behind to replay: the client reloads its state instead
+            yield 'event: resync\ndata: {}\n\n'
+        for event in backlog or ():
+            yield _format_sse(event)
+        while True:
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout=settings.PRODUCT_EVENTS_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                yield ': keepalive\n\n'
+                continue
+            if event['cursor'] in replayed:
+                replayed.discard(event['cursor'])
+                continue
+            yield _format_sse(event)
+    finally:
+        broker.unsubscribe(callback)
+
+
+async def product_event_stream(request):
+    """
+    Pushes product changes (selection, stock, create, delete) as Server-Sent Events.
+
+    Served by the ASGI application; each connection holds an asyncio queue fed by the
+    in-process broker. Reconnecting clients send `Last-Event-ID` (or `?since=`) and
+    first receive the outbox events they missed, or a `resync` event when more than
+    `PRODUCT_EVENTS_MAX_BACKLOG` were missed. Under WSGI the dashboard polls
+    `ProductChangesView` instead.
+
+    Args:
+    - request: The HTTP request object, authenticated by session or Bearer token.
+
+    Returns:
+    - A `text/event-stream` streaming response, or 401 if not authenticated.
+    """
+    user = await sync_to_async(_stream_user)(request)
+    if user is None:
+        return JsonResponse({'detail': 'Authentication credentials were not provided.'}, status=401)
+
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(maxsize=settings.PRODUCT_EVENTS_QUEUE_SIZE)
+
+    def deliver(event):
+        loop.call_soon_threadsafe(_offer, queue, event)
+
+    # Subscribe before reading the backlog so nothing committed in between is missed
+    broker.subscribe(deliver)
+    cursor = request.headers.get('Last-Event-ID') or request.GET.get('since')
+    backlog = await sync_to_async(_events_since)(int(cursor)) if cursor and cursor.isdigit() else []
+
+    response = StreamingHttpResponse(_sse_stream(queue, backlog, deliver), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response